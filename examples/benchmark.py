@@ -1,7 +1,10 @@
 """
 pyqgc Performance benchmarking utility
 
-Usage (kwargs optional): python3 benchmark.py cycles=10000
+Usage (kwargs optional): python3 benchmark.py cycles=10000 parsing=1
+
+Set parsing=0 to benchmark QGCReader's stream framing engine in
+isolation (messages are framed but not decoded).
 
 Created on 19 May 2025
 
@@ -86,12 +89,14 @@ def benchmark(**kwargs) -> float:
     pyrtcm Performance benchmark test.
 
     :param int cycles: (kwarg) number of test cycles (10,000)
+    :param int parsing: (kwarg) 1 = frame and parse, 0 = frame only (1)
     :returns: benchmark as transactions/second
     :rtype: float
     :raises: SBFStreamError
     """
 
     cyc = int(kwargs.get("cycles", 5000))
+    parsing = bool(int(kwargs.get("parsing", 1)))
     txnc = len(QGCMESSAGES)
     txnt = txnc * cyc
 
@@ -101,6 +106,7 @@ def benchmark(**kwargs) -> float:
         f"\npysbf2 version: {qgcver}",
         f"\nTest cycles: {cyc:,}",
         f"\nTxn per cycle: {txnc:,}",
+        f"\nMode: {'frame and parse' if parsing else 'frame only'}",
     )
 
     start = process_time_ns()
@@ -108,7 +114,7 @@ def benchmark(**kwargs) -> float:
     for i in range(cyc):
         progbar(i, cyc)
         stream = BytesIO(QGCBYTES)
-        sbr = QGCReader(stream, parsing=True)
+        sbr = QGCReader(stream, parsing=parsing)
         for _, _ in sbr:
             pass
     end = process_time_ns()
@@ -0,0 +1,485 @@
+"""
+pyqgc Performance benchmark suite
+
+Usage (kwargs optional): python3 benchsuite.py number=2000 repeat=5 output=bench.json
+    baseline=prev.json select=decode,frame
+
+Runs a suite of micro-benchmarks against the sample logs in the tests
+folder and writes the results as JSON, so they can be compared across
+releases:
+
+- decode - QGCReader.parse() of a single raw message, per identity
+- checksum - calc_checksum() of a single raw message, per identity
+- construct - QGCMessage construction from keyword attributes, per SET/POLL identity
+- serialize - QGCMessage.serialize(), per SET/POLL identity
+- frame - QGCReader stream framing only (parsing=False), per sample stream
+- parse - QGCReader stream framing and parsing, per sample stream
+- memory - memory retained per parsed message (tracemalloc), per identity
+- startup - import time (python -X importtime) of a fresh interpreter
+  running each STARTUP scenario, and which heavy dependencies it loaded
+
+Each timing is the best of 'repeat' runs of 'number' iterations, as
+reported by timeit (garbage collection is disabled while timing).
+If a 'baseline' JSON file from a previous run is given, the ratio of each
+result to its baseline is printed (for timings, >1 is slower).
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=line-too-long
+
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from io import BytesIO
+from platform import python_version
+from platform import version as osver
+from sys import argv
+from timeit import Timer
+
+from pyqgc._version import __version__ as qgcver
+from pyqgc.qgchelpers import calc_checksum
+from pyqgc.qgcmessage import QGCMessage
+from pyqgc.qgcreader import QGCReader
+from pyqgc.qgctypes_core import GET, POLL, QGC_PROTOCOL, SET
+
+DATADIR = os.path.join(os.path.dirname(__file__), "..", "tests")
+
+MESSAGELOGS = (
+    ("pygpsdata_lg580p_qgc_get.log", GET),
+    ("pygpsdata_lg580p_qgc.log", GET),
+    ("pygpsdata_lu600_qgc_get.log", GET),
+    ("pygpsdata_lu600_qgc_set.log", SET),
+    ("pygpsdata_lu600_qgc_poll.log", POLL),
+)
+"""Sample logs of individual QGC message types, with message mode"""
+
+STREAMS = {
+    "qgc_nav": ("pygpsdata_lg580p_qgc_get.log",),
+    "qgc_raw": ("pygpsdata_lg580p_qgc.log",),
+    "qgc_ack_cfg": ("pygpsdata_lu600_qgc_get.log",),
+    "nmea": ("pygpsdata_nmea.log",),
+    "mixed_qgc_nmea": ("pygpsdata_mixed.log",),
+    "mixed_nmea_rtcm3": ("pygpsdata_mixed_rtcm3.log",),
+    "mixed_all": (
+        "pygpsdata_lg580p_qgc_get.log",
+        "pygpsdata_mixed.log",
+        "pygpsdata_mixed_rtcm3.log",
+    ),
+}
+"""Sample GET mode streams, as concatenation of sample logs"""
+
+STARTUP = {
+    "import": "import pyqgc",
+    "read_qgc": (
+        "import pyqgc; from io import BytesIO; "
+        "list(pyqgc.QGCReader(BytesIO(open({log!r}, 'rb').read())))"
+    ),
+    "read_mixed": (
+        "import pyqgc; from io import BytesIO; "
+        "list(pyqgc.QGCReader(BytesIO(open({mixed!r}, 'rb').read())))"
+    ),
+}
+"""Startup scenarios, as python -c statements"""
+
+HEAVY = ("numpy", "pandas", "pynmeagps", "pyrtcm", "concurrent.futures.process")
+"""Dependencies reported as loaded or deferred by startup benchmarks"""
+
+BENCHMARKS = (
+    "decode",
+    "checksum",
+    "construct",
+    "serialize",
+    "frame",
+    "parse",
+    "memory",
+    "startup",
+)
+"""Benchmark categories, in run order"""
+
+MODES = {GET: "GET", SET: "SET", POLL: "POLL"}
+
+
+def readlog(name: str) -> bytes:
+    """
+    Read sample log file.
+
+    :param str name: log file name
+    :return: log file contents
+    :rtype: bytes
+    """
+
+    with open(os.path.join(DATADIR, name), "rb") as stream:
+        return stream.read()
+
+
+def load_messages() -> dict:
+    """
+    Load first raw message of each QGC message type in sample logs.
+
+    :return: dict of (raw message, msgmode, parsed message), keyed on
+        '<identity>' for GET messages or '<identity>/<mode>' otherwise
+    :rtype: dict
+    """
+
+    msgs = {}
+    for name, msgmode in MESSAGELOGS:
+        qgr = QGCReader(
+            BytesIO(readlog(name)), msgmode=msgmode, protfilter=QGC_PROTOCOL
+        )
+        for raw, parsed in qgr:
+            key = parsed.identity
+            if msgmode != GET:
+                key += f"/{MODES[msgmode]}"
+            msgs.setdefault(key, (raw, msgmode, parsed))
+    return msgs
+
+
+def timed(func, number: int, repeat: int, count: int = 1) -> dict:
+    """
+    Time function call.
+
+    :param func: function to time
+    :param int number: number of calls per run
+    :param int repeat: number of runs (best is reported)
+    :param int count: number of messages processed per call (1)
+    :return: dict of nanoseconds per message and messages per second
+    :rtype: dict
+    """
+
+    best = min(Timer(func).repeat(repeat, number))
+    nspm = best * 1e9 / number / count
+    return {"ns_per_msg": round(nspm, 1), "msgs_per_sec": round(1e9 / nspm, 1)}
+
+
+def bench_decode(msgs: dict, number: int, repeat: int) -> dict:
+    """
+    Benchmark QGCReader.parse() per message type.
+
+    :param dict msgs: sample messages from load_messages()
+    :param int number: number of calls per run
+    :param int repeat: number of runs
+    :return: results keyed on message type
+    :rtype: dict
+    """
+
+    return {
+        key: timed(lambda r=raw, m=msgmode: QGCReader.parse(r, m), number, repeat)
+        for key, (raw, msgmode, _) in msgs.items()
+    }
+
+
+def bench_checksum(msgs: dict, number: int, repeat: int) -> dict:
+    """
+    Benchmark calc_checksum() per message type.
+
+    :param dict msgs: sample messages from load_messages()
+    :param int number: number of calls per run
+    :param int repeat: number of runs
+    :return: results keyed on message type, including message length
+    :rtype: dict
+    """
+
+    results = {}
+    for key, (raw, _, _) in msgs.items():
+        res = timed(lambda r=raw[2:-2]: calc_checksum(r), number, repeat)
+        res["bytes"] = len(raw)
+        results[key] = res
+    return results
+
+
+def _settable(msgs: dict) -> dict:
+    """
+    Get keyword attributes of SET and POLL sample messages which
+    reconstruct the original message (attributes of alternate payload
+    definitions cannot be distinguished by keyword alone).
+
+    :param dict msgs: sample messages from load_messages()
+    :return: dict of (msggrp, msgid, msgmode, keyword attributes),
+        keyed on message type
+    :rtype: dict
+    """
+
+    cons = {}
+    for key, (raw, msgmode, parsed) in msgs.items():
+        if msgmode == GET:
+            continue
+        # pylint: disable=protected-access
+        kwargs = dict(parsed._attributes())
+        args = (parsed.msg_grp, parsed.msg_id, msgmode, kwargs)
+        if QGCMessage(args[0], args[1], msgmode=msgmode, **kwargs).serialize() == raw:
+            cons[key] = args
+    return cons
+
+
+def bench_construct(msgs: dict, number: int, repeat: int) -> dict:
+    """
+    Benchmark QGCMessage construction from keyword attributes
+    per SET/POLL message type.
+
+    :param dict msgs: sample messages from load_messages()
+    :param int number: number of calls per run
+    :param int repeat: number of runs
+    :return: results keyed on message type
+    :rtype: dict
+    """
+
+    return {
+        key: timed(
+            lambda g=grp, i=mid, m=msgmode, k=kwargs: QGCMessage(g, i, msgmode=m, **k),
+            number,
+            repeat,
+        )
+        for key, (grp, mid, msgmode, kwargs) in _settable(msgs).items()
+    }
+
+
+def bench_serialize(msgs: dict, number: int, repeat: int) -> dict:
+    """
+    Benchmark QGCMessage.serialize() per SET/POLL message type.
+
+    :param dict msgs: sample messages from load_messages()
+    :param int number: number of calls per run
+    :param int repeat: number of runs
+    :return: results keyed on message type
+    :rtype: dict
+    """
+
+    results = {}
+    for key, (grp, mid, msgmode, kwargs) in _settable(msgs).items():
+        msg = QGCMessage(grp, mid, msgmode=msgmode, **kwargs)
+        results[key] = timed(msg.serialize, number, repeat)
+    return results
+
+
+def _bench_stream(parsing: bool, number: int, repeat: int) -> dict:
+    """
+    Benchmark QGCReader stream processing per sample stream.
+
+    :param bool parsing: parse messages Y/N
+    :param int number: number of messages per run (approx)
+    :param int repeat: number of runs
+    :return: results keyed on stream, including kB per second
+    :rtype: dict
+    """
+
+    results = {}
+    for key, names in STREAMS.items():
+        data = b"".join(readlog(name) for name in names)
+
+        def read(d=data):
+            n = 0
+            for _ in QGCReader(BytesIO(d), parsing=parsing, quitonerror=0):
+                n += 1
+            return n
+
+        count = read()
+        res = timed(read, max(1, number // count), repeat, count)
+        res["kb_per_sec"] = round(res["msgs_per_sec"] * len(data) / count / 2**10, 1)
+        res["msgs"] = count
+        results[key] = res
+    return results
+
+
+def bench_frame(_, number: int, repeat: int) -> dict:
+    """
+    Benchmark QGCReader framing only per sample stream.
+
+    :param dict _: sample messages (unused)
+    :param int number: number of messages per run (approx)
+    :param int repeat: number of runs
+    :return: results keyed on stream
+    :rtype: dict
+    """
+
+    return _bench_stream(False, number, repeat)
+
+
+def bench_parse(_, number: int, repeat: int) -> dict:
+    """
+    Benchmark QGCReader framing and parsing per sample stream.
+
+    :param dict _: sample messages (unused)
+    :param int number: number of messages per run (approx)
+    :param int repeat: number of runs
+    :return: results keyed on stream
+    :rtype: dict
+    """
+
+    return _bench_stream(True, number, repeat)
+
+
+def bench_memory(msgs: dict, number: int, _) -> dict:
+    """
+    Measure memory retained per parsed message, per message type.
+
+    :param dict msgs: sample messages from load_messages()
+    :param int number: number of messages parsed
+    :param int _: number of runs (unused)
+    :return: results keyed on message type
+    :rtype: dict
+    """
+
+    results = {}
+    for key, (raw, msgmode, _) in msgs.items():
+        raws = [bytes(raw) for _ in range(number)]  # distinct copies, as read
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        parsed = [QGCReader.parse(r, msgmode) for r in raws]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del parsed
+        results[key] = {"bytes_per_msg": round((size - base) / number, 1)}
+    return results
+
+
+def _importtime(stmt: str) -> tuple:
+    """
+    Run statement in a fresh interpreter with -X importtime.
+
+    :param str stmt: python -c statement
+    :return: tuple of (dict of cumulative import microseconds of each
+        top-level import, set of all modules imported)
+    :rtype: tuple
+    """
+
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    toplevel = {}
+    modules = set()
+    for line in res.stderr.splitlines():
+        _, cumulative, name = (line.split("|") + ["", ""])[0:3]
+        if not cumulative.strip().isdigit():
+            continue  # column headings or other output
+        modules.add(name.strip())
+        if not name.startswith("  "):  # not a nested import
+            toplevel[name.strip()] = int(cumulative)
+    return toplevel, modules
+
+
+def bench_startup(_, __, repeat: int) -> dict:
+    """
+    Benchmark interpreter startup import time per STARTUP scenario,
+    excluding imports made by the bare interpreter.
+
+    :param dict _: sample messages (unused)
+    :param int __: number of calls per run (unused)
+    :param int repeat: number of runs (best is reported)
+    :return: results keyed on scenario
+    :rtype: dict
+    """
+
+    bare, _ = _importtime("pass")
+    paths = {
+        "log": os.path.join(DATADIR, "pygpsdata_lg580p_qgc_get.log"),
+        "mixed": os.path.join(DATADIR, "pygpsdata_mixed.log"),
+    }
+    results = {}
+    for key, stmt in STARTUP.items():
+        best = None
+        for _ in range(repeat):
+            toplevel, modules = _importtime(stmt.format(**paths))
+            usecs = sum(val for name, val in toplevel.items() if name not in bare)
+            best = usecs if best is None else min(best, usecs)
+        results[key] = {
+            "import_us": best,
+            "loaded": [mod for mod in HEAVY if mod in modules],
+        }
+    return results
+
+
+def compare(results: dict, baseline: dict):
+    """
+    Print ratio of each result to baseline result.
+
+    :param dict results: benchmark results
+    :param dict baseline: baseline benchmark results (e.g. previous release)
+    """
+
+    print(
+        f"\nComparison with pyqgc {baseline['environment']['pyqgc']}"
+        f" (Python {baseline['environment']['python']}) - ratio >1 is slower/larger:"
+    )
+    for cat in BENCHMARKS:
+        for key, res in results.get(cat, {}).items():
+            base = baseline.get(cat, {}).get(key)
+            if base is None:
+                continue
+            metric = {"memory": "bytes_per_msg", "startup": "import_us"}.get(
+                cat, "ns_per_msg"
+            )
+            if base.get(metric):
+                print(f"{cat:>10} {key:<24} {res[metric] / base[metric]:6.2f}")
+
+
+def benchmark(**kwargs) -> dict:
+    """
+    pyqgc Performance benchmark suite.
+
+    :param int number: (kwarg) iterations per timing run, or messages per memory measurement (2,000)
+    :param int repeat: (kwarg) timing runs, best is reported (5)
+    :param str output: (kwarg) JSON output file path (None = print JSON to console)
+    :param str baseline: (kwarg) JSON results file to compare against (None)
+    :param str select: (kwarg) comma-separated benchmark categories to run (all)
+    :returns: benchmark results
+    :rtype: dict
+    """
+
+    number = int(kwargs.get("number", 2000))
+    repeat = int(kwargs.get("repeat", 5))
+    select = kwargs.get("select", ",".join(BENCHMARKS)).split(",")
+
+    results = {
+        "environment": {
+            "os": osver(),
+            "python": python_version(),
+            "pyqgc": qgcver,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "settings": {"number": number, "repeat": repeat},
+    }
+    msgs = load_messages()
+    for cat in BENCHMARKS:
+        if cat in select:
+            print(f"Running {cat} benchmarks...")
+            results[cat] = globals()[f"bench_{cat}"](msgs, number, repeat)
+
+    output = kwargs.get("output", None)
+    if output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(output, "w", encoding="utf-8") as outfile:
+            json.dump(results, outfile, indent=2)
+        print(f"Results written to {output}")
+
+    baseline = kwargs.get("baseline", None)
+    if baseline is not None:
+        with open(baseline, "r", encoding="utf-8") as infile:
+            compare(results, json.load(infile))
+
+    return results
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
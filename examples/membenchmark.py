@@ -0,0 +1,152 @@
+"""
+pyqgc Memory benchmarking utility
+
+Usage (kwargs optional): python3 membenchmark.py messages=100000 logfile=pygpsdata_lg580p_qgc_get.log
+
+Uses tracemalloc to measure the memory retained by a list of parsed
+QGC messages, for each combination of the QGCReader 'compact'
+(slotted per-identity classes) and 'lazy' (decode on first access)
+options, relative to the original QGCMessage implementation ('legacy'),
+which held its private state as well as its payload attributes in the
+instance __dict__, and to the current default.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=line-too-long, protected-access, too-few-public-methods
+
+import os
+import tracemalloc
+from itertools import cycle, islice
+from platform import python_version
+from platform import version as osver
+from sys import argv
+
+from pyqgc._version import __version__ as qgcver
+from pyqgc.qgcmessage import QGCMessage
+from pyqgc.qgcreader import QGCReader
+from pyqgc.qgctypes_core import QGC_PROTOCOL
+
+LOGFILE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "pygpsdata_lg580p_qgc_get.log"
+)
+
+LEGACY_STATE = (
+    "_immutable",
+    "_mode",
+    "_length",
+    "_lengthint",
+    "_checksum",
+    "_msggrp",
+    "_msgid",
+    "_parsebf",
+    "_payload",
+    "_offset",
+    "_index",
+    "_suffix",
+)
+"""Private state held in the instance __dict__ of the legacy QGCMessage, in order"""
+
+MODES = {
+    "legacy": {},
+    "default": {},
+    "compact": {"compact": True},
+    "lazy": {"lazy": True},
+    "compact + lazy": {"compact": True, "lazy": True},
+}
+
+
+class LegacyMessage:
+    """
+    Replica of the memory layout of the legacy QGCMessage, which held
+    its private state and its payload attributes, in that order, in the
+    instance __dict__.
+    """
+
+    def __init__(self, msg: QGCMessage):
+        """
+        Constructor.
+
+        :param QGCMessage msg: parsed message to copy
+        """
+
+        for name in LEGACY_STATE:
+            setattr(self, name, getattr(msg, name))
+        for name, val in msg._attributes():
+            setattr(self, name, val)
+
+
+def retained(raws: list, legacy: bool = False, **kwargs) -> int:
+    """
+    Parse messages and return memory retained by the parsed objects.
+
+    :param list raws: raw QGC messages
+    :param bool legacy: retain replicas of legacy QGCMessage layout
+    :param kwargs: optional QGCReader.parse() keyword arguments
+    :return: retained memory in bytes
+    :rtype: int
+    """
+
+    tracemalloc.start()
+    if legacy:
+        parsed = [LegacyMessage(QGCReader.parse(raw)) for raw in raws]
+    else:
+        parsed = [QGCReader.parse(raw, **kwargs) for raw in raws]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return size
+
+
+def benchmark(**kwargs) -> dict:
+    """
+    pyqgc Memory benchmark test.
+
+    :param int messages: (kwarg) number of messages to retain (100,000)
+    :param str logfile: (kwarg) binary log of sample QGC messages to cycle through
+    :returns: dict of retained bytes per message for each mode
+    :rtype: dict
+    """
+
+    num = int(kwargs.get("messages", 100000))
+    with open(kwargs.get("logfile", LOGFILE), "rb") as stream:
+        sample = [raw for raw, _ in QGCReader(stream, protfilter=QGC_PROTOCOL)]
+    raws = list(islice(cycle(sample), num))
+
+    print(
+        f"\nOperating system: {osver()}",
+        f"\nPython version: {python_version()}",
+        f"\npyqgc version: {qgcver}",
+        f"\nMessages retained: {num:,} (cycling {len(sample)} sample messages)\n",
+    )
+
+    results = {
+        mode: retained(raws, mode == "legacy", **opts) / num
+        for mode, opts in MODES.items()
+    }
+    for mode, size in results.items():
+        print(
+            f"{mode:>15}: {size * num / 2**20:8,.2f} MB, {size:8,.1f} bytes/message, "
+            f"{size * 100 / results['legacy']:5.1f}% of legacy, "
+            f"{size * 100 / results['default']:5.1f}% of default"
+        )
+
+    return results
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+pyqgc Pickle benchmarking utility
+
+Usage (kwargs optional): python3 picklebenchmark.py messages=100000 logfile=pygpsdata_lg580p_qgc_get.log
+
+Measures the bytes and time needed to pass parsed QGC messages between
+processes (e.g. via a multiprocessing queue), for each combination of the
+QGCReader 'compact' and 'lazy' options. QGCMessage pickles as its
+serialized (raw) form, and is rebuilt by reparsing it (lazily, if it was
+parsed with 'lazy'). This is
+compared with pickling the full decoded state of each message, i.e. its
+private state plus every public payload attribute.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=line-too-long
+
+import os
+import pickle
+from itertools import cycle, islice
+from platform import python_version
+from platform import version as osver
+from sys import argv
+from time import perf_counter_ns
+
+from pyqgc._version import __version__ as qgcver
+from pyqgc.qgcmessage import QGCMessage
+from pyqgc.qgcreader import QGCReader
+from pyqgc.qgctypes_core import QGC_PROTOCOL
+
+LOGFILE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "pygpsdata_lg580p_qgc_get.log"
+)
+
+MODES = {
+    "default": {},
+    "compact": {"compact": True},
+    "lazy": {"lazy": True},
+}
+
+
+def full_state(msg: QGCMessage) -> dict:
+    """
+    Get full decoded state of message, as pickled before QGCMessage
+    implemented __reduce__.
+
+    :param QGCMessage msg: parsed message
+    :return: dict of private state and public payload attributes
+    :rtype: dict
+    """
+
+    str(msg)  # decode any lazy attributes
+    state = {
+        name: getattr(msg, name) for name in QGCMessage.__slots__ if name != "_lazy"
+    }
+    state.update(msg._attributes())  # pylint: disable=protected-access
+    return state
+
+
+def ipc(objs: list) -> tuple:
+    """
+    Pickle and unpickle objects, as a multiprocessing queue does.
+
+    :param list objs: objects to pass
+    :return: tuple of (total pickled bytes, elapsed time in seconds)
+    :rtype: tuple
+    """
+
+    start = perf_counter_ns()
+    pickles = [pickle.dumps(obj, pickle.HIGHEST_PROTOCOL) for obj in objs]
+    for pkl in pickles:
+        pickle.loads(pkl)
+    elapsed = (perf_counter_ns() - start) / 1e9
+    return sum(len(pkl) for pkl in pickles), elapsed
+
+
+def benchmark(**kwargs) -> dict:
+    """
+    pyqgc Pickle benchmark test.
+
+    :param int messages: (kwarg) number of messages to pass (100,000)
+    :param str logfile: (kwarg) binary log of sample QGC messages to cycle through
+    :returns: dict of (bytes/message, microseconds/message) for each mode
+    :rtype: dict
+    """
+
+    num = int(kwargs.get("messages", 100000))
+    with open(kwargs.get("logfile", LOGFILE), "rb") as stream:
+        sample = [raw for raw, _ in QGCReader(stream, protfilter=QGC_PROTOCOL)]
+    raws = list(islice(cycle(sample), num))
+
+    print(
+        f"\nOperating system: {osver()}",
+        f"\nPython version: {python_version()}",
+        f"\npyqgc version: {qgcver}",
+        f"\nMessages passed: {num:,} (cycling {len(sample)} sample messages)\n",
+    )
+
+    results = {}
+    parsed = [QGCReader.parse(raw) for raw in raws]
+    size, secs = ipc([full_state(msg) for msg in parsed])
+    results["full state"] = (size / num, secs * 1e6 / num)
+    print(
+        f"{'full state':>10}: {size / 2**20:8,.2f} MB, {size / num:6,.1f} bytes/message, "
+        f"{secs:6.3f} seconds, {secs * 1e6 / num:6.2f} microseconds/message"
+    )
+    for mode, opts in MODES.items():
+        parsed = [QGCReader.parse(raw, **opts) for raw in raws]
+        size, secs = ipc(parsed)
+        results[mode] = (size / num, secs * 1e6 / num)
+        print(
+            f"{mode:>10}: {size / 2**20:8,.2f} MB, {size / num:6,.1f} bytes/message, "
+            f"{secs:6.3f} seconds, {secs * 1e6 / num:6.2f} microseconds/message, "
+            f"saving {(results['full state'][0] - size / num) * 100000 / 2**20:6,.2f} MB "
+            f"and {(results['full state'][1] * num / 1e6 - secs) * 100000 / num:6.3f} seconds per 100k messages"
+        )
+
+    return results
+
+
+def main():
+    """
+    CLI Entry point.
+
+    args as benchmark() method
+    """
+
+    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
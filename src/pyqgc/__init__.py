@@ -6,7 +6,7 @@ Created on 6 Oct 2025
 :license: BSD 3-Clause
 """
 
-from pynmeagps import SocketWrapper
+from importlib import import_module
 
 from pyqgc._version import __version__
 from pyqgc.exceptions import (
@@ -17,10 +17,54 @@ from pyqgc.exceptions import (
     QGCStreamError,
     QGCTypeError,
 )
+from pyqgc.qgcasyncreader import AsyncQGCReader
+from pyqgc.qgcfilereader import QGCFileReader
 from pyqgc.qgchelpers import *
+from pyqgc.qgcindex import QGCIndex
+from pyqgc.qgclatency import QGCLatency
 from pyqgc.qgcmessage import QGCMessage
+from pyqgc.qgcparser import QGCParser
+from pyqgc.qgcprofile import QGCProfile
 from pyqgc.qgcreader import QGCReader
 from pyqgc.qgctypes_core import *
 from pyqgc.qgctypes_get import *
 
 version = __version__  # pylint: disable=invalid-name
+
+# imported on first access, as they pull in large optional or
+# protocol-specific dependencies (numpy, pandas, multiprocessing,
+# pynmeagps)
+_LAZY = {
+    "SocketWrapper": "pynmeagps",
+    "decode_columns": "pyqgc.qgcnumpy",
+    "parse_file_parallel": "pyqgc.qgcparallel",
+    "to_dataframes": "pyqgc.qgcpandas",
+}
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import lazily-loaded attribute on first access.
+
+    :param str name: attribute name
+    :return: attribute
+    :rtype: object
+    :raises: AttributeError if not a lazily-loaded attribute
+    """
+
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    val = getattr(import_module(_LAZY[name]), name)
+    globals()[name] = val
+    return val
+
+
+def __dir__() -> list:
+    """
+    Module attributes, including lazily-loaded attributes.
+
+    :return: attribute names
+    :rtype: list
+    """
+
+    return sorted(set(globals()) | set(_LAZY))
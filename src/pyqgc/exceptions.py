@@ -22,6 +22,18 @@ class QGCParseError(Exception):
     QGC Parsing error.
     """
 
+    def __init__(self, *args, reason: str = None):
+        """
+        Constructor.
+
+        :param args: error message
+        :param str reason: category counted in reader statistics,
+            "checksum" or "length" (None = other)
+        """
+
+        super().__init__(*args)
+        self.reason = reason
+
 
 class QGCStreamError(Exception):
     """
@@ -0,0 +1,227 @@
+"""
+AsyncQGCReader class.
+
+Asynchronous counterpart to QGCReader. Reads and parses individual
+QGC, NMEA and RTCM3 messages from any asyncio data stream which
+supports an awaitable read(n) -> bytes method, typically an
+asyncio.StreamReader e.g.::
+
+    reader, writer = await asyncio.open_connection("localhost", 50007)
+    async for raw_data, parsed_data in AsyncQGCReader(reader):
+        print(parsed_data)
+
+Allows many receivers to be multiplexed in a single event loop
+without a blocking QGCReader thread per stream. Framing and decoding
+are delegated to QGCParser, so NMEA and RTCM3 messages are parsed via
+pynmeagps and pyrtcm exactly as for QGCReader.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+from pyqgc.qgclatency import QGCLatency
+from pyqgc.qgcparser import QGCParser
+from pyqgc.qgcprofile import QGCProfile
+from pyqgc.qgctypes_core import (
+    ERR_LOG,
+    GET,
+    NMEA_PROTOCOL,
+    QGC_PROTOCOL,
+    RTCM3_PROTOCOL,
+    VALCKSUM,
+)
+
+
+class AsyncQGCReader:
+    """
+    AsyncQGCReader class.
+    """
+
+    def __init__(
+        self,
+        datastream,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | QGC_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        bufsize: int = 4096,
+        parsing: bool = True,
+        errorhandler: object = None,
+        lazy: bool = False,
+        compact: bool = False,
+        msgfilter: object = None,
+        profile: bool = False,
+        latency: bool = False,
+        passthrough: int = 0,
+    ):
+        """Constructor.
+
+        :param datastream stream: input asyncio data stream e.g. asyncio.StreamReader
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), QGC_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param int bufsize: maximum stream read chunk size (4096)
+        :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
+        :param object errorhandler: error handling object or function (None)
+        :param bool lazy: decode QGC payload attributes on first access (False)
+        :param bool compact: use compact (slotted) classes for fixed-layout QGC
+            message types (False)
+        :param object msgfilter: iterable of QGC message identities e.g. "NAV-POS"
+            and/or (msggrp, msgid) byte pairs to output; all others are skipped
+            unparsed (None = output all)
+        :param bool profile: record per-stage timings, available via
+            'profile' property (False)
+        :param bool latency: record per-message latency histograms, available
+            via 'latency' property (False)
+        :param int passthrough: NMEA_PROTOCOL (1) and/or RTCM3_PROTOCOL (4) messages
+            to output raw, with checksum/CRC validated (subject to 'validate')
+            but not parsed, i.e. parsed_data is None. Can be OR'd (0 = none)
+        :raises: QGCStreamError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+
+        self._stream = datastream
+        self._bufsize = bufsize
+        self._parser = QGCParser(
+            msgmode=msgmode,
+            validate=validate,
+            protfilter=protfilter,
+            quitonerror=quitonerror,
+            parsebitfield=parsebitfield,
+            parsing=parsing,
+            errorhandler=errorhandler,
+            lazy=lazy,
+            compact=compact,
+            msgfilter=msgfilter,
+            profile=profile,
+            latency=latency,
+            passthrough=passthrough,
+        )
+
+    def __aiter__(self):
+        """Asynchronous iterator."""
+
+        return self
+
+    async def __anext__(self) -> tuple:
+        """
+        Return next item in asynchronous iteration.
+
+        :return: tuple of (raw_data as bytes, parsed_data as QGCMessage)
+        :rtype: tuple
+        :raises: StopAsyncIteration
+
+        """
+
+        raw_data, parsed_data = await self.read()
+        if raw_data is None and parsed_data is None:
+            raise StopAsyncIteration
+        return (raw_data, parsed_data)
+
+    async def read(self) -> tuple:
+        """
+        Read a single QGC message from the stream
+        and return both raw and parsed data.
+
+        Awaits further data from the stream, in chunks of up to
+        'bufsize' bytes, only when the buffer holds no complete message.
+
+        'quitonerror' determines whether to raise, log or ignore parsing errors.
+
+        :return: tuple of (raw_data as bytes, parsed_data as QGCMessage),
+            or (None, None) at EOF
+        :rtype: tuple
+        :raises: Exception (if invalid or unrecognised protocol in data stream)
+        """
+
+        while True:
+            raw_data, parsed_data = self._parser.read()
+            if raw_data is not None:
+                return (raw_data, parsed_data)
+            data = await self._stream.read(self._bufsize)
+            if len(data) == 0:  # EOF
+                self._parser.feed_eof()
+                return (None, None)
+            self._parser.feed(data)
+
+    @property
+    def datastream(self) -> object:
+        """
+        Getter for stream.
+
+        :return: data stream
+        :rtype: object
+        """
+
+        return self._stream
+
+    @property
+    def skipped(self) -> int:
+        """
+        Getter for number of non-protocol bytes discarded while
+        resynchronising with the stream.
+
+        :return: bytes discarded
+        :rtype: int
+        """
+
+        return self._parser.skipped
+
+    @property
+    def filtered(self) -> int:
+        """
+        Getter for number of QGC messages skipped, unparsed, by 'msgfilter'.
+
+        :return: messages skipped
+        :rtype: int
+        """
+
+        return self._parser.filtered
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for snapshot of running totals of frames, bytes and
+        errors (see QGCReader.stats).
+
+        :return: statistics
+        :rtype: dict
+        """
+
+        return self._parser.stats
+
+    @property
+    def profile(self) -> QGCProfile | None:
+        """
+        Getter for per-stage timings, if 'profile' is set
+        (see QGCReader.profile).
+
+        :return: profile, or None if 'profile' is not set
+        :rtype: QGCProfile or None
+        """
+
+        return self._parser.profile
+
+    @property
+    def latency(self) -> QGCLatency | None:
+        """
+        Getter for per-message latency histograms, if 'latency' is set
+        (see QGCReader.latency). Latency is measured from the stream read
+        which completed the message.
+
+        :return: latency tracker, or None if 'latency' is not set
+        :rtype: QGCLatency or None
+        """
+
+        return self._parser.latency
@@ -0,0 +1,194 @@
+"""
+QGCCodec class.
+
+Precompiled codecs for fixed-layout QGC message payloads.
+
+A payload definition in QGC_PAYLOADS_GET/SET/POLL which consists
+solely of fixed-size single attributes (i.e. no repeating groups,
+bitfields or variable-length strings) can be compiled into a single
+struct.Struct, a tuple of attribute names and a table of any
+post-unpack conversions (odd-sized integers, strings, scaling).
+The complete payload can then be decoded with one unpack call,
+rather than walking the payload definition attribute by attribute.
+An offset table also allows individual attributes to be decoded
+on demand.
+
+Codecs are compiled lazily on first use and cached.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import struct
+
+from pyqgc.qgchelpers import attsiz, atttyp
+from pyqgc.qgctypes_core import SCALROUND
+
+STRUCT_CODES = {
+    ("U", 1): "B",
+    ("U", 2): "H",
+    ("U", 4): "I",
+    ("U", 8): "Q",
+    ("S", 1): "b",
+    ("S", 2): "h",
+    ("S", 4): "i",
+    ("S", 8): "q",
+    ("R", 4): "f",
+    ("R", 8): "d",
+}
+"""struct format codes for natively supported attribute types"""
+
+_CODECS = {}  # cache of compiled codecs, keyed on id(payload dict)
+
+
+class QGCCodec:
+    """
+    QGCCodec class.
+    """
+
+    __slots__ = ("struct", "names", "convs", "size", "fields")
+
+    def __init__(self, pdict: dict):
+        """Constructor.
+
+        :param dict pdict: fixed-layout payload definition
+        :raises: ValueError if payload definition is not fixed-layout
+        """
+
+        fmt = "<"
+        names = []
+        convs = []
+        fields = {}
+        offset = 0
+        for i, (anam, adef) in enumerate(pdict.items()):
+            if not isinstance(adef, str):  # group or bitfield
+                raise ValueError(f"{anam} is not a single attribute")
+            scaling = 1
+            if "*" in adef:
+                adef, scaling = adef.split("*", 1)
+                scaling = float(scaling)
+            typ = atttyp(adef)
+            siz = attsiz(adef)
+            if siz < 1 or typ not in ("U", "S", "R", "X", "C"):
+                raise ValueError(f"{anam} is not a fixed size attribute")
+            code = STRUCT_CODES.get((typ, siz))
+            if code is None:  # unpack as bytes and convert
+                code = f"{siz}s"
+                conv = _conv_bytes(typ)
+            else:
+                conv = None
+            fmt += code
+            if scaling != 1:
+                conv = _conv_scale(conv, scaling)
+            if conv is not None:
+                convs.append((i, conv))
+            names.append(anam)
+            fields[anam] = (offset, struct.Struct(f"<{code}"), conv)
+            offset += siz
+
+        self.struct = struct.Struct(fmt)
+        self.names = tuple(names)
+        self.convs = tuple(convs)
+        self.size = self.struct.size
+        self.fields = fields
+
+    def values(self, payload: bytes) -> tuple | list:
+        """
+        Decode payload attribute values in a single unpack operation.
+
+        :param bytes payload: payload, which must be exactly codec.size bytes
+        :return: attribute values, in definition order
+        :rtype: tuple or list
+        :raises: struct.error if payload is wrong size
+        """
+
+        vals = self.struct.unpack(payload)
+        if self.convs:
+            vals = list(vals)
+            for i, conv in self.convs:
+                vals[i] = conv(vals[i])
+        return vals
+
+    def decode(self, payload: bytes) -> zip:
+        """
+        Decode payload in a single unpack operation.
+
+        :param bytes payload: payload, which must be exactly codec.size bytes
+        :return: iterator of (attribute name, value) pairs, in definition order
+        :rtype: zip
+        :raises: struct.error if payload is wrong size
+        """
+
+        return zip(self.names, self.values(payload))
+
+    def decode_field(self, payload: bytes, name: str) -> object:
+        """
+        Decode a single named attribute from its precomputed payload offset.
+
+        :param bytes payload: payload
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: KeyError if name is not an attribute of this payload
+        """
+
+        offset, fstruct, conv = self.fields[name]
+        val = fstruct.unpack_from(payload, offset)[0]
+        return val if conv is None else conv(val)
+
+
+def _conv_bytes(typ: str):
+    """
+    Get conversion function for attribute unpacked as bytes.
+
+    :param str typ: attribute type e.g. 'U'
+    :return: conversion function, or None if value is left as bytes
+    :rtype: function
+    """
+
+    if typ == "C":
+        return lambda val: val.replace(b"\x00", b" ").decode(
+            "utf-8", errors="backslashreplace"
+        )
+    if typ in ("U", "S"):
+        signed = typ == "S"
+        return lambda val: int.from_bytes(val, "little", signed=signed)
+    return None
+
+
+def _conv_scale(conv, scaling: float):
+    """
+    Get conversion function applying scaling factor.
+
+    :param conv: preceding conversion function, or None
+    :param float scaling: scaling factor
+    :return: conversion function
+    :rtype: function
+    """
+
+    if conv is None:
+        return lambda val: round(val / scaling, SCALROUND)
+    return lambda val: round(conv(val) / scaling, SCALROUND)
+
+
+def get_codec(pdict: dict) -> QGCCodec | None:
+    """
+    Get compiled codec for payload definition, compiling it on first use.
+
+    :param dict pdict: payload definition
+    :return: codec, or None if payload definition is not fixed-layout
+    :rtype: QGCCodec or None
+    """
+
+    entry = _CODECS.get(id(pdict))
+    if entry is None or entry[0] is not pdict:
+        try:
+            codec = QGCCodec(pdict) if pdict else None
+        except ValueError:
+            codec = None
+        entry = (pdict, codec)
+        _CODECS[id(pdict)] = entry
+    return entry[1]
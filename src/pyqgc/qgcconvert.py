@@ -0,0 +1,485 @@
+"""
+qgcconvert CLI utility.
+
+Streaming converter which writes the QGC messages in one or more binary
+log files to CSV or NDJSON (newline-delimited JSON) files, one file per
+message identity, e.g.::
+
+    qgcconvert capture.log --format ndjson --identities NAV-POS SEN-IMU
+
+creates 'capture_NAV-POS.ndjson' and 'capture_SEN-IMU.ndjson'.
+
+Each log file is framed from a memory-mapped buffer by QGCFileReader,
+without parsing, so memory usage is bounded regardless of file size.
+Fixed-layout payloads are decoded directly by their precompiled codecs,
+with field order taken from the payload definition; other message types
+(e.g. INF-VER) are parsed to QGCMessage. Reserved attributes are omitted.
+NMEA and RTCM3 messages are skipped unless included in '--protfilter',
+in which case they are parsed by pynmeagps or pyrtcm. Multiple log files
+can be converted in parallel worker processes using '--workers'.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import csv
+import json
+import os
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, time
+from math import isfinite
+from shutil import copyfileobj
+from time import perf_counter
+
+from pyqgc import qgcreader
+from pyqgc._version import __version__ as VERSION
+from pyqgc.qgccodec import get_codec
+from pyqgc.qgcfilereader import QGCFileReader
+from pyqgc.qgchelpers import calc_checksum
+from pyqgc.qgcmessage import payload_dict
+from pyqgc.qgcreader import QGCReader, import_parser
+from pyqgc.qgctypes_core import (
+    GET,
+    NMEA_PROTOCOL,
+    POLL,
+    QGC_MSGIDS,
+    QGC_PROTOCOL,
+    RTCM3_PROTOCOL,
+    SET,
+)
+
+FORMATS = ("csv", "ndjson")
+"""Supported output formats"""
+WRITEBUFSIZE = 2**20
+"""Output file write buffer size in bytes"""
+
+
+class _Output:  # pylint: disable=too-many-instance-attributes
+    """
+    Buffered output file for a single message identity.
+
+    Each NDJSON record holds the attributes of its own message. A CSV
+    file has a single header, so if a later message has attributes not
+    in the header (e.g. more repeating groups, or an alternate payload
+    definition), they are appended as new columns and the header is
+    rewritten when the file is closed; earlier rows leave them empty.
+    """
+
+    def __init__(self, path: str, fmt: str, names: tuple | None):
+        """Constructor.
+
+        :param str path: output file path
+        :param str fmt: output format ("csv" or "ndjson")
+        :param tuple names: attribute names in payload definition order,
+            or None if taken from first message written
+        """
+
+        # pylint: disable=consider-using-with
+        self._path = path
+        self._file = open(
+            path, "w", encoding="utf-8", newline="", buffering=WRITEBUFSIZE
+        )
+        self._writer = csv.writer(self._file) if fmt == "csv" else None
+        self._srcnames = names
+        self._names = None  # CSV columns
+        self._columns = set()
+        self._widened = False
+        self._idx = None
+        self._srcout = None
+        self._conv = None
+        if names is not None:
+            self._idx = [i for i, name in enumerate(names) if name[0:8] != "reserved"]
+            self._srcout = tuple(names[i] for i in self._idx)
+            self._start(self._srcout)
+
+    def _start(self, names: tuple):
+        """
+        Set CSV columns and write CSV header.
+
+        :param tuple names: attribute names
+        """
+
+        if self._writer is not None:
+            self._names = list(names)
+            self._columns = set(names)
+            self._writer.writerow(names)
+
+    def write(self, vals: dict):
+        """
+        Write message attribute values.
+
+        :param dict vals: attribute values keyed on attribute name
+        """
+
+        vals = {
+            name: _jsonval(val) for name, val in vals.items() if name[0:8] != "reserved"
+        }
+        if self._writer is None:
+            self._file.write(json.dumps(vals) + "\n")
+            return
+        if self._names is None:
+            self._start(tuple(vals))
+        elif not self._columns.issuperset(vals):
+            new = [name for name in vals if name not in self._columns]
+            self._names += new
+            self._columns.update(new)
+            self._widened = True
+        self._writer.writerow([vals.get(name) for name in self._names])
+
+    def write_values(self, names: tuple, vals: tuple):
+        """
+        Write message attribute values in payload definition order.
+
+        :param tuple names: attribute names, as passed to constructor
+        :param tuple vals: attribute values
+        """
+
+        if names is not self._srcnames:  # e.g. alternate payload definition
+            self.write(dict(zip(names, vals)))
+            return
+        row = [vals[i] for i in self._idx]
+        if self._conv is None:
+            self._conv = self._conversions(row)
+        for pos in self._conv[0]:
+            row[pos] = row[pos].hex()
+        for pos in self._conv[1]:
+            if not isfinite(row[pos]):
+                row[pos] = None
+        if self._writer is not None:  # columns of any widening follow these
+            self._writer.writerow(row)
+        else:
+            self._file.write(json.dumps(dict(zip(self._srcout, row))) + "\n")
+
+    def _conversions(self, row: list) -> tuple:
+        """
+        Get positions of fixed-layout values needing conversion, so that
+        all other values can be written unconverted.
+
+        :param list row: first row of values written
+        :return: tuple of (positions of bytes values, positions of
+            float values which may be NaN or infinity)
+        :rtype: tuple
+        """
+
+        hexs = tuple(i for i, val in enumerate(row) if isinstance(val, bytes))
+        floats = ()
+        if self._writer is None:  # JSON has no NaN or infinity
+            floats = tuple(i for i, val in enumerate(row) if isinstance(val, float))
+        return hexs, floats
+
+    def close(self):
+        """
+        Close output file, rewriting CSV header if columns were added.
+        """
+
+        self._file.close()
+        if not self._widened:
+            return
+        tmp = self._path + ".tmp"
+        with (
+            open(self._path, "r", encoding="utf-8", newline="") as src,
+            open(tmp, "w", encoding="utf-8", newline="", buffering=WRITEBUFSIZE) as dst,
+        ):
+            src.readline()  # original header
+            csv.writer(dst).writerow(self._names)
+            copyfileobj(src, dst, WRITEBUFSIZE)
+        os.replace(tmp, self._path)
+
+
+def _jsonval(val: object) -> object:
+    """
+    Convert attribute value to CSV/JSON compatible value.
+
+    :param object val: attribute value
+    :return: bytes as hex string, NaN or infinity as None, date or time
+        (e.g. NMEA) as ISO 8601 string, else unchanged
+    :rtype: object
+    """
+
+    if isinstance(val, bytes):
+        return val.hex()
+    if isinstance(val, (date, time)):
+        return val.isoformat()
+    if isinstance(val, float) and not isfinite(val):
+        return None
+    return val
+
+
+def convert_file(
+    infile: str,
+    outdir: str = None,
+    fmt: str = "csv",
+    identities: list = None,
+    msgmode: int = GET,
+    validate: bool = True,
+    protfilter: int = QGC_PROTOCOL,
+) -> tuple:
+    """
+    Convert messages in binary log file to one CSV or NDJSON
+    file per message identity.
+
+    Output files are named '<log file stem>_<identity>.<fmt>'.
+
+    :param str infile: path of binary log file
+    :param str outdir: output directory (None = same as log file)
+    :param str fmt: output format "csv" or "ndjson" ("csv")
+    :param list identities: message identities to convert e.g. "NAV-POS",
+        "GNGGA", "1005" (None = all)
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL) (0)
+    :param bool validate: discard messages with invalid checksum (True)
+    :param int protfilter: NMEA_PROTOCOL (1), QGC_PROTOCOL (2),
+        RTCM3_PROTOCOL (4), can be OR'd (2)
+    :return: tuple of (messages written, messages discarded, bytes read,
+        list of output files)
+    :rtype: tuple
+    :raises: ValueError (if fmt is invalid)
+    :raises: QGCStreamError (if a QGC identity is invalid)
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+    # pylint: disable=too-many-branches, too-many-statements, protected-access
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Invalid format {fmt} - must be one of {FORMATS}")
+    stem, _ = os.path.splitext(os.path.basename(infile))
+    outdir = os.path.dirname(os.path.abspath(infile)) if outdir is None else outdir
+    msgfilter = others = None
+    if identities is not None:
+        qgcids = set(QGC_MSGIDS.values())
+        msgfilter = [idy for idy in identities if idy in qgcids or "-" in idy]
+        others = {idy for idy in identities if idy not in msgfilter}
+    parsers = {}  # NMEA_PROTOCOL or RTCM3_PROTOCOL -> parse function
+    outputs = {}  # (msggrp + msgid, length) -> (output, codec)
+    files = {}  # identity -> output
+    written = discarded = 0
+    try:
+        with QGCFileReader(
+            infile,
+            msgmode=msgmode,
+            protfilter=protfilter,
+            parsing=False,
+            msgfilter=msgfilter,
+        ) as qfr:
+            for raw, _ in qfr:
+                if raw[0:2] != b"QG":  # NMEA or RTCM3
+                    protocol = NMEA_PROTOCOL if raw[0:1] == b"$" else RTCM3_PROTOCOL
+                    parse = parsers.get(protocol)
+                    if parse is None:
+                        parse = parsers[protocol] = import_parser(protocol)
+                    try:
+                        if protocol == NMEA_PROTOCOL:
+                            parsed = parse(raw, validate=int(validate), msgmode=msgmode)
+                        else:
+                            parsed = parse(raw, validate=int(validate), labelmsm=1)
+                    except qgcreader.PARSE_ERRORS:  # extended by import_parser
+                        discarded += 1
+                        continue
+                    if parsed is None:
+                        discarded += 1
+                        continue
+                    identity = parsed.identity
+                    if others is not None and identity not in others:
+                        continue
+                    output = files.get(identity)
+                    if output is None:
+                        output = files[identity] = _Output(
+                            os.path.join(outdir, f"{stem}_{identity}.{fmt}"), fmt, None
+                        )
+                    output.write(
+                        {att: val for att, val in vars(parsed).items() if att[0] != "_"}
+                    )
+                    written += 1
+                    continue
+                if validate and calc_checksum(memoryview(raw)[2:-2]) != raw[-2:]:
+                    discarded += 1
+                    continue
+                key = (raw[2:4], len(raw) - 8)
+                entry = outputs.get(key)
+                if entry is None:
+                    identity = QGC_MSGIDS.get(key[0], f"UNKNOWN-{key[0].hex()}-NOMINAL")
+                    codec = _codec(identity, msgmode, key[1])
+                    output = files.get(identity)
+                    if output is None:
+                        output = _Output(
+                            os.path.join(outdir, f"{stem}_{identity}.{fmt}"),
+                            fmt,
+                            None if codec is None else codec.names,
+                        )
+                        files[identity] = output
+                    entry = outputs[key] = (output, codec)
+                output, codec = entry
+                if codec is None:
+                    # Variable-layout payload, e.g. INF-VER or RAW-HASE6. The
+                    # attribute names and count depend on the payload content
+                    # (repeating groups, variable-length strings), so there is
+                    # no precompiled codec and the names can only be resolved
+                    # by parsing. Attributes are taken in payload order.
+                    try:
+                        parsed = QGCReader.parse(raw, msgmode, validate=0)
+                        output.write(dict(parsed._attributes()))
+                    except qgcreader.PARSE_ERRORS:
+                        discarded += 1
+                        continue
+                else:
+                    output.write_values(codec.names, codec.values(raw[6:-2]))
+                written += 1
+            size = qfr.size
+    finally:
+        for output in files.values():
+            output.close()
+
+    paths = [os.path.join(outdir, f"{stem}_{identity}.{fmt}") for identity in files]
+    return written, discarded, size, paths
+
+
+def _codec(identity: str, msgmode: int, length: int):
+    """
+    Get precompiled codec for fixed-layout message type.
+
+    :param str identity: message identity
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param int length: payload length
+    :return: codec, or None if message type is not fixed-layout
+        or payload length does not match definition
+    :rtype: QGCCodec or None
+    """
+
+    try:
+        codec = get_codec(payload_dict(identity, msgmode, length))
+    except KeyError:
+        return None
+    return codec if codec is not None and codec.size == length else None
+
+
+def _convert(kwargs: dict) -> tuple:
+    """
+    Worker process wrapper for convert_file().
+
+    :param dict kwargs: convert_file() keyword arguments
+    :return: convert_file() result
+    :rtype: tuple
+    """
+
+    return convert_file(**kwargs)
+
+
+def main():
+    """
+    CLI Entry point.
+    """
+    # pylint: disable=too-many-locals
+
+    ap = ArgumentParser(
+        description="Convert QGC binary log file(s) to CSV or NDJSON files, "
+        "one file per message identity.",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    ap.add_argument("-V", "--version", action="version", version="%(prog)s " + VERSION)
+    ap.add_argument("infiles", nargs="+", help="binary log file(s)")
+    ap.add_argument(
+        "-f",
+        "--format",
+        dest="fmt",
+        choices=FORMATS,
+        default="csv",
+        help="output format",
+    )
+    ap.add_argument(
+        "-o", "--outdir", default=None, help="output directory (default: as log file)"
+    )
+    ap.add_argument(
+        "-i",
+        "--identities",
+        nargs="+",
+        default=None,
+        help="message identities to convert e.g. NAV-POS SEN-IMU (default: all)",
+    )
+    ap.add_argument(
+        "-p",
+        "--protfilter",
+        type=int,
+        choices=range(1, 8),
+        default=QGC_PROTOCOL,
+        help="protocols to convert 1 = NMEA, 2 = QGC, 4 = RTCM3, can be OR'd",
+    )
+    ap.add_argument(
+        "-m",
+        "--msgmode",
+        type=int,
+        choices=(GET, SET, POLL),
+        default=GET,
+        help="message mode 0 = GET, 1 = SET, 2 = POLL",
+    )
+    ap.add_argument(
+        "--novalidate",
+        action="store_true",
+        help="do not discard messages with invalid checksum",
+    )
+    ap.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes for multiple log files",
+    )
+    args = ap.parse_args()
+    if args.identities is not None:
+        qgcids = set(QGC_MSGIDS.values())
+        others = args.protfilter & (NMEA_PROTOCOL | RTCM3_PROTOCOL)
+        invalid = [
+            idy
+            for idy in args.identities
+            if idy not in qgcids and ("-" in idy or not others)
+        ]
+        if invalid:
+            ap.error(f"unknown QGC message identity {', '.join(invalid)}")
+    stems = {}  # (output directory, log file stem) -> log file
+    for infile in args.infiles:
+        outdir = os.path.dirname(infile) if args.outdir is None else args.outdir
+        key = (
+            os.path.abspath(outdir),
+            os.path.splitext(os.path.basename(infile))[0],
+        )
+        if key in stems:
+            ap.error(f"{stems[key]} and {infile} would write to the same output files")
+        stems[key] = infile
+
+    jobs = [
+        {
+            "infile": infile,
+            "outdir": args.outdir,
+            "fmt": args.fmt,
+            "identities": args.identities,
+            "msgmode": args.msgmode,
+            "validate": not args.novalidate,
+            "protfilter": args.protfilter,
+        }
+        for infile in args.infiles
+    ]
+    start = perf_counter()
+    if args.workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(_convert, jobs))
+    else:
+        results = [_convert(job) for job in jobs]
+    elapsed = perf_counter() - start
+
+    written = discarded = size = 0
+    for job, (wrt, dsc, siz, paths) in zip(jobs, results):
+        print(f"{job['infile']}: {wrt:,} messages written to {len(paths)} files")
+        written += wrt
+        discarded += dsc
+        size += siz
+    print(
+        f"{written:,} messages written, {discarded:,} discarded, "
+        f"{size / 2**20:,.2f} MB read in {elapsed:.2f} seconds "
+        f"({written / elapsed:,.0f} messages/second, "
+        f"{size / 2**20 / elapsed:,.2f} MB/second)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+QGCFileReader class.
+
+Memory-mapped counterpart to QGCReader for binary log files. The file
+is mapped into memory with mmap and messages are framed directly from
+the mapped buffer, with no stream read() calls and no intermediate
+buffer copies, e.g.::
+
+    with QGCFileReader("capture.log", protfilter=QGC_PROTOCOL) as qfr:
+        qfr.seek(1_000_000_000)  # jump to first valid frame after 1GB
+        for raw_data, parsed_data in qfr:
+            print(qfr.tell(), parsed_data)
+
+seek() allows any section of a large capture to be reprocessed without
+reading from the start, automatically resynchronising to the first
+valid (checksummed) QGC, NMEA or RTCM3 frame at or after the offset.
+
+Framing, decoding and the 'protfilter', 'msgfilter', 'quitonerror'
+and 'parsing' semantics are identical to QGCReader.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+import mmap
+
+from pyqgc.exceptions import QGCStreamError
+from pyqgc.qgchelpers import calc_checksum, calc_crc24q, calc_nmea_checksum
+from pyqgc.qgcreader import LEADBYTES, QGCReader
+from pyqgc.qgctypes_core import (
+    ERR_LOG,
+    GET,
+    NMEA_HDR,
+    NMEA_PROTOCOL,
+    QGC_HDR,
+    QGC_PROTOCOL,
+    RTCM3_PROTOCOL,
+    VALCKSUM,
+)
+
+NMEA_MAXLEN = 1024
+"""Maximum NMEA sentence length considered when resynchronising"""
+
+
+class QGCFileReader(QGCReader):
+    """
+    QGCFileReader class.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | QGC_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        parsing: bool = True,
+        errorhandler: object = None,
+        lazy: bool = False,
+        compact: bool = False,
+        msgfilter: object = None,
+        profile: bool = False,
+        passthrough: int = 0,
+    ):
+        """Constructor.
+
+        :param str filename: path of binary log file
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), QGC_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
+        :param object errorhandler: error handling object or function (None)
+        :param bool lazy: decode QGC payload attributes on first access (False)
+        :param bool compact: use compact (slotted) classes for fixed-layout QGC
+            message types (False)
+        :param object msgfilter: iterable of QGC message identities e.g. "NAV-POS"
+            and/or (msggrp, msgid) byte pairs to output; all others are skipped
+            unparsed (None = output all)
+        :param bool profile: record per-stage timings, available via
+            'profile' property (False)
+        :param int passthrough: NMEA_PROTOCOL (1) and/or RTCM3_PROTOCOL (4) messages
+            to output raw, with checksum/CRC validated (subject to 'validate')
+            but not parsed, i.e. parsed_data is None. Can be OR'd (0 = none)
+        :raises: QGCStreamError (if mode is invalid)
+        :raises: OSError (if file cannot be opened)
+        """
+        # pylint: disable=too-many-arguments
+
+        stream = open(filename, "rb")  # pylint: disable=consider-using-with
+        try:
+            super().__init__(
+                stream,
+                msgmode=msgmode,
+                validate=validate,
+                protfilter=protfilter,
+                quitonerror=quitonerror,
+                parsebitfield=parsebitfield,
+                parsing=parsing,
+                errorhandler=errorhandler,
+                lazy=lazy,
+                compact=compact,
+                msgfilter=msgfilter,
+                profile=profile,
+                passthrough=passthrough,
+            )
+            # mapped file is used directly as the framing buffer
+            self._buf = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            self._buf = b""
+        except Exception:
+            stream.close()
+            raise
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def close(self):
+        """
+        Unmap and close file.
+        """
+
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+        self._buf = b""
+        self._pos = 0
+        self._stream.close()
+
+    def tell(self) -> int:
+        """
+        Get offset of the next frame to be read.
+
+        :return: file offset in bytes
+        :rtype: int
+        """
+
+        return self._pos
+
+    def seek(self, offset: int, resync: bool = True) -> int:
+        """
+        Move to the first valid QGC, NMEA or RTCM3 frame at or after
+        the specified file offset.
+
+        A frame is considered valid if its header is recognised and its
+        checksum (or CRC) is correct, so seeking into the middle of a
+        frame will not yield spurious frames from its payload.
+
+        :param int offset: file offset in bytes
+        :param bool resync: resync to first valid frame (True) or move
+            to exact offset, e.g. a known frame boundary (False)
+        :return: offset of first valid frame, or file size if none found
+        :rtype: int
+        """
+
+        buf = self._buf
+        pos = min(max(offset, 0), len(buf))
+        while resync:
+            mat = LEADBYTES.search(buf, pos)
+            if mat is None:
+                pos = len(buf)
+                break
+            pos = mat.start()
+            if self._isframe(pos):
+                break
+            pos += 1
+        self._pos = pos
+        return pos
+
+    def _isframe(self, pos: int) -> bool:
+        """
+        Check if buffer contains a complete, valid frame at offset.
+
+        :param int pos: buffer offset
+        :return: valid frame Y/N
+        :rtype: bool
+        """
+        buf = self._buf
+        end = len(buf)
+        if pos + 6 > end:
+            return False
+        if buf[pos : pos + 2] == QGC_HDR:
+            size = (buf[pos + 4] | (buf[pos + 5] << 8)) + 8
+            return pos + size <= end and calc_checksum(
+                memoryview(buf)[pos + 2 : pos + size - 2]
+            ) == bytes(buf[pos + size - 2 : pos + size])
+        if bytes(buf[pos : pos + 2]) in NMEA_HDR:
+            lfpos = buf.find(b"\x0a", pos, min(pos + NMEA_MAXLEN, end))
+            if lfpos == -1:
+                return False
+            line = bytes(buf[pos:lfpos]).rstrip(b"\x0d")
+            return (
+                line[-3:-2] == b"*"
+                and f"{calc_nmea_checksum(line[1:-3]):02X}".encode("ascii")
+                == line[-2:].upper()
+            )
+        if buf[pos] == 0xD3 and (buf[pos + 1] & ~0x03) == 0:
+            size = (buf[pos + 2] | (buf[pos + 1] << 8)) + 6
+            return pos + size <= end and calc_crc24q(buf[pos : pos + size]) == 0
+        return False
+
+    def _top_up(self, size: int, line: bool = False):
+        """
+        Called when the mapped buffer holds only a partial frame.
+        As the whole file is already mapped, this signals EOF.
+
+        :param int size: number of unconsumed bytes required
+        :param bool line: reading LF-terminated line (False)
+        :raises: EOFError if file is exhausted
+        :raises: QGCStreamError if file ends with a partial frame
+        """
+
+        unread = len(self._buf) - self._pos
+        self._pos = len(self._buf)
+        if unread == 0:
+            raise EOFError()
+        raise QGCStreamError(  # truncated file
+            "Serial stream terminated unexpectedly. "
+            f"{size} bytes requested, {unread} bytes returned."
+        )
+
+    @property
+    def size(self) -> int:
+        """
+        Getter for size of mapped file.
+
+        :return: file size in bytes
+        :rtype: int
+        """
+
+        return len(self._buf)
+
+
+class _BoundedFileReader(QGCFileReader):
+    """
+    QGCFileReader which treats any frame starting at or after a specified
+    end offset as EOF, so that read() never skips ahead (e.g. past frames
+    excluded by 'protfilter' or 'msgfilter') beyond that offset.
+    """
+
+    def __init__(self, filename: str, **kwargs):
+        """Constructor.
+
+        :param str filename: path of binary log file
+        :param kwargs: optional QGCFileReader keyword arguments
+        """
+
+        super().__init__(filename, **kwargs)
+        self._end = len(self._buf)
+
+    def bound(self, start: int, end: int):
+        """
+        Move to exact offset, e.g. a known frame boundary, and set end offset.
+
+        :param int start: start offset
+        :param int end: end offset - no frame starting at or after
+            this offset is read
+        """
+
+        self.seek(start, resync=False)
+        self._end = end
+
+    def _need(self, size: int):
+        """
+        Ensure at least a specified number of unconsumed bytes are
+        available in the buffer.
+
+        :param int size: number of bytes required
+        :raises: EOFError if end offset is reached or file is exhausted
+        :raises: QGCStreamError if file ends prematurely
+        """
+
+        if self._pos >= self._end:
+            raise EOFError()
+        while len(self._buf) - self._pos < size:
+            self._top_up(size)
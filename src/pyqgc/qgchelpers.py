@@ -10,6 +10,9 @@ Created on 6 Oct 2025
 """
 
 import struct
+from functools import reduce
+from itertools import accumulate
+from operator import xor
 from typing import Any
 
 import pyqgc.exceptions as qge
@@ -18,6 +21,45 @@ from pyqgc.qgctypes_get import QGC_PAYLOADS_GET
 from pyqgc.qgctypes_poll import QGC_PAYLOADS_POLL
 from pyqgc.qgctypes_set import QGC_PAYLOADS_SET
 
+CRC24Q_POLY = 0x1864CFB
+"""RTCM3 CRC-24Q generator polynomial"""
+
+
+def _crc24q_table() -> tuple:
+    """
+    Build CRC-24Q lookup table, giving the CRC of each possible
+    leading byte, so that the CRC is updated a byte rather than
+    a bit at a time.
+
+    :return: 256 CRC values
+    :rtype: tuple
+    """
+
+    table = []
+    for octet in range(256):
+        crc = octet << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= CRC24Q_POLY
+        table.append(crc & 0xFFFFFF)
+    return tuple(table)
+
+
+CRC24Q_TABLE = _crc24q_table()
+"""CRC-24Q lookup table"""
+
+QGC_PAYLOADS = (QGC_PAYLOADS_GET, QGC_PAYLOADS_SET, QGC_PAYLOADS_POLL)
+"""Payload definitions, indexed on message mode (GET, SET, POLL)"""
+ALTERNATE_PAYLOADS = {
+    ("CFG-MSG", GET): "CFG-MSG-INTF",
+    ("CFG-MSG", SET): "CFG-MSG-INTF",
+    ("CFG-MSG", POLL): "CFG-MSG-INTF",
+    ("CFG-UART", SET): "CFG-UART-DIS",
+}
+"""Alternate payload definitions, keyed on (identity, mode), used in
+place of the nominal definition when the payload length matches"""
+
 
 def att2idx(att: str) -> object:
     """
@@ -124,21 +166,49 @@ def calc_checksum(content: bytes) -> bytes:
     """
     Calculate checksum.
 
+    The running sums check_a and check_b are equivalent to the sum of the
+    content bytes and the sum of its prefix sums respectively (mod 256),
+    so both are computed without a per-byte Python loop. Content may be
+    a memoryview slice of the raw message, avoiding any copying.
+
     :param bytes content: message content, excluding header and checksum bytes
     :return: checksum as two bytes
     :rtype: bytes
     """
 
-    check_a = 0
-    check_b = 0
+    return bytes((sum(content) & 0xFF, sum(accumulate(content)) & 0xFF))
+
+
+def calc_crc24q(message: bytes) -> int:
+    """
+    Calculate RTCM3 CRC-24Q, using a lookup table (equivalent to, but
+    several times faster than, pyrtcm.calc_crc24q).
+
+    If the message includes the appended CRC bytes, returns 0
+    if the message is valid.
+
+    :param bytes message: message
+    :return: CRC, or 0 if message (including CRC) is valid
+    :rtype: int
+    """
+
+    crc = 0
+    table = CRC24Q_TABLE
+    for octet in message:
+        crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ octet]
+    return crc
+
 
-    for char in content:
-        check_a += char
-        check_a &= 0xFF
-        check_b += check_a
-        check_b &= 0xFF
+def calc_nmea_checksum(content: bytes) -> int:
+    """
+    Calculate NMEA checksum.
 
-    return bytes((check_a, check_b))
+    :param bytes content: message content between '$' and '*'
+    :return: checksum
+    :rtype: int
+    """
+
+    return reduce(xor, content, 0)
 
 
 def escapeall(val: bytes) -> str:
@@ -177,23 +247,18 @@ def get_bits(bitfield: bytes, bitmask: int) -> int:
 
 def getinputmode(msggrp: bytes, msgid: bytes, length: bytes) -> int:
     """
-    Return input message mode (SET or POLL).
+    Return input message mode (SET or POLL), i.e. POLL if the payload
+    length matches a fixed-length POLL definition (including alternates)
+    and no SET definition, otherwise SET.
 
-    :param bytes data: raw QGC input message
+    :param bytes msggrp: message group
+    :param bytes msgid: message id
+    :param bytes length: payload length as 2 bytes
     :return: message mode (1 = SET, 2 = POLL)
     :rtype: int
     """
 
-    try:
-        mid = QGC_MSGIDS[msggrp + msgid]
-        leni = bytes2val(length, U2)
-        if leni == getpaylen(mid, SET):
-            return SET
-        if leni == getpaylen(mid, POLL):
-            return POLL
-    except (KeyError, ValueError):
-        pass
-    return SET
+    return INPUT_MODES.get(msggrp + msgid + length, SET)
 
 
 def getpaylen(identity: str, mode: int = GET) -> int:
@@ -204,19 +269,12 @@ def getpaylen(identity: str, mode: int = GET) -> int:
     :param int mode: message mode (GET/SET/POLL)
     :return: length in bytes or -1 if variable length
     :rtype: int
+    :raises: KeyError if message identity is not recognised for this mode
     """
 
     try:
-        dic = [QGC_PAYLOADS_GET, QGC_PAYLOADS_SET, QGC_PAYLOADS_POLL][mode]
-        leni = 0
-        for _, typ in dic[identity].items():
-            siz = attsiz(typ)
-            if siz > 0:
-                leni += siz
-            else:
-                return -1
-        return leni
-    except (IndexError, ValueError):
+        return PAYLOAD_LENGTHS[mode][identity]
+    except IndexError:
         return -1
 
 
@@ -258,7 +316,7 @@ def isvalid_checksum(message: bytes) -> bool:
 
     lenm = len(message)
     ckm = message[lenm - 2 : lenm]
-    return ckm == calc_checksum(message[2 : lenm - 2])
+    return ckm == calc_checksum(memoryview(message)[2 : lenm - 2])
 
 
 def key_from_val(dictionary: dict, value) -> str:
@@ -347,3 +405,74 @@ def val2bytes(val: Any, adef: str) -> bytes:
             val = float(val * scaling)
         valb = struct.pack("<f" if attsiz(adef) == 4 else "<d", val)
     return valb
+
+
+def _payload_length(pdict: dict) -> int:
+    """
+    Calculate length of payload definition in bytes.
+
+    :param dict pdict: payload definition
+    :return: length in bytes or -1 if variable length (including
+        repeating groups)
+    :rtype: int
+    """
+
+    leni = 0
+    for typ in pdict.values():
+        siz = attsiz(typ) if isinstance(typ, str) else -1
+        if siz < 0:
+            return -1
+        leni += siz
+    return leni
+
+
+def _build_registry() -> tuple:
+    """
+    Build payload registry from payload definitions, once at import,
+    as the definitions do not change at runtime.
+
+    :return: tuple of (payload lengths, alternate payload definitions,
+        input modes) - see PAYLOAD_LENGTHS, PAYLOAD_VARIANTS, INPUT_MODES
+    :rtype: tuple
+    """
+
+    lengths = tuple(
+        {identity: _payload_length(pdict) for identity, pdict in payloads.items()}
+        for payloads in QGC_PAYLOADS
+    )
+    variants = {}
+    for (identity, mode), alternate in ALTERNATE_PAYLOADS.items():
+        variants[(identity, mode, lengths[mode][alternate])] = QGC_PAYLOADS[mode][
+            alternate
+        ]
+    modes = {}
+    for key, identity in QGC_MSGIDS.items():
+        setlens = {
+            leni
+            for (ident, mode, leni) in variants
+            if ident == identity and mode == SET
+        }
+        setlens.add(lengths[SET].get(identity, -1))
+        polllens = {
+            leni
+            for (ident, mode, leni) in variants
+            if ident == identity and mode == POLL
+        }
+        polllens.add(lengths[POLL].get(identity, -1))
+        for leni in polllens - setlens:
+            if leni >= 0:
+                modes[key + val2bytes(leni, U2)] = POLL
+    return lengths, variants, modes
+
+
+PAYLOAD_LENGTHS, PAYLOAD_VARIANTS, INPUT_MODES = _build_registry()
+"""
+Payload registry, built once at import:
+
+- PAYLOAD_LENGTHS - payload length in bytes (-1 = variable length),
+  keyed on identity, indexed on message mode (GET, SET, POLL)
+- PAYLOAD_VARIANTS - alternate payload definitions, keyed on
+  (identity, mode, payload length)
+- INPUT_MODES - POLL, keyed on raw msggrp + msgid + length bytes, for
+  input messages whose length only matches a POLL definition
+"""
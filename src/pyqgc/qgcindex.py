@@ -0,0 +1,418 @@
+"""
+QGCIndex class.
+
+Persistent frame index for QGC, NMEA and RTCM3 binary log files.
+
+A single pass over the log (using QGCFileReader's framing, without
+parsing) records, for every frame, its byte offset, length, protocol,
+identity and, for message types which have them (e.g. NAV-*), the GPS
+week number 'wn' and time of week 'tow'. The index is held in compact
+typed arrays and can be saved to, and reloaded from, a sidecar file,
+so subsequent queries need not rescan the log e.g.::
+
+    idx = QGCIndex.open("capture.log")  # load sidecar, or build and save it
+    # or explicitly: QGCIndex("capture.log").build().save()
+    frames = idx.select(identity="NAV-TAR", tow=(565359000, 565360000))
+    for raw_data, parsed_data in idx.read(frames):
+        print(parsed_data)
+    raw_data, parsed_data = next(idx.read([idx.nth("SEN-IMU", 9999)]))
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import json
+import os
+import sys
+from array import array
+
+from pyqgc.exceptions import QGCStreamError
+from pyqgc.qgccodec import get_codec
+from pyqgc.qgcfilereader import QGCFileReader, _BoundedFileReader
+from pyqgc.qgcmessage import payload_dict
+from pyqgc.qgctypes_core import (
+    GET,
+    NMEA_PROTOCOL,
+    QGC_MSGIDS,
+    QGC_PROTOCOL,
+    RTCM3_PROTOCOL,
+)
+
+INDEX_VERSION = 2
+"""Sidecar file format version"""
+
+INDEX_SUFFIX = ".qgcidx"
+"""Default sidecar file suffix, appended to log file name"""
+
+INDEX_COLUMNS = (
+    ("offset", "Q"),
+    ("length", "I"),
+    ("protocol", "B"),
+    ("ident", "H"),
+    ("wn", "H"),
+    ("tow", "I"),
+)
+"""Index column names and array typecodes, in sidecar file order"""
+
+NOWN = 0xFFFF
+"""Column value signifying frame has no 'wn' attribute"""
+NOTOW = 0xFFFFFFFF
+"""Column value signifying frame has no 'tow' attribute"""
+
+
+class QGCIndex:
+    """
+    QGCIndex class.
+    """
+
+    def __init__(self, filename: str):
+        """Constructor.
+
+        Creates an empty index - use build() or load() to populate the
+        index from the log file or its sidecar file, or the open()
+        class method to do either as appropriate.
+
+        :param str filename: path of binary log file
+        """
+
+        self._filename = filename
+        self._identities = []  # identity table
+        self._idents = {}  # identity -> identity table index
+        self._cols = {name: array(typ) for name, typ in INDEX_COLUMNS}
+        # msggrp + msgid -> (payload size, wn field, tow field) or None
+        self._timing = {}
+
+    def build(
+        self, protfilter: int = NMEA_PROTOCOL | QGC_PROTOCOL | RTCM3_PROTOCOL
+    ) -> "QGCIndex":
+        """
+        Build index in a single pass over log file.
+
+        :param int protfilter: NMEA_PROTOCOL (1), QGC_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :return: index
+        :rtype: QGCIndex
+        """
+        # pylint: disable=too-many-locals
+
+        cols = {name: array(typ) for name, typ in INDEX_COLUMNS}
+        offsets = cols["offset"].append
+        lengths = cols["length"].append
+        protocols = cols["protocol"].append
+        idents = cols["ident"].append
+        wns = cols["wn"].append
+        tows = cols["tow"].append
+        with QGCFileReader(self._filename, protfilter=protfilter, parsing=False) as qfr:
+            for raw, _ in qfr:
+                size = len(raw)
+                protocol, identity, wn, tow = self._describe(raw)
+                offsets(qfr.tell() - size)
+                lengths(size)
+                protocols(protocol)
+                idents(self._ident(identity))
+                wns(wn)
+                tows(tow)
+        self._cols = cols
+        return self
+
+    def _describe(self, raw: bytes) -> tuple:
+        """
+        Get protocol, identity and timing of raw frame, without parsing.
+
+        :param bytes raw: raw frame
+        :return: tuple of (protocol, identity, wn, tow)
+        :rtype: tuple
+        """
+
+        if raw[0] == 0x51:  # QGC
+            key = raw[2:4]
+            identity = QGC_MSGIDS.get(key, f"UNKNOWN-{key.hex()}-NOMINAL")
+            timing = self._timing.get(key, False)
+            if timing is False:  # first frame of this type
+                try:
+                    codec = get_codec(payload_dict(identity, GET, len(raw) - 8))
+                except KeyError:
+                    codec = None
+                timing = None
+                if codec is not None and "tow" in codec.fields:
+                    timing = (codec.size, codec.fields.get("wn"), codec.fields["tow"])
+                self._timing[key] = timing
+            wn, tow = NOWN, NOTOW
+            # decode wn and tow directly from their payload offsets
+            if timing is not None and len(raw) - 8 == timing[0]:
+                if timing[1] is not None:
+                    wn = timing[1][1].unpack_from(raw, 6 + timing[1][0])[0]
+                tow = timing[2][1].unpack_from(raw, 6 + timing[2][0])[0]
+            return QGC_PROTOCOL, identity, wn, tow
+        if raw[0] == 0x24:  # NMEA - identity is address field e.g. 'GNGGA'
+            identity = raw[1 : raw.find(b",")].decode("ascii", errors="replace")
+            return NMEA_PROTOCOL, identity, NOWN, NOTOW
+        # RTCM3 - identity is message number e.g. '1005'
+        return RTCM3_PROTOCOL, str((raw[3] << 4) | (raw[4] >> 4)), NOWN, NOTOW
+
+    def _ident(self, identity: str) -> int:
+        """
+        Get index of identity in identity table, adding it if necessary.
+
+        :param str identity: message identity
+        :return: identity table index
+        :rtype: int
+        """
+
+        ident = self._idents.get(identity)
+        if ident is None:
+            ident = self._idents[identity] = len(self._identities)
+            self._identities.append(identity)
+        return ident
+
+    def save(self, idxfile: str = None) -> str:
+        """
+        Save index to sidecar file.
+
+        The file comprises a single line JSON header, followed by
+        each index column as a packed binary array.
+
+        :param str idxfile: path of sidecar file (log file name + '.qgcidx')
+        :return: path of sidecar file
+        :rtype: str
+        """
+
+        idxfile = self._filename + INDEX_SUFFIX if idxfile is None else idxfile
+        stat = os.stat(self._filename)
+        header = {
+            "version": INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "filesize": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "count": len(self),
+            "identities": self._identities,
+        }
+        with open(idxfile, "wb") as stream:
+            stream.write(json.dumps(header).encode("utf-8") + b"\n")
+            for name, _ in INDEX_COLUMNS:
+                self._cols[name].tofile(stream)
+        return idxfile
+
+    def load(self, idxfile: str = None) -> "QGCIndex":
+        """
+        Load index from sidecar file.
+
+        :param str idxfile: path of sidecar file (log file name + '.qgcidx')
+        :return: index
+        :rtype: QGCIndex
+        :raises: QGCStreamError if sidecar file is invalid or out of date
+        :raises: OSError if sidecar file cannot be read
+        """
+
+        idxfile = self._filename + INDEX_SUFFIX if idxfile is None else idxfile
+        cols = {name: array(typ) for name, typ in INDEX_COLUMNS}
+        with open(idxfile, "rb") as stream:
+            try:
+                header = json.loads(stream.readline())
+                if header["version"] != INDEX_VERSION:
+                    raise ValueError(f"unsupported version {header['version']}")
+                stat = os.stat(self._filename)
+                if (header["filesize"], header["mtime"]) != (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ):
+                    raise ValueError(
+                        f"{self._filename} has changed since it was indexed"
+                    )
+                for name, _ in INDEX_COLUMNS:
+                    cols[name].fromfile(stream, header["count"])
+            except (ValueError, KeyError, EOFError) as err:
+                raise QGCStreamError(f"Invalid index file {idxfile} - {err}") from err
+        if header["byteorder"] != sys.byteorder:
+            for col in cols.values():
+                col.byteswap()
+        self._cols = cols
+        self._identities = []
+        self._idents = {}
+        for identity in header["identities"]:
+            self._ident(identity)
+        return self
+
+    @classmethod
+    def open(
+        cls,
+        filename: str,
+        idxfile: str = None,
+        protfilter: int = NMEA_PROTOCOL | QGC_PROTOCOL | RTCM3_PROTOCOL,
+    ) -> "QGCIndex":
+        """
+        Load index from sidecar file if it is present and up to date,
+        otherwise build index and save it to sidecar file.
+
+        :param str filename: path of binary log file
+        :param str idxfile: path of sidecar file (log file name + '.qgcidx')
+        :param int protfilter: protocol filter if index is built (7)
+        :return: index
+        :rtype: QGCIndex
+        """
+
+        idx = cls(filename)
+        try:
+            return idx.load(idxfile)
+        except (OSError, QGCStreamError):
+            idx.build(protfilter).save(idxfile)
+            return idx
+
+    def __len__(self) -> int:
+        """
+        Number of frames in index.
+
+        :return: number of frames
+        :rtype: int
+        """
+
+        return len(self._cols["offset"])
+
+    def __getitem__(self, frame: int) -> tuple:
+        """
+        Get index entry for frame.
+
+        :param int frame: frame number
+        :return: tuple of (offset, length, protocol, identity, wn, tow),
+            where wn and tow are None if not applicable
+        :rtype: tuple
+        :raises: IndexError if frame number is out of range
+        """
+
+        cols = self._cols
+        wn = cols["wn"][frame]
+        tow = cols["tow"][frame]
+        return (
+            cols["offset"][frame],
+            cols["length"][frame],
+            cols["protocol"][frame],
+            self._identities[cols["ident"][frame]],
+            None if wn == NOWN else wn,
+            None if tow == NOTOW else tow,
+        )
+
+    def select(
+        self,
+        identity: str = None,
+        protocol: int = None,
+        wn: int = None,
+        tow: tuple = None,
+    ) -> list:
+        """
+        Select frames matching all specified criteria.
+
+        :param str identity: message identity e.g. 'NAV-TAR' (None = any)
+        :param int protocol: NMEA_PROTOCOL (1), QGC_PROTOCOL (2),
+            RTCM3_PROTOCOL (4), can be OR'd (None = any)
+        :param int wn: GPS week number (None = any)
+        :param tuple tow: inclusive (start, end) time of week range, in
+            message 'tow' units (None = any)
+        :return: list of matching frame numbers, in log order
+        :rtype: list
+        """
+
+        cols = self._cols
+        frames = range(len(self))
+        if identity is not None:
+            ident = self._idents.get(identity)
+            frames = [i for i in frames if cols["ident"][i] == ident]
+        if protocol is not None:
+            frames = [i for i in frames if cols["protocol"][i] & protocol]
+        if wn is not None:
+            frames = [i for i in frames if cols["wn"][i] == wn]
+        if tow is not None:
+            start, end = tow
+            frames = [
+                i
+                for i in frames
+                if cols["tow"][i] != NOTOW and start <= cols["tow"][i] <= end
+            ]
+        return list(frames)
+
+    def nth(self, identity: str, num: int) -> int:
+        """
+        Get frame number of nth (zero-based) occurrence of message identity.
+
+        :param str identity: message identity e.g. 'SEN-IMU'
+        :param int num: occurrence number, starting at 0
+        :return: frame number
+        :rtype: int
+        :raises: IndexError if there are not enough occurrences
+        """
+
+        ident = self._idents.get(identity)
+        for i, val in enumerate(self._cols["ident"]):
+            if val == ident:
+                if num == 0:
+                    return i
+                num -= 1
+        raise IndexError(f"Fewer occurrences of {identity} than requested")
+
+    def read(self, frames: list, **kwargs):
+        """
+        Generator yielding raw and parsed data for specified frames,
+        read directly from their indexed offsets in the log file.
+
+        Only the single frame starting at each indexed offset is read -
+        the following frame is never substituted for it. The index is
+        built without validating checksums, so a frame which fails
+        validation when read (or no longer starts at its indexed offset)
+        is reported once, handled according to 'quitonerror', and omitted.
+        A frame excluded by 'protfilter' or 'msgfilter' is omitted silently.
+
+        :param list frames: frame numbers
+        :param kwargs: optional QGCFileReader keyword arguments
+        :return: generator of (raw_data as bytes, parsed_data)
+        :rtype: generator
+        :raises: Exception (if invalid frame and quitonerror = ERR_RAISE (2))
+        """
+        # pylint: disable=protected-access
+
+        offsets = self._cols["offset"]
+        lengths = self._cols["length"]
+        with _BoundedFileReader(self._filename, **kwargs) as qfr:
+            for frame in frames:
+                offset = offsets[frame]
+                qfr.bound(offset, offset + 1)  # no frame starting after offset
+                errors = sum(qfr._errors.values())
+                skipped = qfr._skipped
+                raw_data, parsed_data = qfr.read()
+                if raw_data is not None:
+                    yield raw_data, parsed_data
+                elif sum(qfr._errors.values()) != errors:
+                    continue  # already reported by reader
+                elif qfr._skipped == skipped and qfr.tell() == offset + lengths[frame]:
+                    continue  # filtered
+                else:
+                    err = QGCStreamError(
+                        f"Frame {frame} at offset {offset} is invalid "
+                        "or has changed since it was indexed"
+                    )
+                    qfr._count_error(err)
+                    if qfr._quitonerror:
+                        qfr._do_error(err)
+
+    @property
+    def filename(self) -> str:
+        """
+        Getter for log file name.
+
+        :return: log file name
+        :rtype: str
+        """
+
+        return self._filename
+
+    @property
+    def identities(self) -> list:
+        """
+        Getter for distinct message identities in index.
+
+        :return: list of identities, in order of first occurrence
+        :rtype: list
+        """
+
+        return list(self._identities)
@@ -0,0 +1,283 @@
+"""
+QGCLatency class.
+
+Opt-in tracking of the latency from the arrival of the last byte of each
+frame to the return of the parsed message, e.g.::
+
+    qgr = QGCReader(serial, latency=True)
+    for raw_data, parsed_data in qgr:
+        ...
+    print(qgr.latency)  # or qgr.latency.report()["NAV-POS"]["p99"]
+
+Each chunk of data read from the stream (or pushed into QGCParser via
+feed()) is timestamped with time.perf_counter_ns(). When read() returns a
+message, the time since the chunk containing its last byte arrived is
+added to a log-bucketed (HDR-style) histogram for its identity. Latency
+therefore includes any time the frame waits in the buffer behind
+preceding frames, as well as framing and parsing.
+
+Histograms have a resolution of at worst 1/16 (6.25%) of the recorded
+value and at most a few hundred buckets each, so memory is bounded however
+many messages are recorded.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from collections import deque
+from time import perf_counter_ns
+
+from pyqgc.qgctypes_core import QGC_MSGIDS
+
+SUBBITS = 5
+"""Sub-bucket bits - each power of 2 is divided into 2**(SUBBITS-1) buckets"""
+PERCENTILES = {"p50": 50.0, "p90": 90.0, "p99": 99.0, "p999": 99.9}
+"""Percentiles included in reports"""
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed histogram of non-negative integer values (e.g. nanoseconds).
+
+    Values below 2**SUBBITS are recorded exactly. Larger values are recorded
+    in one of 2**(SUBBITS-1) equal-width buckets per power of 2, so each
+    reported value is within 1/2**(SUBBITS-1) of the true value.
+    """
+
+    def __init__(self):
+        """Constructor."""
+
+        self._counts = []  # grown on demand, bounded by max value recorded
+        self._count = 0
+        self._total = 0
+        self._min = None
+        self._max = None
+
+    @staticmethod
+    def bucket(value: int) -> int:
+        """
+        Get bucket index for value.
+
+        :param int value: value
+        :return: bucket index
+        :rtype: int
+        """
+
+        if value < 1 << SUBBITS:
+            return max(value, 0)
+        shift = value.bit_length() - SUBBITS
+        return (shift << (SUBBITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def bucket_value(index: int) -> int:
+        """
+        Get highest value recorded in bucket.
+
+        :param int index: bucket index
+        :return: highest equivalent value
+        :rtype: int
+        """
+
+        if index < 1 << SUBBITS:
+            return index
+        shift = (index >> (SUBBITS - 1)) - 1
+        sub = index - (shift << (SUBBITS - 1))
+        return ((sub + 1) << shift) - 1
+
+    def record(self, value: int):
+        """
+        Record value.
+
+        :param int value: value
+        """
+
+        idx = self.bucket(value)
+        counts = self._counts
+        if idx >= len(counts):
+            counts.extend([0] * (idx + 1 - len(counts)))
+        counts[idx] += 1
+        self._count += 1
+        self._total += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def percentile(self, pct: float) -> int:
+        """
+        Get value at percentile.
+
+        :param float pct: percentile e.g. 99.9
+        :return: value at percentile (highest equivalent value of its
+            bucket, capped at maximum recorded), or 0 if no values recorded
+        :rtype: int
+        """
+
+        if not self._count:
+            return 0
+        target = max(1, -(-self._count * pct // 100))  # ceiling
+        seen = 0
+        for idx, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_value(idx), self._max)
+        return self._max  # pragma: no cover
+
+    @property
+    def count(self) -> int:
+        """
+        Getter for number of values recorded.
+
+        :return: count
+        :rtype: int
+        """
+
+        return self._count
+
+    def summary(self) -> dict:
+        """
+        Get summary statistics.
+
+        :return: dict of count, min, max, mean and PERCENTILES
+        :rtype: dict
+        """
+
+        summary = {
+            "count": self._count,
+            "min": self._min or 0,
+            "max": self._max or 0,
+            "mean": self._total / self._count if self._count else 0,
+        }
+        for name, pct in PERCENTILES.items():
+            summary[name] = self.percentile(pct)
+        return summary
+
+
+class QGCLatency:
+    """
+    QGCLatency class.
+    """
+
+    def __init__(self):
+        """Constructor."""
+
+        self._received = 0  # cumulative bytes received
+        # (cumulative bytes received at end of chunk, arrival time in ns)
+        # for each chunk not yet fully consumed
+        self._arrivals = deque()
+        # (msggrp + msgid) bytes for QGC, identity for NMEA and RTCM3 -> histogram
+        self._hists = {}
+
+    def arrived(self, size: int):
+        """
+        Timestamp arrival of chunk of data.
+
+        :param int size: chunk size in bytes
+        """
+
+        self._received += size
+        self._arrivals.append((self._received, perf_counter_ns()))
+
+    def wrap_read(self, read, unread):
+        """
+        Wrap reader read() method so that the latency of each message
+        returned is recorded.
+
+        :param read: bound read() method
+        :param unread: function returning number of unconsumed bytes
+            held by the reader
+        :return: wrapped method
+        :rtype: function
+        """
+
+        arrivals = self._arrivals
+
+        def wrapped() -> tuple:
+            raw_data, parsed_data = read()
+            if raw_data is not None:
+                now = perf_counter_ns()
+                end = self._received - unread()  # offset after last byte
+                while arrivals and arrivals[0][0] < end:
+                    arrivals.popleft()  # chunk fully consumed
+                if arrivals:
+                    if raw_data[0:2] == b"QG":
+                        key = raw_data[2:4]
+                    else:
+                        key = getattr(
+                            parsed_data,
+                            "identity",
+                            "NMEA" if raw_data[0:1] == b"$" else "RTCM3",
+                        )
+                    hist = self._hists.get(key)
+                    if hist is None:
+                        hist = self._hists[key] = LatencyHistogram()
+                    hist.record(now - arrivals[0][1])
+            return (raw_data, parsed_data)
+
+        return wrapped
+
+    def histograms(self) -> dict:
+        """
+        Get latency histograms.
+
+        :return: dict of LatencyHistogram, keyed on message identity
+        :rtype: dict
+        """
+
+        hists = {}
+        for key, hist in self._hists.items():
+            if isinstance(key, bytes):
+                key = QGC_MSGIDS.get(key, f"UNKNOWN-{key.hex()}-NOMINAL")
+            hists[key] = hist
+        return hists
+
+    def report(self) -> dict:
+        """
+        Get latency report.
+
+        :return: dict keyed on message identity, of dicts of count and
+            min, max, mean and percentile (e.g. 'p99') latency in nanoseconds
+        :rtype: dict
+        """
+
+        return {key: hist.summary() for key, hist in self.histograms().items()}
+
+    def reset(self):
+        """
+        Discard all recorded latencies.
+        """
+
+        self._hists = {}
+
+    def __str__(self) -> str:
+        """
+        Human readable report, one line per identity, in microseconds.
+
+        :return: report
+        :rtype: str
+        """
+
+        cols = ("min", "mean") + tuple(PERCENTILES) + ("max",)
+        lines = [
+            f"{'identity':<20}{'count':>10}"
+            + "".join(f"{col + ' µs':>12}" for col in cols)
+        ]
+        for identity, summary in sorted(self.report().items()):
+            lines.append(
+                f"{identity:<20}{summary['count']:>10}"
+                + "".join(f"{summary[col] / 1e3:>12.1f}" for col in cols)
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        :return: representation
+        :rtype: str
+        """
+
+        return f"QGCLatency({ {key: hist.count for key, hist in self.histograms().items()} })"
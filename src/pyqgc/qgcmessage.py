@@ -12,10 +12,15 @@ Created on 26 Sep 2020
 
 # pylint: disable=too-many-positional-arguments, too-many-locals, too-many-arguments
 
+from collections import deque
+from itertools import repeat
 from types import NoneType
 
 from pyqgc.exceptions import QGCMessageError
+from pyqgc.qgccodec import get_codec
 from pyqgc.qgchelpers import (
+    PAYLOAD_VARIANTS,
+    QGC_PAYLOADS,
     attsiz,
     bytes2val,
     calc_checksum,
@@ -35,14 +40,43 @@ from pyqgc.qgctypes_core import (
     U2,
     VERSTR,
 )
-from pyqgc.qgctypes_get import QGC_PAYLOADS_GET
-from pyqgc.qgctypes_poll import QGC_PAYLOADS_POLL
-from pyqgc.qgctypes_set import QGC_PAYLOADS_SET
 
 
-class QGCMessage:
+class _InstanceDict:  # pylint: disable=too-few-public-methods
+    """
+    Base class holding the QGCMessage instance __dict__, so that
+    QGCMessage can override __dict__ with a property.
+    """
+
+    __slots__ = ("__dict__",)
+
+
+_getdict = _InstanceDict.__dict__["__dict__"].__get__  # underlying instance __dict__
+
+
+class QGCMessage(_InstanceDict):
     """QGC Message Class."""
 
+    # private state is held in slots; public payload attributes are held
+    # in the instance __dict__, or in slots for compact subclasses
+    __slots__ = (
+        "_immutable",
+        "_mode",
+        "_length",
+        "_lengthint",
+        "_checksum",
+        "_msggrp",
+        "_msgid",
+        "_parsebf",
+        "_payload",
+        "_offset",
+        "_index",
+        "_suffix",
+        "_lazy",
+    )
+
+    _fields = None  # public attribute names of compact subclass
+
     def __init__(
         self,
         msggrp: bytes,
@@ -51,6 +85,7 @@ class QGCMessage:
         length: bytes | NoneType = None,
         msgmode: int = GET,
         parsebitfield: bool = True,
+        lazy: bool = False,
         **kwargs,
     ):
         """Constructor.
@@ -63,12 +98,17 @@ class QGCMessage:
         Otherwise, any named attributes will be assigned the value given, all others will
         be assigned a nominal value according to type.
 
+        If 'lazy' is True and 'payload' is passed for a fixed-layout message type, the
+        payload is not decoded on instantiation; each attribute is instead decoded from
+        its precomputed payload offset on first access, and cached.
+
         :param object msggrp: message group
         :param object msgID: message ID
         :param bytes checksum: checksum (will be derived if None)
         :param bytes length: payload length (will be derived if None)
         :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
         :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+        :param bool lazy: decode payload attributes on first access Y/N
         :param kwargs: optional payload keyword arguments
         :raises: QGCMessageError
         """
@@ -77,25 +117,39 @@ class QGCMessage:
             raise QGCMessageError(f"Invalid msgmode {msgmode} - must be 0, 1 or 2")
 
         # object is mutable during initialisation only
-        super().__setattr__("_immutable", False)
-        self._mode = msgmode
-        self._length = length  # bytes
-        if length is None:
-            self._lengthint = 0
-        else:
-            self._lengthint = bytes2val(length, U2)  # integer
-        self._checksum = checksum  # bytes
-        self._msggrp = msggrp
-        self._msgid = msgid
-        self._parsebf = parsebitfield  # parsing bitfields Y/N?
-        self._payload = kwargs.get("payload", b"")
-        self._offset = 0  # payload offset in bytes
-        self._index = []  # array of (nested) group indices
-        self._suffix = ""  # attribute index suffix ("_01", "_02", etc.)
+        # (private state is set directly, bypassing __setattr__)
+        setatt = object.__setattr__
+        setatt(self, "_immutable", False)
+        setatt(self, "_mode", msgmode)
+        setatt(self, "_length", length)  # bytes
+        setatt(  # integer
+            self,
+            "_lengthint",
+            0 if length is None else int.from_bytes(length, "little"),
+        )
+        setatt(self, "_checksum", checksum)  # bytes
+        setatt(self, "_msggrp", msggrp)
+        setatt(self, "_msgid", msgid)
+        setatt(self, "_parsebf", parsebitfield)  # parsing bitfields Y/N?
+        setatt(self, "_payload", kwargs.get("payload", b""))
+        setatt(self, "_offset", 0)  # payload offset in bytes
+        setatt(self, "_index", [])  # array of (nested) group indices
+        setatt(self, "_suffix", "")  # attribute index suffix ("_01", "_02", etc.)
+        setatt(self, "_lazy", None)  # codec for as yet undecoded payload
 
         pdict = self._get_dict(**kwargs)  # get appropriate payload dict
-        for anam in pdict:  # process each attribute in dict
-            self._set_attribute(anam, pdict, **kwargs)
+        codec = get_codec(pdict) if "payload" in kwargs else None
+        if codec is not None and codec.size == len(self._payload):
+            if lazy:  # defer decoding until attributes are accessed
+                self._lazy = codec
+            elif self._fields is None:  # decode in a single unpack operation
+                _getdict(self).update(codec.decode(self._payload))
+            else:  # compact subclass - decode into slots
+                _fill_slots(self, codec.names, codec.values(self._payload))
+            self._offset = codec.size
+        else:
+            for anam in pdict:  # process each attribute in dict
+                self._set_attribute(anam, pdict, **kwargs)
         self._do_len_checksum()
 
         self._immutable = True  # once initialised, object is immutable
@@ -305,6 +359,7 @@ class QGCMessage:
         Calculate and format payload length and checksum as bytes,
         if not passed as input arguments.
         """
+        # pylint: disable=access-member-before-definition
 
         payload = b"" if self._payload is None else self._payload
         if self._length is None:
@@ -326,28 +381,7 @@ class QGCMessage:
         """
 
         try:
-            if self._mode == POLL:
-                pdict = QGC_PAYLOADS_POLL[self.identity]
-                # alternate definitions
-                if self.identity == "CFG-MSG" and self._lengthint == 5:
-                    pdict = QGC_PAYLOADS_POLL[f"{self.identity}-INTF"]
-            elif self._mode == SET:
-                pdict = QGC_PAYLOADS_SET[self.identity]
-                # alternate definitions
-                if self.identity == "CFG-MSG" and self._lengthint == 7:
-                    pdict = QGC_PAYLOADS_SET[f"{self.identity}-INTF"]
-                elif self.identity == "CFG-UART" and self._lengthint == 2:
-                    pdict = QGC_PAYLOADS_SET[f"{self.identity}-DIS"]
-            else:
-                # Unknown GET message, parsed to nominal definition
-                if self.identity[-7:] == "NOMINAL":
-                    pdict = {}
-                else:
-                    pdict = QGC_PAYLOADS_GET[self.identity]
-                    # alternate definitions
-                    if self.identity == "CFG-MSG" and self._lengthint == 7:
-                        pdict = QGC_PAYLOADS_GET[f"{self.identity}-INTF"]
-            return pdict
+            return payload_dict(self.identity, self._mode, self._lengthint)
         except KeyError as err:
             mode = ["GET", "SET", "POLL"][self._mode]
             raise QGCMessageError(
@@ -394,23 +428,19 @@ class QGCMessage:
         umsg_name = self.identity
         if self.payload is None:
             return f"<QGC({umsg_name})>"
+        self._decode_all()
         if self.identity[-7:] == "NOMINAL":
             return f"<QGC({umsg_name}, payload={escapeall(self._payload)})>"
 
-        stg = f"<QGC({umsg_name}, "
-        for i, att in enumerate(self.__dict__):
-            if att[0] != "_":  # only show public attributes
-                val = self.__dict__[att]
-                # escape all byte chars unless they're
-                # intended to be character strings
-                if isinstance(val, bytes):
-                    val = escapeall(val)
-                stg += att + "=" + str(val).rstrip()
-                if i < len(self.__dict__) - 1:
-                    stg += ", "
-        stg += ")>"
-
-        return stg
+        flds = []
+        for att, val in self._attributes():
+            # escape all byte chars unless they're
+            # intended to be character strings
+            if isinstance(val, bytes):
+                val = escapeall(val)
+            flds.append(att + "=" + str(val).rstrip())
+
+        return f"<QGC({umsg_name}, {', '.join(flds)})>"
 
     def __repr__(self) -> str:
         """
@@ -427,6 +457,133 @@ class QGCMessage:
             return f"QGCMessage({self._msggrp}, {self._msgid}, {self._mode}"
         return f"QGCMessage({self._msggrp}, {self._msgid}, {self._mode}, payload={self._payload})"
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickle support.
+
+        The object is pickled as its serialized (raw) form plus the
+        arguments needed to reparse it, rather than its decoded payload
+        attributes, and is rebuilt by reparsing on unpickling. Fixed-layout
+        payloads are decoded in a single unpack operation or, if the object
+        still has lazy attributes pending, rebuilt lazily.
+
+        :return: tuple of (restore function, arguments)
+        :rtype: tuple
+
+        """
+
+        return (
+            _restore,
+            (
+                self.serialize(),
+                self._mode,
+                self._parsebf,
+                self._fields is not None,
+                self._lazy is not None,
+            ),
+        )
+
+    def _reduce_state(self) -> tuple:
+        """
+        Alternative pickle support, used where the unpickling process
+        should not have to decode the payload (e.g. parse_file_parallel()).
+
+        The object is pickled as its serialized form plus its decoded
+        payload attributes, and is rebuilt on unpickling without decoding.
+        Objects with lazy attributes pending are pickled as per __reduce__.
+
+        :return: tuple of (restore function, arguments)
+        :rtype: tuple
+
+        """
+
+        if self._lazy is not None:
+            return self.__reduce__()
+        return (
+            _restore_state,
+            (
+                self.serialize(),
+                self._mode,
+                self._parsebf,
+                self._fields is not None,
+                dict(self._attributes()),
+            ),
+        )
+
+    def _attributes(self) -> list:
+        """
+        Get public payload attributes.
+
+        :return: list of (attribute name, value) pairs, in payload order
+        :rtype: list
+
+        """
+
+        if self._fields is None:
+            return [(att, val) for att, val in _getdict(self).items() if att[0] != "_"]
+        # compact subclass
+        return [
+            (att, getattr(self, att))
+            for att in self._fields  # pylint: disable=not-an-iterable
+        ]
+
+    def __getattr__(self, name: str):
+        """
+        Decode and cache lazy payload attribute on first access.
+
+        Only invoked if attribute is not already present.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError if no such attribute
+
+        """
+
+        codec = None if name[0] == "_" else self._lazy
+        if codec is not None:
+            field = codec.fields.get(name)
+            if field is not None:  # (offset, struct, conversion)
+                val = field[1].unpack_from(self._payload, field[0])[0]
+                if field[2] is not None:
+                    val = field[2](val)
+                object.__setattr__(self, name, val)
+                return val
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _decode_all(self):
+        """
+        Decode any lazy payload attributes not yet accessed,
+        in payload definition order.
+        """
+
+        codec = self._lazy
+        if codec is not None:
+            if self._fields is None:
+                attrs = _getdict(self)
+                for name in codec.names:  # discard any already cached
+                    attrs.pop(name, None)
+                attrs.update(codec.decode(self._payload))
+            else:  # compact subclass - slot order is fixed
+                _fill_slots(self, codec.names, codec.values(self._payload))
+            object.__setattr__(self, "_lazy", None)
+
+    @property
+    def __dict__(self) -> dict:
+        """
+        Instance attribute dict, as returned by vars(). Any lazy payload
+        attributes not yet accessed are decoded first.
+
+        :return: public payload attributes (empty for compact subclasses)
+        :rtype: dict
+
+        """
+
+        self._decode_all()
+        return _getdict(self)
+
     def __setattr__(self, name, value):
         """
         Override setattr to make object immutable after instantiation.
@@ -545,3 +702,203 @@ class QGCMessage:
         """
 
         return self._mode
+
+
+def _fill_slots(obj: object, names: tuple, vals: tuple):
+    """
+    Set attribute values directly, bypassing __setattr__.
+
+    :param object obj: object
+    :param tuple names: attribute names
+    :param tuple vals: attribute values
+    """
+
+    # map is consumed by a zero-length deque, so the loop runs in C
+    deque(map(object.__setattr__, repeat(obj), names, vals), 0)
+
+
+def _restore(
+    raw: bytes,
+    msgmode: int,
+    parsebitfield: bool,
+    compact: bool = False,
+    lazy: bool = False,
+) -> QGCMessage:
+    """
+    Restore pickled QGCMessage by reparsing its serialized form.
+
+    :param bytes raw: serialized message
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param bool compact: object is instance of compact subclass
+    :param bool lazy: decode payload attributes on first access
+    :return: restored object
+    :rtype: QGCMessage
+    """
+
+    msggrp = raw[2:3]
+    msgid = raw[3:4]
+    length = len(raw) - 8
+    cls = compact_class(msggrp, msgid, msgmode, length) if compact else QGCMessage
+    try:
+        codec = get_codec(payload_dict(QGC_MSGIDS[raw[2:4]], msgmode, length))
+    except KeyError:
+        codec = None
+    if codec is None or codec.size != length:  # reparse in full
+        return cls(
+            msggrp,
+            msgid,
+            raw[-2:],
+            raw[4:6],
+            msgmode,
+            parsebitfield,
+            payload=raw[6:-2],
+        )
+    # fixed-layout payload - set private state directly, bypassing
+    # __init__, then decode payload attributes now or on first access
+    payload = raw[6:-2]
+    obj = object.__new__(cls)
+    _fill_slots(
+        obj,
+        QGCMessage.__slots__,
+        (
+            True,
+            msgmode,
+            raw[4:6],
+            length,
+            raw[-2:],
+            msggrp,
+            msgid,
+            parsebitfield,
+            payload,
+            length,
+            [],
+            "",
+            codec if lazy else None,
+        ),
+    )
+    if not lazy:
+        if cls is QGCMessage:
+            _getdict(obj).update(codec.decode(payload))
+        else:  # compact subclass
+            _fill_slots(obj, codec.names, codec.values(payload))
+    return obj
+
+
+def _restore_state(
+    raw: bytes, msgmode: int, parsebitfield: bool, compact: bool, attrs: dict
+) -> QGCMessage:
+    """
+    Restore QGCMessage pickled with its decoded payload attributes,
+    without reparsing its serialized form.
+
+    :param bytes raw: serialized message
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param bool parsebitfield: parse bitfields ('X' type attributes) Y/N
+    :param bool compact: object is instance of compact subclass
+    :param dict attrs: public payload attributes, in payload order
+    :return: restored object
+    :rtype: QGCMessage
+    """
+
+    msggrp = raw[2:3]
+    msgid = raw[3:4]
+    length = len(raw) - 8
+    cls = compact_class(msggrp, msgid, msgmode, length) if compact else QGCMessage
+    obj = object.__new__(cls)
+    _fill_slots(
+        obj,
+        QGCMessage.__slots__,
+        (
+            True,
+            msgmode,
+            raw[4:6],
+            length,
+            raw[-2:],
+            msggrp,
+            msgid,
+            parsebitfield,
+            raw[6:-2],
+            length,
+            [],
+            "",
+            None,
+        ),
+    )
+    if cls is QGCMessage:
+        _getdict(obj).update(attrs)
+    else:  # compact subclass
+        _fill_slots(obj, attrs.keys(), attrs.values())
+    return obj
+
+
+_COMPACT = {}  # cache of compact subclasses, keyed on (msggrp + msgid, mode, length)
+
+
+def payload_dict(identity: str, msgmode: int = GET, length: int = 0) -> dict:
+    """
+    Get payload definition for message identity and mode (GET/SET/POLL),
+    allowing for alternate definitions distinguished by payload length.
+
+    :param str identity: message identity e.g. 'NAV-NAV'
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param int length: payload length
+    :return: dictionary representing payload definition
+    :rtype: dict
+    :raises: KeyError if message identity is not recognised for this mode
+    """
+
+    if msgmode not in (SET, POLL):
+        # Unknown GET message, parsed to nominal definition
+        if identity[-7:] == "NOMINAL":
+            return {}
+        msgmode = GET
+    # alternate definitions (see ALTERNATE_PAYLOADS)
+    pdict = PAYLOAD_VARIANTS.get((identity, msgmode, length))
+    if pdict is None:
+        pdict = QGC_PAYLOADS[msgmode][identity]
+    return pdict
+
+
+def compact_class(
+    msggrp: bytes, msgid: bytes, msgmode: int = GET, length: int = 0
+) -> type:
+    """
+    Get compact QGCMessage subclass for fixed-layout message type.
+
+    The subclass holds its public payload attributes in __slots__,
+    substantially reducing the memory retained by each parsed message.
+    It inherits the __dict__ slot of QGCMessage but never populates it,
+    so each instance carries only a null dict pointer (an empty dict is
+    created if __dict__ or vars() is accessed). Attribute names, values,
+    str() and serialize() output and immutability are unchanged.
+
+    Subclasses are generated from the payload definition on first
+    use and cached. Message types which are not fixed-layout, or whose
+    payload length does not match the definition, return QGCMessage.
+
+    :param bytes msggrp: message group
+    :param bytes msgid: message id
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param int length: payload length
+    :return: QGCMessage subclass, or QGCMessage
+    :rtype: type
+    """
+
+    key = (msggrp + msgid, msgmode, length)
+    cls = _COMPACT.get(key)
+    if cls is None:
+        cls = QGCMessage
+        identity = QGC_MSGIDS.get(key[0])
+        try:
+            codec = get_codec(payload_dict(identity, msgmode, length))
+        except (KeyError, TypeError):
+            codec = None
+        if codec is not None and codec.size == length:
+            cls = type(
+                f"QGCMessage_{identity.replace('-', '_')}",
+                (QGCMessage,),
+                {"__slots__": codec.names, "_fields": codec.names},
+            )
+        _COMPACT[key] = cls
+    return cls
@@ -0,0 +1,351 @@
+"""
+Columnar decoding of fixed-layout QGC messages using NumPy.
+
+Rather than instantiating a QGCMessage for each frame and reading its
+attributes back, the frames of a chosen identity (e.g. 'SEN-IMU') are
+collected from a buffer or log file and decoded all at once via a NumPy
+structured dtype derived from the payload definition, e.g.::
+
+    cols = decode_columns("capture.log", "NAV-POS")
+    print(cols["tow"], cols["lat"], cols["lon"])
+
+The result is a dict of column arrays, keyed on attribute name, in
+payload definition order (reserved attributes are omitted). Frames of an
+alternate payload definition (e.g. 'CFG-MSG-INTF', distinguished from
+'CFG-MSG' by payload length) are decoded separately, under the identity
+of that definition. Scaling is applied to scaled attributes.
+Odd-sized integer attributes (e.g. U3) are widened to 64 bits, while
+character strings, unparsed bitfields and integers wider than 8 bytes
+are left as fixed-length bytes.
+
+NumPy is an optional dependency - install with ``pip install pyqgc[numpy]``.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import mmap
+import os
+
+from pyqgc.exceptions import QGCMessageError
+from pyqgc.qgccodec import get_codec
+from pyqgc.qgchelpers import ALTERNATE_PAYLOADS, PAYLOAD_VARIANTS, attsiz, atttyp
+from pyqgc.qgcmessage import payload_dict
+from pyqgc.qgcparser import QGCParser
+from pyqgc.qgcreader import QGCReader
+from pyqgc.qgctypes_core import (
+    ERR_LOG,
+    GET,
+    POLL,
+    QGC_MSGIDS,
+    QGC_PROTOCOL,
+    SCALROUND,
+    SET,
+    VALCKSUM,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+NUMPY_CODES = {
+    ("U", 1): "u1",
+    ("U", 2): "<u2",
+    ("U", 4): "<u4",
+    ("U", 8): "<u8",
+    ("S", 1): "i1",
+    ("S", 2): "<i2",
+    ("S", 4): "<i4",
+    ("S", 8): "<i8",
+    ("R", 4): "<f4",
+    ("R", 8): "<f8",
+}
+"""NumPy dtype codes for natively supported attribute types"""
+VARIANT_IDENTITIES = {
+    alternate: identity for (identity, _), alternate in ALTERNATE_PAYLOADS.items()
+}
+"""Message identity of each alternate payload definition e.g. 'CFG-MSG-INTF'"""
+
+
+def decode_columns(
+    source: object,
+    identity: str,
+    msgmode: int = GET,
+    validate: int = VALCKSUM,
+    quitonerror: int = ERR_LOG,
+    errorhandler: object = None,
+) -> dict:
+    """
+    Decode every frame of a fixed-layout QGC message identity in a
+    data stream, buffer or log file to a dict of NumPy column arrays.
+
+    Frames of other identities, NMEA and RTCM3 messages are skipped
+    unparsed. Frames of an alternate payload definition are only decoded
+    if its identity is requested e.g. 'CFG-MSG-INTF' rather than 'CFG-MSG'.
+    Frames whose payload length does not match the payload definition,
+    or (if 'validate' is set) whose checksum is invalid, are discarded.
+
+    :param object source: data stream (with a read() method), buffer
+        (bytes, bytearray, memoryview) or log file path
+    :param str identity: message identity e.g. 'SEN-IMU', or identity of
+        alternate payload definition e.g. 'CFG-MSG-INTF'
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL) (0)
+    :param int validate: VALCKSUM (1) = discard frames with invalid checksum,
+        VALNONE (0) = ignore checksum (1)
+    :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+        ERR_RAISE (2) = (re)raise (1)
+    :param object errorhandler: error handling object or function (None)
+    :return: dict of column arrays, keyed on attribute name
+    :rtype: dict
+    :raises: QGCMessageError (if identity is not a fixed-layout message type)
+    :raises: ImportError (if NumPy is not installed)
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    frames = collect_frames(
+        source,
+        [identity],
+        msgmode,
+        quitonerror=quitonerror,
+        errorhandler=errorhandler,
+    )
+    return decode_frames(frames[identity], identity, msgmode, validate)
+
+
+def collect_frames(
+    source: object, identities: list = None, msgmode: int = GET, **kwargs
+) -> dict:
+    """
+    Collect raw QGC frames from a data stream, buffer or log file,
+    grouped by identity.
+
+    Frames whose payload length matches an alternate payload definition
+    are grouped under the identity of that definition e.g. 'CFG-MSG-INTF',
+    so that each group has a single payload definition.
+
+    A data stream is read incrementally, so only the frames collected
+    (rather than the whole stream) are held in memory.
+
+    :param object source: data stream (with a read() method), buffer
+        (bytes, bytearray, memoryview) or log file path
+    :param list identities: message identities to collect, including any
+        alternate payload definitions e.g. 'CFG-MSG-INTF' (None = all)
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL) (0)
+    :param kwargs: optional QGCParser or QGCReader keyword arguments e.g. 'quitonerror'
+    :return: dict of lists of raw frames, keyed on identity
+    :rtype: dict
+    """
+    # pylint: disable=too-many-locals
+
+    msgfilter = None
+    if identities is not None:
+        msgfilter = {VARIANT_IDENTITIES.get(idy, idy) for idy in identities}
+    if hasattr(source, "read"):  # read stream incrementally
+        msgs = QGCReader(
+            source,
+            msgmode=msgmode,
+            protfilter=QGC_PROTOCOL,
+            parsing=False,
+            msgfilter=msgfilter,
+            **kwargs,
+        )
+    else:
+        qgp = QGCParser(
+            msgmode=msgmode,
+            protfilter=QGC_PROTOCOL,
+            parsing=False,
+            msgfilter=msgfilter,
+            **kwargs,
+        )
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as stream:
+                if os.fstat(stream.fileno()).st_size == 0:  # cannot be mapped
+                    msgs = []
+                else:
+                    with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                        msgs, _ = qgp.parse_buffer(buf)
+        else:
+            msgs, _ = qgp.parse_buffer(source)
+
+    mode = msgmode if msgmode in (SET, POLL) else GET
+    frames = {} if identities is None else {identity: [] for identity in identities}
+    groups = {}  # (msggrp + msgid, payload length) -> frames
+    for raw, _ in msgs:
+        key = (raw[2:4], len(raw) - 8)
+        group = groups.get(key)
+        if group is None:
+            identity = QGC_MSGIDS.get(key[0], f"UNKNOWN-{key[0].hex()}-NOMINAL")
+            if (identity, mode, key[1]) in PAYLOAD_VARIANTS:
+                identity = ALTERNATE_PAYLOADS[(identity, mode)]
+            group = groups[key] = frames.setdefault(identity, [])
+        group.append(raw)
+    return frames
+
+
+def decode_frames(
+    frames: list, identity: str, msgmode: int = GET, validate: int = VALCKSUM
+) -> dict:
+    """
+    Decode raw frames of a single fixed-layout QGC message identity
+    to a dict of NumPy column arrays, in a single vectorised operation.
+
+    Frames whose payload length does not match the payload definition
+    are discarded as invalid, so frames of an alternate payload definition
+    must be decoded separately, as grouped by collect_frames().
+
+    :param list frames: raw frames (bytes), all of the same identity
+    :param str identity: message identity e.g. 'SEN-IMU', or identity of
+        alternate payload definition e.g. 'CFG-MSG-INTF'
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL) (0)
+    :param int validate: VALCKSUM (1) = discard frames with invalid checksum,
+        VALNONE (0) = ignore checksum (1)
+    :return: dict of column arrays, keyed on attribute name
+    :rtype: dict
+    :raises: QGCMessageError (if identity is not a fixed-layout message type)
+    :raises: ImportError (if NumPy is not installed)
+    """
+    # pylint: disable=too-many-locals
+
+    if np is None:
+        raise ImportError(
+            "NumPy is required for columnar decoding - "
+            "install with 'pip install pyqgc[numpy]'"
+        )
+    try:
+        pdict = payload_dict(identity, msgmode)
+    except KeyError:
+        pdict = None
+    codec = None if pdict is None else get_codec(pdict)
+    if codec is None:
+        raise QGCMessageError(f"{identity} is not a fixed-layout message type")
+
+    dtype, convs = frame_dtype(pdict)
+    data = b"".join(raw for raw in frames if len(raw) == dtype.itemsize)
+    recs = np.frombuffer(data, dtype=dtype)
+    if validate & VALCKSUM and len(recs):
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, dtype.itemsize)
+        recs = recs[_valid_checksums(rows)]
+
+    cols = {}
+    for anam in dtype.names:
+        col = recs[anam]
+        conv = convs.get(anam)
+        cols[anam] = np.ascontiguousarray(col) if conv is None else conv(col)
+    return cols
+
+
+def frame_dtype(pdict: dict) -> tuple:
+    """
+    Get NumPy structured dtype for complete frames of a fixed-layout
+    payload definition, with each attribute at its offset in the frame.
+
+    Attributes which are not natively supported by NumPy are mapped
+    to byte arrays; a conversion function is returned for each of
+    these and for each scaled attribute. Reserved attributes are omitted.
+
+    :param dict pdict: fixed-layout payload definition
+    :return: tuple of (structured dtype, dict of conversion functions
+        keyed on attribute name)
+    :rtype: tuple
+    """
+
+    names = []
+    formats = []
+    offsets = []
+    convs = {}
+    offset = 6  # hdr + grp + id + len
+    for anam, adef in pdict.items():
+        scaling = 1
+        if "*" in adef:
+            adef, scaling = adef.split("*", 1)
+            scaling = float(scaling)
+        typ = atttyp(adef)
+        siz = attsiz(adef)
+        if anam[0:8] != "reserved":  # don't bother with reserved attributes
+            fmt = NUMPY_CODES.get((typ, siz))
+            conv = None
+            if fmt is None:
+                if typ in ("U", "S") and siz < 8:  # odd-sized integer, widened
+                    fmt = ("u1", (siz,))
+                    conv = _conv_int(typ == "S", siz)
+                else:  # left as fixed-length bytes
+                    fmt = f"S{siz}"
+            if scaling != 1:
+                conv = _conv_scale(conv, scaling)
+            if conv is not None:
+                convs[anam] = conv
+            names.append(anam)
+            formats.append(fmt)
+            offsets.append(offset)
+        offset += siz
+    dtype = np.dtype(
+        {
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": offset + 2,  # + cksum
+        }
+    )
+    return dtype, convs
+
+
+def _valid_checksums(rows: "np.ndarray") -> "np.ndarray":
+    """
+    Validate checksums of equal-length frames.
+
+    check_a is the sum of the content bytes and check_b is the sum of
+    their prefix sums, i.e. each content byte weighted by its distance
+    from the end of the content (mod 256).
+
+    :param np.ndarray rows: 2D array of frames, one frame per row
+    :return: boolean mask of frames with valid checksum
+    :rtype: np.ndarray
+    """
+
+    content = rows[:, 2:-2].astype(np.uint32)
+    weights = np.arange(content.shape[1], 0, -1, dtype=np.uint32)
+    cka = content.sum(axis=1) & 0xFF
+    ckb = (content @ weights) & 0xFF
+    return (cka == rows[:, -2]) & (ckb == rows[:, -1])
+
+
+def _conv_int(signed: bool, siz: int):
+    """
+    Get conversion function widening odd-sized little-endian integer
+    byte arrays to 64 bits.
+
+    :param bool signed: signed integer
+    :param int siz: integer size in bytes
+    :return: conversion function
+    :rtype: function
+    """
+
+    shifts = 8 * np.arange(siz, dtype=np.uint64)
+
+    def conv(col):
+        col = (col.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+        if signed:
+            col = col.astype(np.int64)
+            col[col >= 1 << (8 * siz - 1)] -= 1 << (8 * siz)
+        return col
+
+    return conv
+
+
+def _conv_scale(conv, scaling: float):
+    """
+    Get conversion function applying scaling factor.
+
+    :param conv: preceding conversion function, or None
+    :param float scaling: scaling factor
+    :return: conversion function
+    :rtype: function
+    """
+
+    if conv is None:
+        return lambda col: np.round(col / scaling, SCALROUND)
+    return lambda col: np.round(conv(col) / scaling, SCALROUND)
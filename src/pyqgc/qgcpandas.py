@@ -0,0 +1,137 @@
+"""
+pandas DataFrame export of QGC data streams.
+
+Converts the fixed-layout QGC messages in a data stream, buffer or log
+file to one pandas DataFrame per message identity, e.g.::
+
+    dfs = to_dataframes("capture.log", identities=["NAV-POS", "SEN-IMU"])
+    print(dfs["NAV-POS"][["lat", "lon", "alt"]].describe())
+
+Each DataFrame is built directly from the NumPy columns produced by
+qgcnumpy.decode_frames(), so no QGCMessage objects are instantiated.
+Columns follow the payload definition order (reserved attributes are
+omitted). Rows of identities with 'wn' and 'tow' attributes (e.g. NAV-*)
+are indexed by GPS time, i.e. GPS epoch + week number + time of week;
+note that GPS time is not adjusted for leap seconds.
+
+pandas is an optional dependency - install with ``pip install pyqgc[pandas]``.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from pyqgc.qgccodec import get_codec
+from pyqgc.qgcmessage import payload_dict
+from pyqgc.qgcnumpy import collect_frames, decode_frames
+from pyqgc.qgctypes_core import ERR_LOG, GET, VALCKSUM
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+GPS_EPOCH = "1980-01-06"
+"""GPS time epoch (week 0, time of week 0)"""
+WEEK_MS = 604800000
+"""Milliseconds per GPS week"""
+
+
+def to_dataframes(
+    source: object,
+    identities: list = None,
+    msgmode: int = GET,
+    validate: int = VALCKSUM,
+    quitonerror: int = ERR_LOG,
+    errorhandler: object = None,
+) -> dict:
+    """
+    Convert fixed-layout QGC messages in a data stream, buffer or log
+    file to one pandas DataFrame per message identity.
+
+    Frames of identities which are not fixed-layout (e.g. INF-VER,
+    RAW-HASE6), NMEA and RTCM3 messages are skipped unparsed. Frames of
+    an alternate payload definition are converted to a separate DataFrame,
+    keyed on the identity of that definition e.g. 'CFG-MSG-INTF'.
+
+    :param object source: data stream (with a read() method), buffer
+        (bytes, bytearray, memoryview) or log file path. A data stream is
+        read incrementally, retaining only its raw QGC frames (of the
+        requested identities) until they are converted
+    :param list identities: message identities to convert e.g. ["NAV-POS"],
+        including any alternate payload definitions e.g. "CFG-MSG-INTF"
+        (None = all fixed-layout identities present)
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL) (0)
+    :param int validate: VALCKSUM (1) = discard frames with invalid checksum,
+        VALNONE (0) = ignore checksum (1)
+    :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+        ERR_RAISE (2) = (re)raise (1)
+    :param object errorhandler: error handling object or function (None)
+    :return: dict of DataFrames, keyed on identity
+    :rtype: dict
+    :raises: QGCMessageError (if a requested identity is not fixed-layout)
+    :raises: ImportError (if pandas is not installed)
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+
+    if pd is None:
+        raise ImportError(
+            "pandas is required for DataFrame export - "
+            "install with 'pip install pyqgc[pandas]'"
+        )
+    frames = collect_frames(
+        source,
+        identities,
+        msgmode,
+        quitonerror=quitonerror,
+        errorhandler=errorhandler,
+    )
+    dfs = {}
+    for identity, raws in frames.items():
+        if identities is None and not _isfixed(identity, msgmode, raws):
+            continue
+        dfs[identity] = to_dataframe(decode_frames(raws, identity, msgmode, validate))
+    return dfs
+
+
+def to_dataframe(cols: dict) -> "pd.DataFrame":
+    """
+    Convert dict of column arrays, as returned by qgcnumpy.decode_columns(),
+    to a pandas DataFrame, indexed by GPS time if 'wn' and 'tow' columns
+    are present.
+
+    :param dict cols: dict of column arrays, keyed on attribute name
+    :return: DataFrame
+    :rtype: pd.DataFrame
+    """
+
+    index = None
+    if "wn" in cols and "tow" in cols:
+        index = pd.DatetimeIndex(
+            pd.Timestamp(GPS_EPOCH)
+            + pd.to_timedelta(
+                cols["wn"].astype("int64") * WEEK_MS + cols["tow"], unit="ms"
+            ),
+            name="gpstime",
+        )
+    return pd.DataFrame(cols, index=index, copy=False)
+
+
+def _isfixed(identity: str, msgmode: int, raws: list) -> bool:
+    """
+    Check if identity is a fixed-layout message type.
+
+    :param str identity: message identity
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL)
+    :param list raws: raw frames of this identity
+    :return: fixed-layout Y/N
+    :rtype: bool
+    """
+
+    try:
+        pdict = payload_dict(identity, msgmode, len(raws[0]) - 8)
+    except KeyError:
+        return False
+    return get_codec(pdict) is not None
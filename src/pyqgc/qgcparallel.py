@@ -0,0 +1,152 @@
+"""
+Parallel multi-core parsing of large QGC, NMEA and RTCM3 log files.
+
+The file is split into chunks of approximately 'chunksize' bytes.
+Each chunk boundary is resynchronised to the first valid (checksummed)
+frame at or after it, using QGCFileReader.seek(), so no frame straddles
+two chunks. The chunks are then framed and parsed by QGCFileReader
+instances in a pool of worker processes, and the results streamed
+back in file order. Each worker stops at the end of its chunk, so
+frames excluded by 'protfilter' or 'msgfilter' are only framed once.
+QGC messages are passed back with their decoded payload attributes,
+so they are not decoded again in the calling process, which need only
+rebuild each message object. That cost (on the
+sample logs, around 20-45% of a sequential parse, depending on the mix
+of message types) is incurred serially, and so bounds the achievable
+speedup however many workers are used e.g.::
+
+    for raw_data, parsed_data in parse_file_parallel("capture.log", workers=16):
+        print(parsed_data)
+
+The output is identical to that of a sequential QGCReader pass over
+the same file, provided any 'errorhandler' is picklable (e.g. a
+module-level function), as it is invoked in the worker processes.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from pyqgc.qgcfilereader import QGCFileReader, _BoundedFileReader
+from pyqgc.qgcmessage import QGCMessage
+
+CHUNKSIZE = 4 * 2**20
+"""Default chunk size in bytes"""
+
+
+def parse_file_parallel(
+    filename: str, workers: int = None, chunksize: int = CHUNKSIZE, **kwargs
+):
+    """
+    Generator which parses a log file in parallel worker processes
+    and yields the raw and parsed data of each frame, in file order.
+
+    At most 2 chunks per worker are in progress or awaiting collection
+    at any time, so memory usage is bounded regardless of file size.
+
+    :param str filename: path of binary log file
+    :param int workers: number of worker processes (None = number of CPUs)
+    :param int chunksize: approximate chunk size in bytes (4 MB)
+    :param kwargs: optional QGCFileReader keyword arguments e.g. 'msgmode',
+        'protfilter', 'quitonerror', 'msgfilter'
+    :return: generator of (raw_data as bytes, parsed_data)
+    :rtype: generator
+    :raises: Exception (if a worker raises an error e.g. quitonerror = ERR_RAISE)
+    """
+
+    bounds = chunk_boundaries(filename, chunksize)
+    workers = os.cpu_count() if workers is None else workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start, end in zip(bounds, bounds[1:]):
+            if len(pending) >= workers * 2:
+                yield from _rebuild(pending.popleft().result())
+            pending.append(pool.submit(_parse_chunk, filename, start, end, kwargs))
+        while pending:
+            yield from _rebuild(pending.popleft().result())
+
+
+def chunk_boundaries(filename: str, chunksize: int = CHUNKSIZE) -> list:
+    """
+    Split log file into chunks, each starting at a valid frame boundary.
+
+    :param str filename: path of binary log file
+    :param int chunksize: approximate chunk size in bytes (4 MB)
+    :return: list of chunk offsets, starting with 0 and ending with file size
+    :rtype: list
+    """
+
+    with QGCFileReader(filename, parsing=False) as qfr:
+        bounds = [0]
+        for offset in range(chunksize, qfr.size, chunksize):
+            pos = qfr.seek(offset)
+            if pos > bounds[-1]:
+                bounds.append(pos)
+        if qfr.size > bounds[-1]:
+            bounds.append(qfr.size)
+    return bounds
+
+
+def parse_chunk(filename: str, start: int, end: int, kwargs: dict) -> list:
+    """
+    Frame and parse every frame starting within a chunk of a log file.
+
+    :param str filename: path of binary log file
+    :param int start: chunk start offset
+    :param int end: chunk end offset (start of next chunk)
+    :param dict kwargs: QGCFileReader keyword arguments
+    :return: list of (raw_data as bytes, parsed_data)
+    :rtype: list
+    """
+
+    with _BoundedFileReader(filename, **kwargs) as qfr:
+        qfr.bound(start, end)
+        return list(qfr)
+
+
+def _parse_chunk(filename: str, start: int, end: int, kwargs: dict) -> list:
+    """
+    Worker process task - parse chunk, replacing each QGCMessage with
+    the arguments needed to rebuild it with its decoded state.
+
+    :param str filename: path of binary log file
+    :param int start: chunk start offset
+    :param int end: chunk end offset (start of next chunk)
+    :param dict kwargs: QGCFileReader keyword arguments
+    :return: list of (raw_data as bytes, parsed_data, state), where state is
+        a (restore function, arguments) tuple if parsed_data is a QGCMessage
+        (parsed_data is then None), otherwise None
+    :rtype: list
+    """
+
+    # pylint: disable=protected-access
+
+    return [
+        (
+            (raw_data, None, parsed_data._reduce_state())
+            if isinstance(parsed_data, QGCMessage)
+            else (raw_data, parsed_data, None)
+        )
+        for raw_data, parsed_data in parse_chunk(filename, start, end, kwargs)
+    ]
+
+
+def _rebuild(results: list):
+    """
+    Generator which rebuilds the QGCMessage objects returned by a worker.
+
+    :param list results: _parse_chunk() results
+    :return: generator of (raw_data as bytes, parsed_data)
+    :rtype: generator
+    """
+
+    for raw_data, parsed_data, state in results:
+        if state is not None:
+            parsed_data = state[0](*state[1])
+        yield raw_data, parsed_data
@@ -0,0 +1,176 @@
+"""
+QGCParser class.
+
+Sans-IO (push) counterpart to QGCReader. Rather than pulling data
+from a stream, arbitrary chunks of data are pushed into the parser
+via its feed() method, which buffers any partial frames internally
+and yields each complete message as a tuple of (raw_data, parsed_data).
+
+This allows parsing to be driven directly from asyncio protocols,
+selectors loops or serial callbacks, with no blocking reads and no
+additional threads e.g.::
+
+    qgp = QGCParser(protfilter=QGC_PROTOCOL)
+    ...
+    def data_received(self, data: bytes):
+        for raw_data, parsed_data in qgp.feed(data):
+            print(parsed_data)
+
+Framing, decoding (via QGCReader.parse) and the 'protfilter',
+'quitonerror' and 'parsing' semantics are identical to QGCReader.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=too-many-positional-arguments
+
+from pyqgc.exceptions import QGCStreamError
+from pyqgc.qgcreader import QGCReader
+from pyqgc.qgctypes_core import (
+    ERR_LOG,
+    GET,
+    NMEA_PROTOCOL,
+    QGC_PROTOCOL,
+    RTCM3_PROTOCOL,
+    VALCKSUM,
+)
+
+
+class QGCParser(QGCReader):
+    """
+    QGCParser class.
+    """
+
+    def __init__(
+        self,
+        msgmode: int = GET,
+        validate: int = VALCKSUM,
+        protfilter: int = NMEA_PROTOCOL | QGC_PROTOCOL | RTCM3_PROTOCOL,
+        quitonerror: int = ERR_LOG,
+        parsebitfield: bool = True,
+        parsing: bool = True,
+        errorhandler: object = None,
+        lazy: bool = False,
+        compact: bool = False,
+        msgfilter: object = None,
+        profile: bool = False,
+        latency: bool = False,
+        passthrough: int = 0,
+    ):
+        """Constructor.
+
+        :param int msgmode: 0=GET, 1=SET, 2=POLL, 3=SETPOLL (0)
+        :param int validate: VALCKSUM (1) = Validate checksum,
+            VALNONE (0) = ignore invalid checksum (1)
+        :param int protfilter: NMEA_PROTOCOL (1), QGC_PROTOCOL (2), RTCM3_PROTOCOL (4),
+            Can be OR'd (7)
+        :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
+            ERR_RAISE (2) = (re)raise (1)
+        :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
+        :param object errorhandler: error handling object or function (None)
+        :param bool lazy: decode QGC payload attributes on first access (False)
+        :param bool compact: use compact (slotted) classes for fixed-layout QGC
+            message types (False)
+        :param object msgfilter: iterable of QGC message identities e.g. "NAV-POS"
+            and/or (msggrp, msgid) byte pairs to output; all others are skipped
+            unparsed (None = output all)
+        :param bool profile: record per-stage timings, available via
+            'profile' property (False)
+        :param bool latency: record per-message latency histograms, available
+            via 'latency' property (False)
+        :param int passthrough: NMEA_PROTOCOL (1) and/or RTCM3_PROTOCOL (4) messages
+            to output raw, with checksum/CRC validated (subject to 'validate')
+            but not parsed, i.e. parsed_data is None. Can be OR'd (0 = none)
+        :raises: QGCStreamError (if mode is invalid)
+        """
+        # pylint: disable=too-many-arguments
+
+        super().__init__(
+            None,
+            msgmode=msgmode,
+            validate=validate,
+            protfilter=protfilter,
+            quitonerror=quitonerror,
+            parsebitfield=parsebitfield,
+            parsing=parsing,
+            errorhandler=errorhandler,
+            lazy=lazy,
+            compact=compact,
+            msgfilter=msgfilter,
+            profile=profile,
+            latency=latency,
+            passthrough=passthrough,
+        )
+
+    def feed(self, data: bytes) -> "QGCParser":
+        """
+        Append a chunk of data to the internal buffer.
+
+        Returns the parser itself, which can be iterated to yield
+        every complete message now in the buffer. Any trailing partial
+        frame is retained until completed by a subsequent feed(). If
+        'latency' is set, message latency is measured from the feed()
+        which completed the message.
+
+        :param bytes data: chunk of data (bytes, bytearray or memoryview)
+        :return: iterator of (raw_data as bytes, parsed_data as QGCMessage)
+        :rtype: QGCParser
+        """
+
+        if self._latency is not None:
+            self._latency.arrived(len(data))
+        self._buf += data
+        return self
+
+    def feed_eof(self):
+        """
+        Signal end of data, once all complete messages have been read.
+
+        Any trailing partial frame is discarded and reported as a
+        QGCStreamError, handled according to 'quitonerror'.
+
+        :raises: QGCStreamError if partial frame and quitonerror = ERR_RAISE (2)
+        """
+
+        unread = self.buffered
+        self._buf.clear()
+        self._pos = 0
+        if unread and self._quitonerror:
+            self._do_error(
+                QGCStreamError(
+                    "Serial stream terminated unexpectedly. "
+                    f"{unread} bytes of incomplete frame discarded."
+                )
+            )
+
+    def _top_up(self, size: int, line: bool = False):
+        """
+        Called when the buffer holds only a partial frame. As there is
+        no stream to read from, discard any consumed bytes and signal
+        that more data must be fed in. The partial frame is retained.
+
+        :param int size: number of unconsumed bytes required
+        :param bool line: reading LF-terminated line (False)
+        :raises: EOFError (always)
+        """
+
+        if self._pos:
+            del self._buf[: self._pos]
+            self._pos = 0
+        raise EOFError()
+
+    @property
+    def buffered(self) -> int:
+        """
+        Getter for number of bytes held in buffer awaiting a complete frame.
+
+        :return: bytes buffered
+        :rtype: int
+        """
+
+        return len(self._buf) - self._pos
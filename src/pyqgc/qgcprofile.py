@@ -0,0 +1,241 @@
+"""
+QGCProfile class.
+
+Opt-in per-stage timing of the QGCReader hot path, e.g.::
+
+    qgr = QGCReader(stream, profile=True)
+    for raw_data, parsed_data in qgr:
+        ...
+    print(qgr.profile)  # or qgr.profile.report() for a dict
+
+records the cumulative nanoseconds spent, per message identity, in:
+
+- framing - reading and framing the stream (everything in
+  QGCReader.read() other than the stages below, including any I/O
+  waits and resynchronisation)
+- checksum - QGC checksum calculation (calc_checksum)
+- decode - QGC payload decoding (QGCMessage construction)
+- nmea - NMEA parsing (NMEAReader.parse)
+- rtcm3 - RTCM3 parsing (RTCMReader.parse)
+
+so a slow site can be identified as I/O-bound, checksum-bound or
+decode-bound without attaching a profiler. When profiling is not enabled,
+the reader's hot path is unchanged.
+
+Created on 17 Oct 2026
+
+:author: semuadmin (Steve Smith)
+:copyright: semuadmin © 2020
+:license: BSD 3-Clause
+"""
+
+from time import perf_counter_ns
+
+from pyqgc.qgctypes_core import QGC_MSGIDS
+
+FRAMING = 0
+CHECKSUM = 1
+DECODE = 2
+NMEA = 3
+RTCM3 = 4
+STAGES = ("framing", "checksum", "decode", "nmea", "rtcm3")
+"""Profiled stages, in stage index order"""
+
+
+class QGCProfile:
+    """
+    QGCProfile class.
+    """
+
+    def __init__(self):
+        """Constructor."""
+
+        # (msggrp + msgid) bytes for QGC, identity for NMEA and RTCM3 ->
+        # [stage 0 ns, stage 0 calls, stage 1 ns, stage 1 calls, ...]
+        self._data = {}
+        self._staged = 0  # cumulative ns of all stages, excluding framing
+
+    def add(self, key: object, stage: int, nanosecs: int):
+        """
+        Add timing to stage.
+
+        :param object key: message key - (msggrp + msgid) bytes for QGC,
+            or identity e.g. 'GNGGA' for NMEA and RTCM3
+        :param int stage: stage index e.g. CHECKSUM (1)
+        :param int nanosecs: elapsed nanoseconds
+        """
+
+        rec = self._data.get(key)
+        if rec is None:
+            rec = self._data[key] = [0] * (len(STAGES) * 2)
+        rec[stage * 2] += nanosecs
+        rec[stage * 2 + 1] += 1
+        if stage != FRAMING:
+            self._staged += nanosecs
+
+    def call(self, stage: int, key: object, func, *args, **kwargs) -> object:
+        """
+        Call function and add its elapsed time to stage.
+
+        :param int stage: stage index e.g. CHECKSUM (1)
+        :param object key: message key, or None to use the 'identity' of
+            the function's return value (or the stage name if it fails)
+        :param func: function to call
+        :param args: function arguments
+        :param kwargs: function keyword arguments
+        :return: function return value
+        :rtype: object
+        """
+
+        start = perf_counter_ns()
+        try:
+            res = func(*args, **kwargs)
+        except Exception:
+            self.add(
+                STAGES[stage].upper() if key is None else key,
+                stage,
+                perf_counter_ns() - start,
+            )
+            raise
+        self.add(
+            getattr(res, "identity", STAGES[stage].upper()) if key is None else key,
+            stage,
+            perf_counter_ns() - start,
+        )
+        return res
+
+    def wrap(self, stage: int, func):
+        """
+        Wrap function so that each call is timed against stage, keyed on
+        the 'identity' of its return value.
+
+        :param int stage: stage index e.g. NMEA (3)
+        :param func: function to wrap
+        :return: wrapped function
+        :rtype: function
+        """
+
+        def wrapped(*args, **kwargs):
+            return self.call(stage, None, func, *args, **kwargs)
+
+        return wrapped
+
+    def wrap_read(self, read):
+        """
+        Wrap reader read() method so that the time spent in each call,
+        less the time recorded against the other stages during the call,
+        is added to the framing stage of the message returned.
+
+        :param read: bound read() method
+        :return: wrapped method
+        :rtype: function
+        """
+
+        def wrapped() -> tuple:
+            staged = self._staged
+            start = perf_counter_ns()
+            raw_data, parsed_data = read()
+            elapsed = perf_counter_ns() - start
+            if raw_data is not None:
+                if raw_data[0:2] == b"QG":
+                    key = raw_data[2:4]
+                else:
+                    key = getattr(
+                        parsed_data,
+                        "identity",
+                        "NMEA" if raw_data[0:1] == b"$" else "RTCM3",
+                    )
+                self.add(key, FRAMING, elapsed - (self._staged - staged))
+            return (raw_data, parsed_data)
+
+        return wrapped
+
+    def report(self) -> dict:
+        """
+        Get profile report.
+
+        :return: dict keyed on message identity, of dicts keyed on stage
+            name, each a dict of cumulative 'ns' and 'calls', plus
+            'total_ns' for the identity
+        :rtype: dict
+        """
+
+        report = {}
+        for key, rec in self._data.items():
+            if isinstance(key, bytes):
+                identity = QGC_MSGIDS.get(key, f"UNKNOWN-{key.hex()}-NOMINAL")
+            else:
+                identity = key
+            stages = report.setdefault(
+                identity, {stage: {"ns": 0, "calls": 0} for stage in STAGES}
+            )
+            for i, stage in enumerate(STAGES):
+                stages[stage]["ns"] += rec[i * 2]
+                stages[stage]["calls"] += rec[i * 2 + 1]
+        for stages in report.values():
+            stages["total_ns"] = sum(stages[stage]["ns"] for stage in STAGES)
+        return report
+
+    def totals(self) -> dict:
+        """
+        Get cumulative nanoseconds per stage, across all identities.
+
+        :return: dict of nanoseconds keyed on stage name
+        :rtype: dict
+        """
+
+        totals = dict.fromkeys(STAGES, 0)
+        for rec in self._data.values():
+            for i, stage in enumerate(STAGES):
+                totals[stage] += rec[i * 2]
+        return totals
+
+    def reset(self):
+        """
+        Discard all recorded timings.
+        """
+
+        self._data = {}
+        self._staged = 0
+
+    def __str__(self) -> str:
+        """
+        Human readable report, one line per identity in descending
+        order of total time, with mean microseconds per call per stage.
+
+        :return: report
+        :rtype: str
+        """
+
+        report = self.report()
+        grand = sum(stages["total_ns"] for stages in report.values()) or 1
+        lines = [
+            f"{'identity':<20}{'total ms':>10}{'%':>7}"
+            + "".join(f"{stage + ' µs':>13}" for stage in STAGES)
+        ]
+        for identity, stages in sorted(
+            report.items(), key=lambda item: item[1]["total_ns"], reverse=True
+        ):
+            line = (
+                f"{identity:<20}{stages['total_ns'] / 1e6:>10.3f}"
+                f"{stages['total_ns'] * 100 / grand:>7.1f}"
+            )
+            for stage in STAGES:
+                calls = stages[stage]["calls"]
+                line += (
+                    f"{stages[stage]['ns'] / calls / 1e3:>13.2f}"
+                    if calls
+                    else f"{'-':>13}"
+                )
+            lines.append(line)
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        :return: representation
+        :rtype: str
+        """
+
+        return f"QGCProfile({self.totals()})"
@@ -20,6 +20,18 @@ Returns both the raw binary data (as bytes) and the parsed data
 - 'protfilter' governs which protocols (NMEA, QGC or RTCM3) are processed
 - 'quitonerror' governs how errors are handled
 - 'parsing' governs whether messages are fully parsed
+- 'passthrough' governs whether NMEA and/or RTCM3 messages are output
+  raw (checksum/CRC validated only) while QGC messages are still parsed
+
+The pynmeagps and pyrtcm libraries are only imported when the first
+NMEA or RTCM3 message is parsed (or a socket is wrapped), so
+applications which only process QGC messages do not pay their
+import cost.
+
+Running totals of frames, bytes and errors are available via the
+'stats' property. Per-stage timings are available via the 'profile'
+property if 'profile' is set, and per-message latency histograms via the
+'latency' property if 'latency' is set.
 
 Created on 6 Oct 2025
 
@@ -28,31 +40,42 @@ Created on 6 Oct 2025
 :license: BSD 3-Clause
 """
 
-# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-positional-arguments, too-many-instance-attributes, too-many-lines
 
+import re
+from functools import partial
 from logging import getLogger
 from socket import socket
 
-import pynmeagps.exceptions as nme
-import pyrtcm.exceptions as rte
-from pynmeagps import NMEA_HDR, NMEAReader, SocketWrapper
-from pyrtcm import RTCMReader, escapeall
-
 from pyqgc.exceptions import (
     QGCMessageError,
     QGCParseError,
     QGCStreamError,
     QGCTypeError,
 )
-from pyqgc.qgchelpers import bytes2val, calc_checksum, getinputmode, val2bytes
-from pyqgc.qgcmessage import QGCMessage
+from pyqgc.qgccodec import get_codec
+from pyqgc.qgchelpers import (
+    bytes2val,
+    calc_checksum,
+    calc_crc24q,
+    calc_nmea_checksum,
+    escapeall,
+    getinputmode,
+    key_from_val,
+    val2bytes,
+)
+from pyqgc.qgclatency import QGCLatency
+from pyqgc.qgcmessage import QGCMessage, compact_class, payload_dict
+from pyqgc.qgcprofile import CHECKSUM, DECODE, NMEA, RTCM3, QGCProfile
 from pyqgc.qgctypes_core import (
     ERR_LOG,
     ERR_RAISE,
     GET,
+    NMEA_HDR,
     NMEA_PROTOCOL,
     POLL,
     QGC_HDR,
+    QGC_MSGIDS,
     QGC_PROTOCOL,
     RTCM3_PROTOCOL,
     SET,
@@ -61,12 +84,146 @@ from pyqgc.qgctypes_core import (
     VALCKSUM,
 )
 
+LEADBYTES = re.compile(b"[\x51\x24\xd3]")
+"""Regex matching first byte of any supported protocol header (QGC, NMEA, RTCM3)"""
+LINEEND = re.compile(b"\x0a")
+"""Regex matching NMEA line terminator (usable on any buffer, including memoryview)"""
+PARSE_ERRORS = (
+    QGCMessageError,
+    QGCTypeError,
+    QGCParseError,
+    QGCStreamError,
+)
+"""Errors handled according to 'quitonerror' - NMEA and RTCM3 errors
+are added when pynmeagps or pyrtcm is first imported by import_parser()"""
+
+
+def import_parser(protocol: int) -> object:
+    """
+    Import NMEA (pynmeagps) or RTCM3 (pyrtcm) parser, adding the
+    library's errors to PARSE_ERRORS. Called on first use, so that
+    the libraries are not imported unless needed.
+
+    :param int protocol: NMEA_PROTOCOL (1) or RTCM3_PROTOCOL (4)
+    :return: NMEAReader.parse or RTCMReader.parse
+    :rtype: function
+    """
+    # pylint: disable=import-outside-toplevel, global-statement
+
+    global PARSE_ERRORS
+    if protocol == NMEA_PROTOCOL:
+        import pynmeagps.exceptions as nme
+        from pynmeagps import NMEAReader
+
+        parse = NMEAReader.parse
+        errors = (
+            nme.NMEAMessageError,
+            nme.NMEATypeError,
+            nme.NMEAParseError,
+            nme.NMEAStreamError,
+        )
+    else:
+        import pyrtcm.exceptions as rte
+        from pyrtcm import RTCMReader
+
+        parse = RTCMReader.parse
+        errors = (
+            rte.RTCMMessageError,
+            rte.RTCMParseError,
+            rte.RTCMStreamError,
+            rte.RTCMTypeError,
+        )
+    PARSE_ERRORS += tuple(err for err in errors if err not in PARSE_ERRORS)
+    return parse
+
+
+def _passthrough_nmea(
+    raw_data: bytes, validate: int = VALCKSUM, msgmode: int = GET
+) -> None:
+    """
+    Validate NMEA message checksum without parsing (see 'passthrough').
+
+    :param bytes raw_data: raw NMEA message
+    :param int validate: VALCKSUM (1) = validate checksum,
+        VALNONE (0) = ignore invalid checksum (1)
+    :param int msgmode: message mode (unused)
+    :return: None
+    :raises: QGCParseError if checksum is invalid
+    """
+    # pylint: disable=unused-argument
+
+    if validate & VALCKSUM:
+        star = raw_data.rfind(b"*")
+        ckm = raw_data[star + 1 : star + 3].upper()
+        ckv = f"{calc_nmea_checksum(raw_data[1:star]):02X}".encode("ascii")
+        if star == -1 or ckm != ckv:
+            raise QGCParseError(
+                f"NMEA message {raw_data[1:6].decode('ascii', errors='replace')} "
+                f"invalid checksum {ckm.decode('ascii', errors='replace')} "
+                f"- should be {ckv.decode('ascii')}.",
+                reason="checksum",
+            )
+
+
+def _passthrough_rtcm3(
+    raw_data: bytes, validate: int = VALCKSUM, labelmsm: int = 1
+) -> None:
+    """
+    Validate RTCM3 message CRC without parsing (see 'passthrough').
+
+    :param bytes raw_data: raw RTCM3 message
+    :param int validate: VALCKSUM (1) = validate CRC,
+        VALNONE (0) = ignore invalid CRC (1)
+    :param int labelmsm: MSM label type (unused)
+    :return: None
+    :raises: QGCParseError if CRC is invalid
+    """
+    # pylint: disable=unused-argument
+
+    if validate & VALCKSUM and calc_crc24q(raw_data):
+        raise QGCParseError(
+            f"RTCM3 message invalid - failed CRC: {escapeall(raw_data[-3:])}",
+            reason="checksum",
+        )
+
+
+def _classify_errors(parse: object, protocol: int) -> object:
+    """
+    Wrap NMEA (pynmeagps) or RTCM3 (pyrtcm) parser so that any parse error
+    raised for a message with invalid checksum or CRC has its 'reason'
+    attribute set to "checksum", for reader statistics. The checksum or CRC
+    is only recalculated on the error path.
+
+    :param object parse: library parse function
+    :param int protocol: NMEA_PROTOCOL (1) or RTCM3_PROTOCOL (4)
+    :return: wrapped parse function
+    :rtype: function
+    """
+
+    check = _passthrough_nmea if protocol == NMEA_PROTOCOL else _passthrough_rtcm3
+
+    def parse_classified(raw_data: bytes, validate: int = VALCKSUM, **kwargs):
+        try:
+            return parse(raw_data, validate=validate, **kwargs)
+        except PARSE_ERRORS as err:
+            try:
+                check(raw_data, validate)
+            except QGCParseError:
+                err.reason = "checksum"
+            raise
+
+    return parse_classified
+
 
 class QGCReader:
     """
     QGCReader class.
     """
 
+    # set per instance only if 'latency' is set, keeping instance
+    # attributes within the limit for a compact (key-sharing) __dict__
+    _latency = None
+
     def __init__(
         self,
         datastream,
@@ -78,6 +235,12 @@ class QGCReader:
         bufsize: int = 4096,
         parsing: bool = True,
         errorhandler: object = None,
+        lazy: bool = False,
+        compact: bool = False,
+        msgfilter: object = None,
+        profile: bool = False,
+        latency: bool = False,
+        passthrough: int = 0,
     ):
         """Constructor.
 
@@ -90,14 +253,31 @@ class QGCReader:
         :param int quitonerror: ERR_IGNORE (0) = ignore errors,  ERR_LOG (1) = log continue,
             ERR_RAISE (2) = (re)raise (1)
         :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
-        :param int bufsize: socket recv buffer size (4096)
+        :param int bufsize: socket recv buffer and stream read chunk size (4096)
         :param bool parsing: True = parse data, False = don't parse data (output raw only) (True)
         :param object errorhandler: error handling object or function (None)
+        :param bool lazy: decode QGC payload attributes on first access (False)
+        :param bool compact: use compact (slotted) classes for fixed-layout QGC
+            message types (False)
+        :param object msgfilter: iterable of QGC message identities e.g. "NAV-POS"
+            and/or (msggrp, msgid) byte pairs to output; all others are skipped
+            unparsed (None = output all)
+        :param bool profile: record per-stage timings, available via
+            'profile' property (False)
+        :param bool latency: record per-message latency histograms, available
+            via 'latency' property (False)
+        :param int passthrough: NMEA_PROTOCOL (1) and/or RTCM3_PROTOCOL (4) messages
+            to output raw, with checksum/CRC validated (subject to 'validate')
+            but not parsed, i.e. parsed_data is None. Can be OR'd (0 = none)
         :raises: QGCStreamError (if mode is invalid)
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments, too-many-locals
 
         if isinstance(datastream, socket):
+            from pynmeagps import (  # pylint: disable=import-outside-toplevel
+                SocketWrapper,
+            )
+
             self._stream = SocketWrapper(datastream, bufsize=bufsize)
         else:
             self._stream = datastream
@@ -108,7 +288,48 @@ class QGCReader:
         self._parsebf = parsebitfield
         self._msgmode = msgmode
         self._parsing = parsing
+        self._lazy = lazy
+        self._compact = compact
         self._logger = getLogger(__name__)
+        self._bufsize = bufsize
+        self._buf = bytearray()  # reusable framing buffer
+        self._pos = 0  # offset of first unconsumed byte in buffer
+        self._skipped = 0  # bytes discarded while resynchronising
+        self._msgfilter = None if msgfilter is None else self._filter_keys(msgfilter)
+        self._filtered = 0  # QGC messages skipped by msgfilter
+        # running totals, kept cheap enough to leave on:
+        # QGC frames keyed on raw grp + id + len bytes (identities,
+        # unknown types and length mismatches are only derived from
+        # these when 'stats' is read); NMEA and RTCM3 frames; framed
+        # bytes; errors keyed on exception type
+        self._frames = {}
+        self._nmeaframes = 0
+        self._rtcmframes = 0
+        self._framed = 0
+        self._errors = {}
+        self._cksumerrs = 0
+        self._lenerrs = 0
+        self._read1 = getattr(self._stream, "read1", None)
+        # parsers are bound here (NMEA and RTCM3 on first use, unless
+        # passed through) so that, unless profiling or tracking latency,
+        # the hot path carries no instrumentation
+        self._profile = None
+        self._qgcparse = self.parse
+        self._nmeaparse = None
+        self._rtcmparse = None
+        if profile:
+            self._profile = QGCProfile()
+            self._qgcparse = partial(self.parse, profile=self._profile)
+            self.read = self._profile.wrap_read(self.read)
+        if passthrough & NMEA_PROTOCOL:
+            self._nmeaparse = self._bind_parser(NMEA_PROTOCOL, _passthrough_nmea)
+        if passthrough & RTCM3_PROTOCOL:
+            self._rtcmparse = self._bind_parser(RTCM3_PROTOCOL, _passthrough_rtcm3)
+        if latency:
+            self._latency = QGCLatency()
+            self.read = self._latency.wrap_read(
+                self.read, lambda: len(self._buf) - self._pos
+            )
 
         if self._msgmode not in (GET, SET, POLL, SETPOLL):
             raise QGCStreamError(
@@ -135,7 +356,7 @@ class QGCReader:
             raise StopIteration
         return (raw_data, parsed_data)
 
-    def read(self) -> tuple:
+    def read(self) -> tuple:  # pylint: disable=method-hidden
         """
         Read a single QGC message from the stream buffer
         and return both raw and parsed data.
@@ -153,24 +374,35 @@ class QGCReader:
 
                 raw_data = None
                 parsed_data = None
-                byte1 = self._read_bytes(1)  # read the first byte
-                # if not QGC, NMEA or RTCM3, discard and continue
-                if byte1 not in (b"\x51", b"\x24", b"\xd3"):
+                buf = self._buf
+                pos = self._pos
+                if len(buf) - pos < 2:
+                    self._need(1)
+                    pos = self._pos
+                byte1 = buf[pos]  # peek at the first byte
+                # if not QGC, NMEA or RTCM3, resynchronise by discarding
+                # the entire run of non-header bytes in the buffer at once
+                if byte1 not in (0x51, 0x24, 0xD3):
+                    mat = LEADBYTES.search(buf, pos + 1)
+                    nxt = len(buf) if mat is None else mat.start()
+                    self._skipped += nxt - pos
+                    self._pos = nxt
                     continue
-                byte2 = self._read_bytes(1)
-                bytehdr = byte1 + byte2
-                # if it's a UBX message (b'\xb5\x62')
-                if bytehdr == QGC_HDR:
-                    raw_data, parsed_data = self._parse_qgc(bytehdr)
-                    # if protocol filter passes QGC, return message,
-                    # otherwise discard and continue
-                    if self._protfilter & QGC_PROTOCOL:
+                self._need(2)
+                pos = self._pos
+                byte2 = buf[pos + 1]
+                # if it's a QGC message (b'\x51\x47')
+                if byte1 == 0x51 and byte2 == 0x47:
+                    raw_data, parsed_data = self._parse_qgc()
+                    # if protocol and message filters pass QGC, return
+                    # message, otherwise discard and continue
+                    if raw_data is not None and self._protfilter & QGC_PROTOCOL:
                         parsing = False
                     else:
                         continue
                 # if it's an NMEA message (b'\x24\x..)
-                elif bytehdr in NMEA_HDR:
-                    raw_data, parsed_data = self._parse_nmea(bytehdr)
+                elif bytes(buf[pos : pos + 2]) in NMEA_HDR:
+                    raw_data, parsed_data = self._parse_nmea()
                     # if protocol filter passes NMEA, return message,
                     # otherwise discard and continue
                     if self._protfilter & NMEA_PROTOCOL:
@@ -179,8 +411,8 @@ class QGCReader:
                         continue
                 # if it's a RTCM3 message
                 # (byte1 = 0xd3; byte2 = 0b000000**)
-                elif byte1 == b"\xd3" and (byte2[0] & ~0x03) == 0:
-                    raw_data, parsed_data = self._parse_rtcm3(bytehdr)
+                elif byte1 == 0xD3 and (byte2 & ~0x03) == 0:
+                    raw_data, parsed_data = self._parse_rtcm3()
                     # if protocol filter passes RTCM, return message,
                     # otherwise discard and continue
                     if self._protfilter & RTCM3_PROTOCOL:
@@ -189,77 +421,211 @@ class QGCReader:
                         continue
                 # unrecognised protocol header
                 else:
-                    raise QGCParseError(f"Unknown protocol header {bytehdr}.")
+                    self._pos = pos + 2
+                    self._skipped += 2
+                    raise QGCParseError(
+                        f"Unknown protocol header {bytes(buf[pos : pos + 2])}."
+                    )
 
             except EOFError:
                 return (None, None)
-            except (
-                QGCMessageError,
-                QGCTypeError,
-                QGCParseError,
-                QGCStreamError,
-                nme.NMEAMessageError,
-                nme.NMEATypeError,
-                nme.NMEAParseError,
-                nme.NMEAStreamError,
-                rte.RTCMMessageError,
-                rte.RTCMParseError,
-                rte.RTCMStreamError,
-                rte.RTCMTypeError,
-            ) as err:
+            except PARSE_ERRORS as err:
+                self._count_error(err)
                 if self._quitonerror:
                     self._do_error(err)
                 continue
 
         return (raw_data, parsed_data)
 
-    def _parse_qgc(self, hdr: bytes) -> tuple:
+    def parse_buffer(self, buf: bytes) -> tuple:
+        """
+        Frame and parse every complete message in a buffer, in a single call.
+
+        Unlike read(), the buffer is scanned in place, with no stream reads,
+        no internal buffering and no EOFError termination, so this is the
+        fastest way to parse data which arrives in blobs (e.g. 4-64 KB
+        socket or serial reads). Any trailing partial frame is not consumed;
+        its offset is returned so it can be prepended to the next blob e.g.::
+
+            qgp = QGCParser(protfilter=QGC_PROTOCOL)
+            pending = b""
+            ...
+            msgs, offset = qgp.parse_buffer(pending + blob)
+            pending = (pending + blob)[offset:]
+
+        'protfilter', 'msgfilter', 'quitonerror' and 'parsing' semantics are
+        identical to read(), and 'skipped', 'filtered' and 'stats' counts
+        are updated.
+
+        :param bytes buf: buffer (bytes, bytearray or memoryview)
+        :return: tuple of (list of (raw_data as bytes, parsed_data), offset of
+            first unconsumed byte i.e. trailing partial frame, or len(buf) if none)
+        :rtype: tuple
+        :raises: Exception (if invalid data and quitonerror = ERR_RAISE (2))
+        """
+        # pylint: disable=too-many-branches, too-many-statements
+
+        results = []
+        append = results.append
+        frames = self._frames
+        protfilter = self._protfilter
+        msgfilter = self._msgfilter
+        parsing = self._parsing
+        end = len(buf)
+        pos = 0
+        while pos < end:
+            byte1 = buf[pos]
+            # resynchronise by skipping entire run of non-header bytes
+            if byte1 not in (0x51, 0x24, 0xD3):
+                mat = LEADBYTES.search(buf, pos + 1)
+                nxt = end if mat is None else mat.start()
+                self._skipped += nxt - pos
+                pos = nxt
+                continue
+            if end - pos < 2:
+                break
+            byte2 = buf[pos + 1]
+            try:
+                if byte1 == 0x51 and byte2 == 0x47:  # QGC
+                    if end - pos < 6:
+                        break
+                    size = (buf[pos + 4] | (buf[pos + 5] << 8)) + 8
+                    if end - pos < size:
+                        break
+                    start = pos
+                    pos += size
+                    key = bytes(buf[start + 2 : start + 6])
+                    frames[key] = frames.get(key, 0) + 1
+                    self._framed += size
+                    if msgfilter is not None and key[0:2] not in msgfilter:
+                        self._filtered += 1
+                        continue
+                    if not protfilter & QGC_PROTOCOL:
+                        continue
+                    raw_data = bytes(buf[start:pos])
+                    parsed_data = None
+                    if parsing:
+                        parsed_data = self._qgcparse(
+                            raw_data,
+                            msgmode=self._msgmode,
+                            validate=self._validate,
+                            parsebitfield=self._parsebf,
+                            lazy=self._lazy,
+                            compact=self._compact,
+                        )
+                elif bytes(buf[pos : pos + 2]) in NMEA_HDR:  # NMEA
+                    mat = LINEEND.search(buf, pos)
+                    if mat is None:
+                        break
+                    start = pos
+                    pos = mat.end()
+                    self._nmeaframes += 1
+                    self._framed += pos - start
+                    if not protfilter & NMEA_PROTOCOL:
+                        continue
+                    raw_data = bytes(buf[start:pos])
+                    parsed_data = None
+                    if parsing:
+                        if self._nmeaparse is None:
+                            self._nmeaparse = self._bind_parser(NMEA_PROTOCOL)
+                        parsed_data = self._nmeaparse(
+                            raw_data, validate=self._validate, msgmode=self._msgmode
+                        )
+                elif byte1 == 0xD3 and (byte2 & ~0x03) == 0:  # RTCM3
+                    if end - pos < 3:
+                        break
+                    size = (buf[pos + 2] | (byte2 << 8)) + 6
+                    if end - pos < size:
+                        break
+                    start = pos
+                    pos += size
+                    self._rtcmframes += 1
+                    self._framed += size
+                    if not protfilter & RTCM3_PROTOCOL:
+                        continue
+                    raw_data = bytes(buf[start:pos])
+                    parsed_data = None
+                    if parsing:
+                        if self._rtcmparse is None:
+                            self._rtcmparse = self._bind_parser(RTCM3_PROTOCOL)
+                        parsed_data = self._rtcmparse(
+                            raw_data, validate=self._validate, labelmsm=1
+                        )
+                else:  # unrecognised protocol header
+                    pos += 2
+                    self._skipped += 2
+                    raise QGCParseError(
+                        f"Unknown protocol header {bytes(buf[pos - 2 : pos])}."
+                    )
+            except PARSE_ERRORS as err:
+                self._count_error(err)
+                if self._quitonerror:
+                    self._do_error(err)
+                continue
+            append((raw_data, parsed_data))
+
+        return (results, pos)
+
+    def _parse_qgc(self) -> tuple:
         """
         Parse remainder of QGC message.
 
-        :param bytes hdr: QGC header (b'\\x51\\x47')
-        :return: tuple of (raw_data as bytes, parsed_data as QGCMessage or None)
+        Messages excluded by 'msgfilter' are skipped by length alone,
+        without checksum validation or parsing.
+
+        :return: tuple of (raw_data as bytes, parsed_data as QGCMessage or None),
+            or (None, None) if message is excluded by 'msgfilter'
         :rtype: tuple
         """
 
-        # read the rest of the QGC message from the buffer
-        byten = self._read_bytes(4)
-        msggrp = byten[0:1]
-        msgid = byten[1:2]
-        lenb = byten[2:4]
-        leni = int.from_bytes(lenb, "little", signed=False)
-        byten = self._read_bytes(leni + 2)
-        plb = byten[0:leni]
-        cksum = byten[leni : leni + 2]
-        raw_data = hdr + msggrp + msgid + lenb + plb + cksum
+        # frame the complete QGC message in the buffer
+        buf = self._buf
+        self._need(6)
+        pos = self._pos
+        # hdr + grp + id + len + payload + cksum
+        size = (buf[pos + 4] | (buf[pos + 5] << 8)) + 8
+        self._need(size)
+        pos = self._pos
+        key = bytes(buf[pos + 2 : pos + 6])
+        frames = self._frames
+        frames[key] = frames.get(key, 0) + 1
+        if self._msgfilter is not None and key[0:2] not in self._msgfilter:
+            self._framed += size
+            self._pos += size
+            self._filtered += 1
+            return (None, None)
+        raw_data = self._take(size)
         # only parse if we need to (filter passes QGC)
         if (self._protfilter & QGC_PROTOCOL) and self._parsing:
-            parsed_data = self.parse(
+            parsed_data = self._qgcparse(
                 raw_data,
                 msgmode=self._msgmode,
                 validate=self._validate,
                 parsebitfield=self._parsebf,
+                lazy=self._lazy,
+                compact=self._compact,
             )
         else:
             parsed_data = None
         return (raw_data, parsed_data)
 
-    def _parse_nmea(self, hdr: bytes) -> tuple:
+    def _parse_nmea(self) -> tuple:
         """
         Parse remainder of NMEA message (using pynmeagps library).
 
-        :param bytes hdr: NMEA header (b'\\x24\\x..')
         :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage or None)
         :rtype: tuple
         """
 
-        # read the rest of the NMEA message from the buffer
-        byten = self._read_line()  # NMEA protocol is CRLF-terminated
-        raw_data = hdr + byten
+        # frame the complete NMEA message in the buffer
+        raw_data = self._take(self._need_line())  # NMEA protocol is CRLF-terminated
+        self._nmeaframes += 1
         # only parse if we need to (filter passes NMEA)
         if (self._protfilter & NMEA_PROTOCOL) and self._parsing:
             # invoke pynmeagps parser
-            parsed_data = NMEAReader.parse(
+            if self._nmeaparse is None:
+                self._nmeaparse = self._bind_parser(NMEA_PROTOCOL)
+            parsed_data = self._nmeaparse(
                 raw_data,
                 validate=self._validate,
                 msgmode=self._msgmode,
@@ -268,24 +634,26 @@ class QGCReader:
             parsed_data = None
         return (raw_data, parsed_data)
 
-    def _parse_rtcm3(self, hdr: bytes) -> tuple:
+    def _parse_rtcm3(self) -> tuple:
         """
         Parse any RTCM3 data in the stream (using pyrtcm library).
 
-        :param bytes hdr: first 2 bytes of RTCM3 header
         :return: tuple of (raw_data as bytes, parsed_stub as RTCMMessage)
         :rtype: tuple
         """
 
-        hdr3 = self._read_bytes(1)
-        size = hdr3[0] | (hdr[1] << 8)
-        payload = self._read_bytes(size)
-        crc = self._read_bytes(3)
-        raw_data = hdr + hdr3 + payload + crc
+        # frame the complete RTCM3 message in the buffer
+        self._need(3)
+        pos = self._pos
+        size = self._buf[pos + 2] | (self._buf[pos + 1] << 8)
+        raw_data = self._take(size + 6)  # hdr + payload + crc
+        self._rtcmframes += 1
         # only parse if we need to (filter passes RTCM)
         if (self._protfilter & RTCM3_PROTOCOL) and self._parsing:
             # invoke pyrtcm parser
-            parsed_data = RTCMReader.parse(
+            if self._rtcmparse is None:
+                self._rtcmparse = self._bind_parser(RTCM3_PROTOCOL)
+            parsed_data = self._rtcmparse(
                 raw_data,
                 validate=self._validate,
                 labelmsm=1,
@@ -294,44 +662,136 @@ class QGCReader:
             parsed_data = None
         return (raw_data, parsed_data)
 
-    def _read_bytes(self, size: int) -> bytes:
+    def _bind_parser(self, protocol: int, parse: object = None) -> object:
         """
-        Read a specified number of bytes from stream.
+        Import NMEA or RTCM3 parser on first use, instrumented if profiling.
 
-        :param int size: number of bytes to read
-        :return: bytes
-        :rtype: bytes
-        :raises: QGCStreamError if stream ends prematurely
+        :param int protocol: NMEA_PROTOCOL (1) or RTCM3_PROTOCOL (4)
+        :param object parse: parse function (None = import library parser)
+        :return: parse function
+        :rtype: function
         """
 
-        data = self._stream.read(size)
-        if len(data) == 0:  # EOF
-            raise EOFError()
-        if 0 < len(data) < size:  # truncated stream
-            raise QGCStreamError(
-                "Serial stream terminated unexpectedly. "
-                f"{size} bytes requested, {len(data)} bytes returned."
+        if parse is None:
+            parse = _classify_errors(import_parser(protocol), protocol)
+        if self._profile is not None:
+            parse = self._profile.wrap(
+                NMEA if protocol == NMEA_PROTOCOL else RTCM3, parse
             )
-        return data
+        return parse
 
-    def _read_line(self) -> bytes:
+    def _take(self, size: int) -> bytes:
         """
-        Read bytes until LF (0x0a) terminator.
+        Remove a complete frame of the specified size from the
+        front of the buffer, in a single slice operation.
 
-        :return: bytes
+        :param int size: frame size in bytes
+        :return: frame
         :rtype: bytes
         :raises: QGCStreamError if stream ends prematurely
         """
 
-        data = self._stream.readline()  # NMEA protocol is CRLF-terminated
-        if len(data) == 0:
-            raise EOFError()  # pragma: no cover
-        if data[-1:] != b"\x0a":  # truncated stream
-            raise QGCStreamError(
+        if len(self._buf) - self._pos < size:
+            self._need(size)
+        pos = self._pos
+        self._pos = pos + size
+        self._framed += size
+        return bytes(self._buf[pos : pos + size])
+
+    def _need(self, size: int):
+        """
+        Ensure at least a specified number of unconsumed bytes are
+        available in the buffer, topping it up from stream if necessary.
+
+        :param int size: number of bytes required
+        :raises: EOFError if stream is exhausted
+        :raises: QGCStreamError if stream ends prematurely
+        """
+
+        while len(self._buf) - self._pos < size:
+            self._top_up(size)
+
+    def _need_line(self) -> int:
+        """
+        Ensure buffer contains a complete LF (0x0a) terminated line,
+        topping it up from stream if necessary.
+
+        :return: length of line in bytes, including terminator
+        :rtype: int
+        :raises: QGCStreamError if stream ends prematurely
+        """
+
+        start = self._pos
+        while True:
+            idx = self._buf.find(b"\x0a", start)
+            if idx != -1:
+                return idx + 1 - self._pos
+            unread = len(self._buf) - self._pos
+            self._top_up(unread + 1, True)
+            start = self._pos + unread
+
+    def _top_up(self, size: int, line: bool = False):
+        """
+        Read the next chunk of data from stream into the buffer,
+        first discarding any consumed bytes.
+
+        Streams which support 'read1' (e.g. files, BytesIO) are read in
+        chunks of up to 'bufsize' bytes. Streams which report the
+        number of bytes waiting (e.g. serial, SocketWrapper) are read in
+        chunks of whatever is waiting. Any other stream is read only as
+        far as is required to complete the current message, so blocking
+        streams will not wait on data which has not yet been sent.
+
+        :param int size: number of unconsumed bytes required
+        :param bool line: reading LF-terminated line (False)
+        :raises: EOFError if stream is exhausted
+        :raises: QGCStreamError if stream ends prematurely
+        """
+
+        if self._pos:
+            del self._buf[: self._pos]
+            self._pos = 0
+        short = size - len(self._buf)
+        if self._read1 is not None:
+            data = self._read1(max(short, self._bufsize))
+        else:
+            waiting = getattr(self._stream, "in_waiting", 0)
+            if callable(waiting):  # e.g. SocketWrapper
+                waiting = waiting()
+            if waiting >= short:
+                data = self._stream.read(waiting)
+            elif line:
+                data = self._stream.readline()
+            else:
+                data = self._stream.read(short)
+        if len(data) == 0:  # EOF
+            unread = len(self._buf)
+            self._buf.clear()
+            if unread == 0:
+                raise EOFError()
+            raise QGCStreamError(  # truncated stream
                 "Serial stream terminated unexpectedly. "
-                f"Line requested, {len(data)} bytes returned."
+                f"{size} bytes requested, {unread} bytes returned."
             )
-        return data
+        if self._latency is not None:
+            self._latency.arrived(len(data))
+        self._buf += data
+
+    def _count_error(self, err: Exception):
+        """
+        Update error counts. Checksum and length errors are identified
+        by the 'reason' attribute set where they are raised.
+
+        :param Exception err: error
+        """
+
+        name = type(err).__name__
+        self._errors[name] = self._errors.get(name, 0) + 1
+        reason = getattr(err, "reason", None)  # set where error is raised
+        if reason == "checksum":
+            self._cksumerrs += 1
+        elif reason == "length":
+            self._lenerrs += 1
 
     def _do_error(self, err: Exception):
         """
@@ -362,12 +822,176 @@ class QGCReader:
 
         return self._stream
 
+    @property
+    def skipped(self) -> int:
+        """
+        Getter for number of non-protocol bytes discarded while
+        resynchronising with the stream (e.g. after a baud rate
+        change or on a noisy link), including unrecognised headers.
+
+        :return: bytes discarded
+        :rtype: int
+        """
+
+        return self._skipped
+
+    @property
+    def filtered(self) -> int:
+        """
+        Getter for number of QGC messages skipped, unparsed, by 'msgfilter'.
+
+        :return: messages skipped
+        :rtype: int
+        """
+
+        return self._filtered
+
+    @property
+    def profile(self) -> QGCProfile | None:
+        """
+        Getter for per-stage timings recorded since the reader was
+        created, if 'profile' is set.
+
+        Framing time is recorded per message by read() (and hence by
+        iteration). parse_buffer() records the checksum, decode, NMEA
+        and RTCM3 stages only.
+
+        :return: profile, or None if 'profile' is not set
+        :rtype: QGCProfile or None
+        """
+
+        return self._profile
+
+    @property
+    def latency(self) -> QGCLatency | None:
+        """
+        Getter for per-message latency histograms recorded since the
+        reader was created, if 'latency' is set.
+
+        Latency is the time from the stream read which delivered the
+        last byte of a message to the return of that message by read()
+        (and hence by iteration). It is not recorded by parse_buffer(),
+        or by QGCFileReader, whose data is all available at the outset.
+
+        :return: latency tracker, or None if 'latency' is not set
+        :rtype: QGCLatency or None
+        """
+
+        return self._latency
+
+    @property
+    def stats(self) -> dict:
+        """
+        Getter for snapshot of running totals since the reader was created:
+
+        - 'frames' - complete frames per protocol ("QGC", "NMEA", "RTCM3"),
+          including any excluded by 'protfilter' or 'msgfilter' or
+          subsequently found to be invalid
+        - 'identities' - QGC frames per message identity
+        - 'bytes' - bytes consumed (framed and skipped)
+        - 'skipped' - bytes discarded while resynchronising
+        - 'filtered' - QGC messages skipped by 'msgfilter'
+        - 'checksum_errors' - messages with invalid checksum or CRC
+        - 'length_mismatches' - QGC messages whose payload length does not
+          match their header or their fixed-layout payload definition
+        - 'unknown' - QGC messages of unrecognised type (parsed as NOMINAL)
+        - 'errors' - errors (whether raised, logged or ignored) by
+          exception type
+
+        :return: statistics
+        :rtype: dict
+        """
+
+        identities = {}
+        unknown = 0
+        lenerrs = self._lenerrs
+        qgc = 0
+        for key, count in self._frames.items():
+            qgc += count
+            identity = QGC_MSGIDS.get(key[0:2], None)
+            if identity is None:
+                unknown += count
+                identity = f"UNKNOWN-{key[0:2].hex()}-NOMINAL"
+            elif not self._length_ok(identity, key):
+                lenerrs += count
+            identities[identity] = identities.get(identity, 0) + count
+        return {
+            "frames": {
+                "QGC": qgc,
+                "NMEA": self._nmeaframes,
+                "RTCM3": self._rtcmframes,
+            },
+            "identities": identities,
+            "bytes": self._framed + self._skipped,
+            "skipped": self._skipped,
+            "filtered": self._filtered,
+            "checksum_errors": self._cksumerrs,
+            "length_mismatches": lenerrs,
+            "unknown": unknown,
+            "errors": dict(self._errors),
+        }
+
+    def _length_ok(self, identity: str, key: bytes) -> bool:
+        """
+        Check if payload length matches payload definition, for
+        fixed-layout message types.
+
+        :param str identity: message identity
+        :param bytes key: raw msggrp + msgid + length bytes
+        :return: True if length matches or message type is not fixed-layout
+        :rtype: bool
+        """
+
+        msgmode = self._msgmode
+        if msgmode == SETPOLL:
+            msgmode = getinputmode(key[0:1], key[1:2], key[2:4])
+        length = key[2] | (key[3] << 8)
+        try:
+            codec = get_codec(payload_dict(identity, msgmode, length))
+        except KeyError:
+            return True
+        return codec is None or codec.size == length
+
+    @staticmethod
+    def _filter_keys(msgfilter: object) -> set:
+        """
+        Convert message filter to set of (msggrp + msgid) keys.
+
+        :param object msgfilter: iterable of message identities and/or
+            (msggrp, msgid) byte pairs
+        :return: set of 2-byte message keys
+        :rtype: set
+        :raises: QGCStreamError if filter contains invalid entry
+        """
+
+        keys = set()
+        for msg in msgfilter:
+            if isinstance(msg, str):
+                try:
+                    keys.add(key_from_val(QGC_MSGIDS, msg))
+                except KeyError as err:
+                    raise QGCStreamError(
+                        f"Unknown message identity {msg} in msgfilter"
+                    ) from err
+            elif (
+                isinstance(msg, tuple)
+                and len(msg) == 2
+                and all(isinstance(b, bytes) and len(b) == 1 for b in msg)
+            ):
+                keys.add(msg[0] + msg[1])
+            else:
+                raise QGCStreamError(f"Invalid msgfilter entry {msg}")
+        return keys
+
     @staticmethod
     def parse(
         message: bytes,
         msgmode: int = GET,
         validate: int = VALCKSUM,
         parsebitfield: bool = True,
+        lazy: bool = False,
+        compact: bool = False,
+        profile: QGCProfile = None,
     ) -> object:
         """
         Parse QGC byte stream to QGCMessage object.
@@ -377,10 +1001,16 @@ class QGCReader:
         :param int validate: VALCKSUM (1) = Validate checksum,
             VALNONE (0) = ignore invalid checksum (1)
         :param bool parsebitfield: 1 = parse bitfields, 0 = leave as bytes (1)
+        :param bool lazy: decode payload attributes on first access (False)
+        :param bool compact: use compact (slotted) class for fixed-layout
+            message types (False)
+        :param QGCProfile profile: profile to which checksum and decode
+            timings are added (None)
         :return: QGCMessage object
         :rtype: QGCMessage
         :raises: Exception (if data stream contains invalid data or unknown message type)
         """
+        # pylint: disable=too-many-arguments, too-many-locals, too-many-branches
 
         if msgmode not in (GET, SET, POLL, SETPOLL):
             raise QGCParseError(
@@ -399,10 +1029,16 @@ class QGCReader:
             payload = message[6 : lenm - 2]
             leni = len(payload)
         ckm = message[lenm - 2 : lenm]
-        if payload is not None:
-            ckv = calc_checksum(msggrp + msgid + lenb + payload)
+        # checksum grp + id + len + payload in place, without concatenation
+        if profile is None:
+            ckv = calc_checksum(memoryview(message)[2 : 6 + leni])
         else:
-            ckv = calc_checksum(msggrp + msgid + lenb)
+            ckv = profile.call(
+                CHECKSUM,
+                msggrp + msgid,
+                calc_checksum,
+                memoryview(message)[2 : 6 + leni],
+            )
         if validate & VALCKSUM:
             if hdr != QGC_HDR:
                 raise QGCParseError(
@@ -413,18 +1049,46 @@ class QGCReader:
                     (
                         f"Invalid payload length {lenb}"
                         f" - should be {val2bytes(leni, U2)}"
-                    )
+                    ),
+                    reason="length",
                 )
             if ckm != ckv:
                 raise QGCParseError(
-                    f"Message checksum {escapeall(ckm)} invalid - should be {escapeall(ckv)}"
+                    f"Message checksum {escapeall(ckm)} invalid - should be {escapeall(ckv)}",
+                    reason="checksum",
                 )
         # if input message (SET or POLL), determine mode automatically
         if msgmode == SETPOLL:
             msgmode = getinputmode(msggrp, msgid, lenb)  # returns SET or POLL
         if payload is None:
+            if profile is not None:
+                return profile.call(
+                    DECODE,
+                    msggrp + msgid,
+                    QGCMessage,
+                    msggrp,
+                    msgid,
+                    ckm,
+                    lenb,
+                    msgmode,
+                )
             return QGCMessage(msggrp, msgid, ckm, lenb, msgmode)
-        return QGCMessage(
+        cls = compact_class(msggrp, msgid, msgmode, leni) if compact else QGCMessage
+        if profile is not None:
+            return profile.call(
+                DECODE,
+                msggrp + msgid,
+                cls,
+                msggrp,
+                msgid,
+                ckm,
+                lenb,
+                msgmode,
+                payload=payload,
+                parsebitfield=parsebitfield,
+                lazy=lazy,
+            )
+        return cls(
             msggrp,
             msgid,
             ckm,
@@ -432,4 +1096,5 @@ class QGCReader:
             msgmode,
             payload=payload,
             parsebitfield=parsebitfield,
+            lazy=lazy,
         )
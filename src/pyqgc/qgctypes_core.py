@@ -10,6 +10,30 @@ Information sourced from public domain Quectel Interface Specifications © 2025,
 
 QGC_HDR = b"\x51\x47"
 """QGC message header"""
+NMEA_HDR = {
+    b"$A",
+    b"$B",
+    b"$C",
+    b"$D",
+    b"$E",
+    b"$F",
+    b"$G",
+    b"$H",
+    b"$I",
+    b"$L",
+    b"$M",
+    b"$N",
+    b"$P",
+    b"$R",
+    b"$S",
+    b"$T",
+    b"$U",
+    b"$V",
+    b"$W",
+    b"$Y",
+    b"$Z",
+}
+"""NMEA message headers (talker ID first character), as pynmeagps.NMEA_HDR"""
 GET = 0
 """GET (receive, response) message types"""
 SET = 1
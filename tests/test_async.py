@@ -0,0 +1,96 @@
+"""
+Asynchronous stream method tests for pyqgc.AsyncQGCReader
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import asyncio
+import os
+import unittest
+from io import BytesIO
+
+from pyqgc import (
+    ERR_RAISE,
+    QGC_PROTOCOL,
+    AsyncQGCReader,
+    QGCReader,
+    QGCStreamError,
+)
+
+DIRNAME = os.path.dirname(__file__)
+
+
+class AsyncStreamTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.maxDiff = None
+        with open(os.path.join(DIRNAME, "pygpsdata_mixed.log"), "rb") as stream:
+            self.data = stream.read()
+        self.expected = [
+            (raw, str(parsed))
+            for raw, parsed in QGCReader(BytesIO(self.data), quitonerror=ERR_RAISE)
+        ]
+
+    async def testtcpreplay(self):  # test against local TCP server replaying log
+        async def replay(_, writer: asyncio.StreamWriter):
+            for i in range(0, len(self.data), 333):
+                writer.write(self.data[i : i + 333])
+                await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        server = await asyncio.start_server(replay, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            aqr = AsyncQGCReader(reader, quitonerror=ERR_RAISE)
+            res = [(raw, str(parsed)) async for raw, parsed in aqr]
+            writer.close()
+            await writer.wait_closed()
+        self.assertEqual(res, self.expected)
+        self.assertEqual(aqr.datastream, reader)
+
+    async def testmultiplex(self):  # test several readers in one event loop
+        async def consume(chunk: int) -> list:
+            reader = asyncio.StreamReader()
+            for i in range(0, len(self.data), chunk):
+                reader.feed_data(self.data[i : i + chunk])
+            reader.feed_eof()
+            aqr = AsyncQGCReader(reader, bufsize=64, quitonerror=ERR_RAISE)
+            return [(raw, str(parsed)) async for raw, parsed in aqr]
+
+        results = await asyncio.gather(*(consume(c) for c in (1, 17, 4096)))
+        for res in results:
+            self.assertEqual(res, self.expected)
+
+    async def testtruncated(self):  # test truncated asyncio stream
+        FRAME = b"QG\x01\x01\x04\x00\x03\x02\x00\x00\x0b9"
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"\x00\x00" + FRAME + FRAME[:5])
+        reader.feed_eof()
+        aqr = AsyncQGCReader(
+            reader, protfilter=QGC_PROTOCOL, quitonerror=ERR_RAISE, latency=True
+        )
+        raw, _ = await aqr.read()
+        self.assertEqual(raw, FRAME)
+        self.assertEqual(aqr.skipped, 2)
+        self.assertEqual(aqr.filtered, 0)
+        self.assertEqual(aqr.stats["identities"], {"ACK-ACK": 1})
+        self.assertEqual(aqr.stats["bytes"], 14)
+        self.assertEqual(aqr.latency.report()["ACK-ACK"]["count"], 1)
+        with self.assertRaisesRegex(
+            QGCStreamError,
+            "Serial stream terminated unexpectedly. 5 bytes of incomplete frame discarded.",
+        ):
+            await aqr.read()
+        self.assertEqual(await aqr.read(), (None, None))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+Performance regression tests for pyqgc.QGCReader, using the bundled
+receiver binary logs.
+
+Per-message parsing and framing cost, and per-message allocations
+(tracemalloc peak bytes and retained memory blocks), are asserted against
+the baselines stored in perf_baselines.json, keyed on Python version
+(as allocations and relative costs differ between interpreter versions).
+
+Timings are normalised against a pure Python calibration workload timed
+alongside them, so baselines are broadly portable between machines.
+Coverage tracing is suspended while measuring. As individual timings
+are noisy, each log is only checked against a loose tolerance, while
+the geometric mean cost ratio across all logs is checked against a
+tighter one.
+
+The allocation tests do not depend on the host and run by default. As
+wall-clock timings do depend on the host, the cost tests are marked 'perf'
+and are deselected by default. To run them:
+
+    python -m pytest -m perf --no-cov tests/test_performance.py
+
+To (re)record the baselines for the current Python version, e.g. after
+an intentional change in performance, run:
+
+    PYQGC_PERF_UPDATE=1 python -m pytest -m "perf or not perf" --no-cov tests/test_performance.py
+
+Created on 17 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+@author: semuadmin
+"""
+
+# pylint: disable=line-too-long, invalid-name, missing-docstring, no-member
+
+import json
+import math
+import os
+import sys
+import tracemalloc
+import unittest
+from io import BytesIO
+from timeit import Timer
+
+import pytest
+
+from pyqgc import GET, POLL, SET, QGCReader
+
+DIRNAME = os.path.dirname(__file__)
+BASELINES = os.path.join(DIRNAME, "perf_baselines.json")
+PYVER = f"{sys.version_info.major}.{sys.version_info.minor}"
+UPDATE = os.getenv("PYQGC_PERF_UPDATE", "0") == "1"
+
+TIME_TOLERANCE = 1.5  # max ratio of per-message cost to baseline, all logs
+LOG_TIME_TOLERANCE = 2.5  # max ratio of per-message cost to baseline, any one log
+ALLOC_TOLERANCE = 1.2  # max ratio of per-message allocations to baseline
+MINMESSAGES = 1000  # min messages processed per timing run
+REPEAT = 5  # timing runs, best is taken
+
+LOGS = {
+    "lg580p_qgc_get": ("pygpsdata_lg580p_qgc_get.log", GET),
+    "lg580p_qgc_raw": ("pygpsdata_lg580p_qgc.log", GET),
+    "lu600_qgc_get": ("pygpsdata_lu600_qgc_get.log", GET),
+    "lu600_qgc_set": ("pygpsdata_lu600_qgc_set.log", SET),
+    "lu600_qgc_poll": ("pygpsdata_lu600_qgc_poll.log", POLL),
+    "nmea": ("pygpsdata_nmea.log", GET),
+    "mixed": ("pygpsdata_mixed.log", GET),
+    "mixed_rtcm3": ("pygpsdata_mixed_rtcm3.log", GET),
+}
+
+
+def calibration():
+    """
+    Reference pure Python workload, used as the unit of cost.
+    """
+
+    vals = {}
+    for i in range(200):
+        vals[i] = (i * 3, str(i))
+    return [val for key, val in vals.items() if key & 1]
+
+
+def untraced(func, *args):
+    """
+    Call function with coverage tracing (if any) suspended.
+    """
+
+    tracer = sys.gettrace()
+    sys.settrace(None)
+    try:
+        return func(*args)
+    finally:
+        sys.settrace(tracer)
+
+
+def besttime(func, number: int) -> float:
+    """
+    Best time per call of 'REPEAT' timing runs.
+    """
+
+    return min(untraced(Timer(func).repeat, REPEAT, number)) / number
+
+
+def allocations(data: bytes, msgmode: int) -> tuple:
+    """
+    Peak traced memory and number of memory blocks retained
+    while parsing data.
+    """
+
+    list(QGCReader(BytesIO(data), msgmode=msgmode))  # warm caches
+    tracemalloc.start()
+    try:
+        parsed = list(QGCReader(BytesIO(data), msgmode=msgmode))
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return peak, blocks, len(parsed)
+
+
+class PerformanceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.baselines = {}
+        if os.path.exists(BASELINES):
+            with open(BASELINES, "r", encoding="utf-8") as infile:
+                cls.baselines = json.load(infile)
+        cls.measured = {}
+        cls.data = {}
+        for key, (name, _) in LOGS.items():
+            with open(os.path.join(DIRNAME, name), "rb") as stream:
+                cls.data[key] = stream.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE:
+            baselines = cls.baselines.setdefault(PYVER, {})
+            for key, metrics in cls.measured.items():
+                baselines.setdefault(key, {}).update(metrics)
+            with open(BASELINES, "w", encoding="utf-8") as outfile:
+                json.dump(cls.baselines, outfile, indent=2, sort_keys=True)
+                outfile.write("\n")
+
+    def check(
+        self,
+        key: str,
+        metric: str,
+        value: float,
+        tolerance: float,
+        ratios: list = None,
+    ):
+        self.measured.setdefault(key, {})[metric] = round(value, 3)
+        if UPDATE:
+            return
+        baseline = self.baselines.get(PYVER, {}).get(key, {}).get(metric)
+        if baseline is None:
+            self.skipTest(
+                f"No {metric} baseline for {key} on Python {PYVER} - "
+                "record with PYQGC_PERF_UPDATE=1"
+            )
+        if ratios is not None:
+            ratios.append(value / baseline)
+        self.assertLessEqual(
+            value,
+            baseline * tolerance,
+            f"{key} {metric} {value:.3f} exceeds baseline {baseline:.3f} "
+            f"by more than {tolerance}x - performance regression?",
+        )
+
+    def checkcosts(self, metric: str, parsing: bool):
+        ratios = []
+        for key in LOGS:
+            with self.subTest(log=key):
+                cost = self.cost(key, parsing)
+                self.check(key, metric, cost, LOG_TIME_TOLERANCE, ratios)
+        if len(ratios) == len(LOGS):
+            gmean = math.exp(sum(math.log(r) for r in ratios) / len(ratios))
+            self.assertLessEqual(
+                gmean,
+                TIME_TOLERANCE,
+                f"{metric} is {gmean:.2f}x baseline across all logs "
+                f"(tolerance {TIME_TOLERANCE}x) - performance regression?",
+            )
+
+    def cost(self, key: str, parsing: bool) -> float:
+        data = self.data[key]
+        msgmode = LOGS[key][1]
+
+        def read():
+            n = 0
+            for _ in QGCReader(BytesIO(data), msgmode=msgmode, parsing=parsing):
+                n += 1
+            return n
+
+        count = read()
+        secs = besttime(read, max(1, MINMESSAGES // count))
+        return secs / count / besttime(calibration, 100)
+
+    @pytest.mark.perf
+    def testparsecost(self):  # per-message frame and parse cost
+        self.checkcosts("parse_cost", True)
+
+    @pytest.mark.perf
+    def testframecost(self):  # per-message frame only cost
+        self.checkcosts("frame_cost", False)
+
+    def testallocations(self):  # per-message peak bytes and retained blocks
+        for key, data in self.data.items():
+            with self.subTest(log=key):
+                peak, blocks, count = untraced(allocations, data, LOGS[key][1])
+                self.check(key, "peak_bytes", peak / count, ALLOC_TOLERANCE)
+                self.check(key, "blocks", blocks / count, ALLOC_TOLERANCE)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -17,7 +17,16 @@ import pyqgc.qgctypes_core as qgt
 import pyqgc.exceptions as qge
 from pyqgc.qgctypes_core import SET, GET, VALCKSUM, CV, POLL, QGC_MSGIDS
 from pyqgc import QGCReader, QGCMessage
+from pyqgc.qgccodec import get_codec
+from pyqgc.qgcmessage import compact_class, payload_dict
+from pyqgc.qgctypes_get import QGC_PAYLOADS_GET
+from pyqgc.qgctypes_poll import QGC_PAYLOADS_POLL
+from pyqgc.qgctypes_set import QGC_PAYLOADS_SET
 from pyqgc.qgchelpers import (
+    INPUT_MODES,
+    PAYLOAD_LENGTHS,
+    PAYLOAD_VARIANTS,
+    QGC_PAYLOADS,
     attsiz,
     att2idx,
     att2name,
@@ -226,6 +235,31 @@ class StaticTest(unittest.TestCase):
         res = calc_checksum(b"\x06\x01\x02\x00\xf0\x05")
         self.assertEqual(res, b"\xfe\x16")
 
+    def testCalcChecksumReference(self):  # test against per-byte reference
+        def refchecksum(content: bytes) -> bytes:
+            check_a = check_b = 0
+            for char in content:
+                check_a = (check_a + char) & 0xFF
+                check_b = (check_b + check_a) & 0xFF
+            return bytes((check_a, check_b))
+
+        frames = [bytes(range(256)) * 4, b"\xff" * 65535, b""]
+        dirname = os.path.dirname(__file__)
+        for log in os.listdir(dirname):
+            if log.endswith(".log"):
+                with open(os.path.join(dirname, log), "rb") as stream:
+                    frames += [
+                        raw
+                        for raw, _ in QGCReader(
+                            stream, protfilter=qgt.QGC_PROTOCOL, parsing=False
+                        )
+                    ]
+        self.assertGreater(len(frames), 50)
+        for frame in frames:
+            content = memoryview(frame)[2:-2]
+            self.assertEqual(calc_checksum(content), refchecksum(content))
+            self.assertEqual(calc_checksum(bytes(content)), refchecksum(content))
+
     def testGoodChecksum(self):
         res = isvalid_checksum(b"\xb5b\x06\x01\x02\x00\xf0\x05\xfe\x16")
         self.assertTrue(res)
@@ -269,6 +303,14 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(res, SET)
         res = getinputmode(b"\x99", b"\x99", b"\x0c\x00")
         self.assertEqual(res, SET)
+        res = getinputmode(b"\x06", b"\x01", b"\x00\x00")  # INF-VER, POLL only
+        self.assertEqual(res, POLL)
+        res = QGCReader.parse(b"QG\x06\x01\x00\x00\x07\x1b", msgmode=qgt.SETPOLL)
+        self.assertEqual(res.identity, "INF-VER")
+        res = getinputmode(b"\x02", b"\x10", b"\x05\x00")  # CFG-MSG SET or POLL INTF
+        self.assertEqual(res, SET)
+        res = getinputmode(b"\x02", b"\x10", b"\x03\x00")  # CFG-MSG POLL
+        self.assertEqual(res, POLL)
 
     def testattsiz(self):  # test attsiz
         self.assertEqual(attsiz(CV), -1)
@@ -342,6 +384,27 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(res, -1)
         res = getpaylen("INF-VER", 7)
         self.assertEqual(res, -1)
+        res = getpaylen("RAW-HASE6", GET)  # repeating group
+        self.assertEqual(res, -1)
+        with self.assertRaises(KeyError):
+            getpaylen("XXX-YYY", GET)
+
+    def testpayloadregistry(self):  # test registry matches payload definitions
+        for mode, payloads in enumerate(QGC_PAYLOADS):
+            for identity, pdict in payloads.items():
+                sizes = [attsiz(t) if isinstance(t, str) else -1 for t in pdict.values()]
+                leni = -1 if -1 in sizes else sum(sizes)
+                self.assertEqual(PAYLOAD_LENGTHS[mode][identity], leni)
+        self.assertEqual(
+            PAYLOAD_VARIANTS,
+            {
+                ("CFG-MSG", GET, 7): QGC_PAYLOADS_GET["CFG-MSG-INTF"],
+                ("CFG-MSG", SET, 7): QGC_PAYLOADS_SET["CFG-MSG-INTF"],
+                ("CFG-MSG", POLL, 5): QGC_PAYLOADS_POLL["CFG-MSG-INTF"],
+                ("CFG-UART", SET, 2): QGC_PAYLOADS_SET["CFG-UART-DIS"],
+            },
+        )
+        self.assertTrue(all(mode == POLL for mode in INPUT_MODES.values()))
 
     def testkeyfromval(self):
         res = key_from_val(QGC_MSGIDS, "CFG-UART")
@@ -386,6 +449,118 @@ class StaticTest(unittest.TestCase):
             )
             msg.prn = 33
 
+    def testcodecs(self):  # test compiled codecs match attribute-by-attribute decode
+        payload = bytes((i * 37 + 11) % 256 for i in range(256))
+        compiled = []
+        for pdicts in (QGC_PAYLOADS_GET, QGC_PAYLOADS_SET, QGC_PAYLOADS_POLL):
+            for identity, pdict in pdicts.items():
+                codec = get_codec(pdict)
+                if codec is None:
+                    continue
+                compiled.append(identity)
+                offset = 0
+                expected = []
+                for anam, adef in pdict.items():
+                    siz = attsiz(adef)
+                    expected.append(
+                        (anam, bytes2val(payload[offset : offset + siz], adef))
+                    )
+                    offset += siz
+                self.assertEqual(codec.size, offset)
+                res = list(codec.decode(payload[:offset]))
+                self.assertEqual(str(res), str(expected))  # str to match nan
+        for identity in ("NAV-POS", "NAV-VEL", "NAV-NAV", "SEN-IMU", "CFG-MSG-INTF"):
+            self.assertIn(identity, compiled)
+        for identity in ("RAW-HASE6", "INF-VER", "INF-SN", "QGC-NOMINAL"):
+            self.assertIsNone(get_codec(QGC_PAYLOADS_GET[identity]))
+        self.assertIsNone(get_codec({}))
+        self.assertIs(
+            get_codec(QGC_PAYLOADS_GET["NAV-POS"]),
+            get_codec(QGC_PAYLOADS_GET["NAV-POS"]),
+        )
+
+    def testcodecscaled(self):  # test compiled codec with scaled and string attributes
+        pdict = {
+            "a": "U002*100",
+            "b": "U003*10",
+            "c": "S004",
+            "d": "C008",
+            "e": "X002",
+            "f": "R004*2",
+        }
+        payload = b"\x10\x27\x64\x00\x00\xfe\xff\xff\xffLG580P\x00\x00\x01\x02\x00\x00\x80\x3f"
+        codec = get_codec(pdict)
+        self.assertEqual(codec.struct.format, "<H3si8s2sf")
+        self.assertEqual(codec.decode_field(payload, "b"), 10.0)
+        self.assertEqual(codec.decode_field(payload, "d"), "LG580P  ")
+        self.assertEqual(codec.decode_field(payload, "e"), b"\x01\x02")
+        self.assertEqual(
+            dict(codec.decode(payload)),
+            {
+                "a": 100.0,
+                "b": 10.0,
+                "c": -2,
+                "d": "LG580P  ",
+                "e": b"\x01\x02",
+                "f": 0.5,
+            },
+        )
+
+    def testcodecmessage(self):  # test compiled codec and fallback give same message
+        msg1 = QGCMessage(
+            b"\x10", b"\x01", msgmode=GET, msgver=3, timestamp=15490, gyox=1.5
+        )
+        msg2 = QGCMessage(b"\x10", b"\x01", msgmode=GET, payload=msg1.payload)
+        self.assertEqual(str(msg1), str(msg2))
+        self.assertEqual(msg1.serialize(), msg2.serialize())
+        # short payload falls back to attribute-by-attribute decode
+        msg3 = QGCMessage(
+            b"\x01", b"\x01", msgmode=GET, payload=b"\x03\x02\x00\x00\x00"
+        )
+        self.assertEqual(
+            str(msg3),
+            "<QGC(ACK-ACK, ackmsggrp=3, ackmsgid=2, errcode=0, reserved1=0)>",
+        )
+
+
+    def testpayloaddict(self):  # test payload definition lookup incl. alternates
+        self.assertIs(payload_dict("NAV-NAV"), QGC_PAYLOADS_GET["NAV-NAV"])
+        self.assertIs(
+            payload_dict("CFG-MSG", SET, 7), QGC_PAYLOADS_SET["CFG-MSG-INTF"]
+        )
+        self.assertIs(
+            payload_dict("CFG-MSG", POLL, 5), QGC_PAYLOADS_POLL["CFG-MSG-INTF"]
+        )
+        self.assertEqual(payload_dict("UNKNOWN-ffff-NOMINAL"), {})
+        with self.assertRaises(KeyError):
+            payload_dict("XXX-YYY", GET)
+
+    def testcompactclass(self):  # test compact slotted subclasses
+        cls = compact_class(b"\x10", b"\x01", GET, 37)
+        self.assertIs(cls, compact_class(b"\x10", b"\x01", GET, 37))  # cached
+        self.assertTrue(issubclass(cls, QGCMessage))
+        self.assertEqual(cls.__name__, "QGCMessage_SEN_IMU")
+        self.assertEqual(cls.__slots__, tuple(QGC_PAYLOADS_GET["SEN-IMU"]))
+        # non fixed-layout, wrong length or unknown message types
+        self.assertIs(compact_class(b"\x10", b"\x01", GET, 36), QGCMessage)
+        self.assertIs(compact_class(b"\x06", b"\x01", GET, 36), QGCMessage)
+        self.assertIs(compact_class(b"\xff", b"\xff", GET, 4), QGCMessage)
+        msg1 = QGCMessage(
+            b"\x10", b"\x01", msgmode=GET, msgver=3, timestamp=15490, gyox=1.5
+        )
+        msg2 = cls(b"\x10", b"\x01", msgmode=GET, payload=msg1.payload)
+        msg3 = cls(b"\x10", b"\x01", msgmode=GET, payload=msg1.payload, lazy=True)
+        self.assertEqual(msg2.gyox, 1.5)
+        self.assertEqual(str(msg1), str(msg2))
+        self.assertEqual(str(msg1), str(msg3))
+        self.assertEqual(msg1.serialize(), msg2.serialize())
+        self.assertEqual(msg2.__dict__, {})  # no per-instance attribute dict
+        with self.assertRaisesRegex(
+            qge.QGCMessageError,
+            "Object is immutable. Updates to gyox not permitted after initialisation.",
+        ):
+            msg2.gyox = 0.0
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']